@@ -1,52 +1,381 @@
 """ MLB Team Status """
 import logging
 from datetime import timedelta
-from datetime import datetime
-import arrow
+from functools import partial
+import os
 import time
 
-import aiohttp
 from async_timeout import timeout
+import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.components import persistent_notification
 from homeassistant.const import CONF_NAME
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_registry import (
     async_entries_for_config_entry,
     async_get,
 )
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util, slugify
 
 from .const import (
-    API_SCOREBOARD_ENDPOINT,
-    API_TEAM_ENDPOINT,
+    ARCHIVE_ATTRIBUTE_GROUPS,
+    ATTR_GROUP_BROADCASTS,
+    ATTR_GROUP_DECISIONS,
+    ATTR_GROUP_DETAILS,
+    ATTR_GROUP_LINESCORES,
+    ATTR_GROUP_ODDS,
+    ATTR_GROUP_PROBABLES,
+    ATTR_GROUP_SITUATION,
+    ATTR_GROUP_TEAMS,
+    ATTR_GROUP_VENUE,
+    ATTR_GROUP_WEATHER,
+    ATTRIBUTE_GROUPS,
+    BACKFILL_CHECKPOINT_FILENAME,
+    BACKFILL_CONCURRENCY,
+    BACKFILL_RETRIES,
+    CONF_ARCHIVE,
+    CONF_ATTRIBUTE_GROUPS,
+    CONF_FAST_REFRESH_INTERVAL,
+    CONF_MQTT_TOPIC,
+    CONF_RECORD_PAYLOADS,
+    CONF_PLAY_BY_PLAY,
+    CONF_SLOW_REFRESH_INTERVAL,
     CONF_TIMEOUT,
     CONF_TEAM_ID,
     COORDINATOR,
     DEFAULT_TIMEOUT,
+    DELTAS,
     DOMAIN,
+    ENGINE_CACHE_TTL,
+    EVENT_ATTRIBUTE_GROUPS,
+    EVENT_GAME_FINAL,
+    EVENT_INNING_CHANGE,
+    EVENT_PITCHING_CHANGE,
+    EVENT_PLAY,
+    FAST_REFRESH_INTERVAL,
     ISSUE_URL,
+    LEAGUE,
+    LEAGUE_SCOREBOARD_DAYS,
+    LEAGUE_TEAM_ID,
     PLATFORMS,
-    USER_AGENT,
+    PUBLISHER,
+    RECORDER,
+    PREGAME_WINDOW,
+    PROFILE_MODES,
+    PROFILE_POLLS,
+    SCOREBOARD_LOOKBACK,
+    SERVICE_BACKFILL,
+    SERVICE_GET_BOXSCORE,
+    SERVICE_GET_TIMELINE,
+    SERVICE_PROFILE,
+    SERVICE_QUERY_GAMES,
+    SLOW_REFRESH_INTERVAL,
+    SPORT,
     VERSION,
+    WIN_PCT_INTERVAL,
 )
 
+from .boxscore import BoxscoreCache
+from .engine import League, async_get_engine, poll_interval
+from .events import GameEventTracker
+from .fieldcache import GroupCache
+from .logos import async_get_logo_cache
+from .metrics import FetchMetrics
+from .plays import PlayFeed
+from .schedule import TeamCache
+from .scoreboard import ScoreboardWindow, pick_team_event
+from .timeline import LIVE_STATES, TimelineStore, empty_series, home_win_pct
+from .util import datetime_from_utc_to_local, now_w3c, seconds_until
+from .views import MLBGamesView
+from .websocket_api import async_register_websocket_commands
+
 _LOGGER = logging.getLogger(__name__)
 
-today = datetime.today().strftime('%Y-%m-%d')
+# Options that change which entities an entry has, or their unique ids
+RELOAD_OPTIONS = (CONF_NAME, CONF_ARCHIVE, CONF_MQTT_TOPIC, CONF_RECORD_PAYLOADS)
+
+# Transitions after which the boxscore is worth re-reading
+BOXSCORE_TRIGGERS = {EVENT_INNING_CHANGE, EVENT_PITCHING_CHANGE, EVENT_GAME_FINAL}
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+GET_BOXSCORE_SCHEMA = vol.Schema({vol.Required(CONF_TEAM_ID): cv.string})
+
+GET_TIMELINE_SCHEMA = vol.Schema({vol.Required(CONF_TEAM_ID): cv.string})
+
+QUERY_GAMES_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TEAM_ID): cv.string,
+        vol.Optional("opponent"): cv.string,
+        vol.Optional("location"): vol.In(["home", "away"]),
+        vol.Optional("start_date"): cv.date,
+        vol.Optional("end_date"): cv.date,
+        vol.Optional("limit", default=10): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
+BACKFILL_SCHEMA = vol.Schema(
+    {
+        vol.Required("start_date"): cv.date,
+        vol.Required("end_date"): cv.date,
+        vol.Optional("concurrency", default=BACKFILL_CONCURRENCY): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+        vol.Optional("retries", default=BACKFILL_RETRIES): vol.All(vol.Coerce(int), vol.Range(min=0, max=10)),
+        vol.Optional("resume", default=True): cv.boolean,
+        vol.Optional("fixtures"): cv.string,
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_TEAM_ID): cv.string,
+        vol.Optional("mode", default=PROFILE_MODES[0]): vol.In(PROFILE_MODES),
+        vol.Optional("polls", default=PROFILE_POLLS): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    }
+)
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Register the integration's services."""
+    hass.data.setdefault(DOMAIN, {})
+
+    async def async_get_boxscore(call: ServiceCall) -> ServiceResponse:
+        """Return the cached boxscore for a tracked team's current game."""
+        team_id = call.data[CONF_TEAM_ID].upper()
+        for coordinator in _coordinators(hass):
+            if coordinator.config[CONF_TEAM_ID] != team_id or coordinator.data is None:
+                continue
+            event_id = coordinator.data.get("event_id")
+            return {
+                "event_id": event_id,
+                "event_short_name": coordinator.data.get("event_short_name"),
+                "teams": coordinator.boxscores.get(event_id) or {},
+            }
+        raise HomeAssistantError(f"{team_id} is not tracked by the {DOMAIN} integration")
+
+    async def async_get_timeline(call: ServiceCall) -> ServiceResponse:
+        """Return the score, count and win probability samples of a team's current or last game."""
+        team_id = call.data[CONF_TEAM_ID].upper()
+        # A team's own entry first, then any league entry with the team on its slate
+        coordinators = sorted(_coordinators(hass), key=lambda c: c.config[CONF_TEAM_ID] != team_id)
+        for coordinator in coordinators:
+            if coordinator.data is None:
+                continue
+            if coordinator.config[CONF_TEAM_ID] == team_id:
+                games = [coordinator.data]
+            elif "games" in coordinator.data:
+                games = [
+                    game for game in coordinator.data["games"].values()
+                    if team_id in (game.get("home_team_abbr"), game.get("away_team_abbr"))
+                ]
+            else:
+                continue
+            for game in games:
+                timeline = coordinator.timelines.get(game.get("event_id"))
+                return {
+                    "event_id": game.get("event_id"),
+                    "event_short_name": game.get("event_short_name"),
+                    "state": game.get("state"),
+                    **(timeline.as_dict() if timeline is not None else empty_series()),
+                }
+        raise HomeAssistantError(f"{team_id} is not tracked by the {DOMAIN} integration")
+
+    async def async_query_games(call: ServiceCall) -> ServiceResponse:
+        """Answer questions about past games from the local archive."""
+        team_id = call.data[CONF_TEAM_ID].upper()
+        opponent = call.data.get("opponent")
+        start_date = call.data.get("start_date")
+        end_date = call.data.get("end_date")
+        archive = _archive(hass)
+        games = await hass.async_add_executor_job(
+            partial(
+                archive.query,
+                team_id,
+                opponent=opponent.upper() if opponent else None,
+                location=call.data.get("location"),
+                start_date=start_date.isoformat() if start_date else None,
+                end_date=end_date.isoformat() if end_date else None,
+                limit=call.data["limit"],
+            )
+        )
+        return {
+            "team_id": team_id,
+            "games": games,
+            "wins": sum(1 for game in games if game["result"] == "win"),
+            "losses": sum(1 for game in games if game["result"] == "loss"),
+            "runs_for": sum(game["runs_for"] or 0 for game in games),
+            "runs_against": sum(game["runs_against"] or 0 for game in games),
+        }
+
+    async def async_backfill(call: ServiceCall) -> ServiceResponse:
+        """Archive the final games of a date range from dated scoreboard pages."""
+        # Imported here as the backfill reuses this module's extraction code
+        from .backfill import async_backfill as async_run_backfill
+
+        start_date = call.data["start_date"]
+        end_date = call.data["end_date"]
+        if end_date < start_date:
+            raise HomeAssistantError("end_date must not be before start_date")
+        fixtures = call.data.get("fixtures")
+        if fixtures is not None:
+            fixtures = hass.config.path(fixtures)
+            if not hass.config.is_allowed_path(fixtures):
+                raise HomeAssistantError(f"{fixtures} is not an allowed path")
+
+        checkpoint = hass.config.path(BACKFILL_CHECKPOINT_FILENAME)
+        if not call.data["resume"]:
+            await hass.async_add_executor_job(_remove_file, checkpoint)
+        return await async_run_backfill(
+            _archive(hass),
+            start_date,
+            end_date,
+            concurrency=call.data["concurrency"],
+            retries=call.data["retries"],
+            checkpoint=checkpoint,
+            fixtures=fixtures,
+            session=async_get_engine(hass).session,
+        )
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Profile the next few polls of one or every entry."""
+        coordinators = _coordinators(hass)
+        if CONF_TEAM_ID in call.data:
+            team_id = call.data[CONF_TEAM_ID].upper()
+            coordinators = [c for c in coordinators if c.config[CONF_TEAM_ID].upper() == team_id]
+            if not coordinators:
+                raise HomeAssistantError(f"{team_id} is not tracked by the {DOMAIN} integration")
+        if not coordinators:
+            raise HomeAssistantError(f"No {DOMAIN} entries are loaded")
+        # cProfile and tracemalloc are both process wide, so captures can't overlap
+        if len(coordinators) > 1:
+            raise ServiceValidationError(
+                f"{len(coordinators)} entries are loaded and only one can be profiled at a time; set team_id"
+            )
+        running = next(
+            (c for c in _coordinators(hass) if c.profiler is not None and c.profiler.active), None
+        )
+        if running is not None:
+            raise ServiceValidationError(
+                f"A profile of {running.name} is already running; try again once it is saved"
+            )
+
+        coordinator = coordinators[0]
+        if coordinator.profiler is None:
+            # Imported here as most installs never profile
+            from .profiling import PollProfiler
+
+            coordinator.profiler = PollProfiler()
+        coordinator.profiler.start(call.data["mode"], call.data["polls"])
+        await coordinator.async_request_refresh()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_BOXSCORE,
+        async_get_boxscore,
+        schema=GET_BOXSCORE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TIMELINE,
+        async_get_timeline,
+        schema=GET_TIMELINE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_GAMES,
+        async_query_games,
+        schema=QUERY_GAMES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKFILL,
+        async_backfill,
+        schema=BACKFILL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+    )
+    async_register_websocket_commands(hass)
+    hass.http.register_view(MLBGamesView())
+    return True
+
+
+def _remove_file(path: str) -> None:
+    """Remove a file if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def entry_config(entry: ConfigEntry) -> dict:
+    """Return an entry's configuration, with any saved options over its original data."""
+    return {**entry.data, **entry.options}
 
-def datetime_from_utc_to_local(utc_datetime):
-    now_timestamp = time.time()
-    offset = datetime.fromtimestamp(now_timestamp) - datetime.utcfromtimestamp(now_timestamp)
-    _LOGGER.info(offset)
-    return utc_datetime + offset
 
-_LOGGER.info(
-        "Debugging todays date and time: %s",
-        datetime.now(),
+def cache_age(config) -> float:
+    """Return how old a shared response may be for an entry, well inside its fastest polling interval."""
+    return min(ENGINE_CACHE_TTL, (config.get(CONF_FAST_REFRESH_INTERVAL) or FAST_REFRESH_INTERVAL) / 2)
+
+
+def is_league_mode(config) -> bool:
+    """Return True if the entry follows every game instead of one team."""
+    return str(config.get(CONF_TEAM_ID, "")).upper() == LEAGUE_TEAM_ID
+
+
+def shown_attribute_groups(config) -> frozenset:
+    """Return the attribute groups an entry's sensors show, all of them by default."""
+    selected = config.get(CONF_ATTRIBUTE_GROUPS)
+    return frozenset(ATTRIBUTE_GROUPS if selected is None else selected)
+
+
+def attribute_groups(config) -> frozenset:
+    """Return the attribute groups to extract for an entry.
+
+    That is the groups its sensors show, plus the ones game events and the
+    archive are built from.
+    """
+    groups = set(shown_attribute_groups(config))
+    groups.update(EVENT_ATTRIBUTE_GROUPS)
+    if config.get(CONF_ARCHIVE):
+        groups.update(ARCHIVE_ATTRIBUTE_GROUPS)
+    return frozenset(groups)
+
+
+def hidden_attributes(config) -> frozenset:
+    """Return the attributes that are extracted for an entry but not shown on its sensors."""
+    shown = shown_attribute_groups(config)
+    return frozenset(
+        key for group in attribute_groups(config) - shown for key in ATTRIBUTE_GROUPS[group]
     )
 
 
+def _archive(hass: HomeAssistant):
+    """Return the shared results archive, importing it on first use as archiving is opt-in."""
+    from .archive import async_get_archive
+
+    return async_get_archive(hass)
+
+
+def _coordinators(hass: HomeAssistant) -> list:
+    """Return the coordinators of every loaded entry."""
+    return [
+        entry_data[COORDINATOR]
+        for entry_data in hass.data.get(DOMAIN, {}).values()
+        if isinstance(entry_data, dict) and COORDINATOR in entry_data
+    ]
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Load the saved entities."""
     # Print startup message
@@ -65,38 +394,83 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             ent_reg.async_update_entity(entity.entity_id, new_unique_id=entry.entry_id)
 
     # Setup the data coordinator
-    coordinator = AlertsDataUpdateCoordinator(
+    config = entry_config(entry)
+    coordinator_class = LeagueDataUpdateCoordinator if is_league_mode(config) else AlertsDataUpdateCoordinator
+    coordinator = coordinator_class(
         hass,
-        entry.data,
-        entry.data.get(CONF_TIMEOUT)
+        config,
+        config.get(CONF_TIMEOUT)
     )
 
+    if config.get(CONF_RECORD_PAYLOADS):
+        # Imported here as recording is opt-in
+        from .recorder import async_get_recorder
+
+        async_get_recorder(hass, MLB.base_url).async_attach(coordinator.engine, entry.entry_id)
+
     # Fetch initial data so we have data when entities subscribe
     await coordinator.async_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = {
         COORDINATOR: coordinator,
     }
-    
+    entry.async_on_unload(entry.add_update_listener(update_listener))
+
+    if config.get(CONF_MQTT_TOPIC):
+        from .publisher import MqttPublisher
+
+        publisher = MqttPublisher(hass, coordinator, config[CONF_MQTT_TOPIC])
+        hass.data[DOMAIN][entry.entry_id][PUBLISHER] = publisher
+        # MQTT may still be connecting, so don't hold up the entry for it
+        entry.async_create_background_task(hass, publisher.async_start(), f"{DOMAIN} MQTT publisher")
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
 async def async_unload_entry(hass, config_entry):
-    """Handle removal of an entry."""
+    """Handle removal of an entry, stopping its coordinator."""
     try:
-        await hass.config_entries.async_forward_entry_unload(config_entry, "sensor")
-        _LOGGER.info("Successfully removed sensor from the " + DOMAIN + " integration")
+        unload_ok = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
     except ValueError:
-        pass
-    return True
+        # A platform that never finished loading has nothing to unload
+        unload_ok = True
+    if unload_ok:
+        entry_data = hass.data[DOMAIN].pop(config_entry.entry_id, None)
+        if entry_data is not None:
+            if DELTAS in entry_data:
+                entry_data[DELTAS].async_close()
+            if PUBLISHER in entry_data:
+                await entry_data[PUBLISHER].async_stop()
+            recorder = hass.data[DOMAIN].get(RECORDER)
+            if recorder is not None:
+                recorder.async_detach(entry_data[COORDINATOR].engine, config_entry.entry_id)
+            await entry_data[COORDINATOR].async_shutdown()
+        _LOGGER.info("Successfully removed sensor from the " + DOMAIN + " integration")
+    return unload_ok
 
 
 async def update_listener(hass, entry):
-    """Update listener."""
-    entry.data = entry.options
-    await hass.config_entries.async_forward_entry_unload(entry, "sensor")
-    hass.async_add_job(hass.config_entries.async_forward_entry_setup(entry, "sensor"))
+    """Apply changed options to the running coordinator.
+
+    Only a change of name, archiving, MQTT topic, recording or league mode
+    reloads the entry, since those change which entities exist, their unique
+    ids or where the entry publishes. Everything else is applied in place and
+    takes effect on an immediate refresh.
+    """
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    config = entry_config(entry)
+    if config == coordinator.config:
+        return
+    if is_league_mode(config) != is_league_mode(coordinator.config) or any(
+        config.get(key) != coordinator.config.get(key) for key in RELOAD_OPTIONS
+    ):
+        _LOGGER.debug("Reloading %s to apply its new options", entry.title)
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    coordinator.async_update_config(config)
+    await coordinator.async_request_refresh()
+
 
 async def async_migrate_entry(hass, config_entry):
      """Migrate an old config entry."""
@@ -123,701 +497,466 @@ class AlertsDataUpdateCoordinator(DataUpdateCoordinator):
 
     def __init__(self, hass, config, the_timeout: int):
         """Initialize."""
-        self.interval = timedelta(minutes=20)
+        self.config = config
+        self.interval = self.slow_interval
         self.name = config[CONF_NAME]
         self.timeout = the_timeout
-        self.config = config
         self.hass = hass
+        self._events = GameEventTracker(config[CONF_TEAM_ID])
+        self._plays = PlayFeed() if config.get(CONF_PLAY_BY_PLAY) else None
+        self.boxscores = BoxscoreCache()
+        self.timelines = TimelineStore()
+        self._summary_read = None
+        self.metrics = FetchMetrics()
+        # Created by the profile service, so the profilers are only imported when used
+        self.profiler = None
+        self.engine = async_get_engine(hass)
+        self.team_cache = TeamCache(config[CONF_TEAM_ID], MLB, self.metrics)
+        self.group_cache = GroupCache()
+        self.scoreboard = ScoreboardWindow(MLB)
+        self.logos = async_get_logo_cache(hass)
+        self._archived = set()
 
         _LOGGER.debug("Data will be updated every %s", self.interval)
 
         super().__init__(hass, _LOGGER, name=self.name, update_interval=self.interval)
 
+    @property
+    def fast_interval(self) -> timedelta:
+        """Return the refresh interval while a game is live."""
+        return timedelta(seconds=self.config.get(CONF_FAST_REFRESH_INTERVAL) or FAST_REFRESH_INTERVAL)
+
+    @property
+    def slow_interval(self) -> timedelta:
+        """Return the refresh interval while no game is live."""
+        return timedelta(seconds=self.config.get(CONF_SLOW_REFRESH_INTERVAL) or SLOW_REFRESH_INTERVAL)
+
+    @callback
+    def async_update_config(self, config) -> None:
+        """Apply new options without replacing the coordinator or its listeners."""
+        team_changed = config[CONF_TEAM_ID] != self.config[CONF_TEAM_ID]
+        self.config = config
+        self.timeout = config.get(CONF_TIMEOUT)
+        if team_changed:
+            # Everything cached per team describes the old team's games
+            self._events = GameEventTracker(config[CONF_TEAM_ID])
+            self.team_cache = TeamCache(config[CONF_TEAM_ID], MLB, self.metrics)
+            self.boxscores = BoxscoreCache()
+            self.timelines = TimelineStore()
+            self._plays = None
+        # The cache stores whole tiers, so it can't serve a different set of groups
+        self.group_cache.clear()
+        if bool(config.get(CONF_PLAY_BY_PLAY)) != (self._plays is not None):
+            self._plays = PlayFeed() if config.get(CONF_PLAY_BY_PLAY) else None
+        _LOGGER.debug("Applied new options to %s", self.name)
+
+    async def async_shutdown(self) -> None:
+        """Stop polling and drop any profile in progress."""
+        if self.profiler is not None:
+            self.profiler.cancel()
+        await super().async_shutdown()
+
     async def _async_update_data(self):
         """Fetch data"""
+        started = time.perf_counter()
         async with timeout(self.timeout):
             try:
-                data = await update_game(self.config)
-                # update the interval based on flag
-                if data["private_fast_refresh"] == True:
-                    self.update_interval = timedelta(seconds=5)
-                else:
-                    self.update_interval = timedelta(minutes=20)
+                data = await update_game(
+                    self.config, self.engine, self.team_cache, self.metrics, self.group_cache, self.scoreboard
+                )
+                self.update_interval = poll_interval([data], self.fast_interval, self.slow_interval, PREGAME_WINDOW)
             except Exception as error:
+                self.metrics.record_error(error)
                 raise UpdateFailed(error) from error
+
+            with self.metrics.span("diff"):
+                transitions = self._events.update(data)
+            transition_types = {event_type for event_type, _ in transitions}
+
+            summary = None
+            event_id = data.get("event_id")
+            if self._needs_summary(data, transition_types):
+                summary = await self._async_fetch_summary(event_id)
+                self._summary_read = time.monotonic()
+
+            with self.metrics.span("diff"):
+                self.timelines.update([data], {event_id: home_win_pct(summary)})
+            if self._plays is not None:
+                self._async_update_plays(data, summary)
+            self._async_update_boxscore(data, transition_types, summary)
+
+            await self._async_localize_logos([data])
+            await self._async_archive_finals([data])
+
+            for event_type, event_data in transitions:
+                self.hass.bus.async_fire(event_type, event_data)
+            self.metrics.record_update(time.perf_counter() - started)
             return data
-        
 
+    async def _async_refresh(self, *args, **kwargs) -> None:
+        """Refresh data, tracing the poll through to the state writes it triggers."""
+        self.metrics.begin_poll()
+        if self.profiler is not None:
+            self.profiler.poll_started()
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            self.metrics.end_poll(self.last_update_success)
+            if self.profiler is not None and self.profiler.poll_finished():
+                self.hass.async_create_task(self._async_dump_profile())
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing the state writes."""
+        with self.metrics.span("write"):
+            super().async_update_listeners()
+
+    async def _async_dump_profile(self) -> None:
+        """Write a finished profile to the config directory."""
+        path = self.hass.config.path(
+            f"mlb_profile_{slugify(self.name)}_{dt_util.now().strftime('%Y%m%d_%H%M%S')}"
+        )
+        try:
+            files = await self.hass.async_add_executor_job(self.profiler.dump, path)
+        except Exception as error:
+            _LOGGER.warning("Unable to save profile for %s: %s", self.name, error)
+            self.profiler.cancel()
+            return
+        _LOGGER.info("Saved profile for %s to %s", self.name, ", ".join(files))
+        persistent_notification.async_create(
+            self.hass,
+            f"Profile of {self.name} saved to: {', '.join(files)}",
+            title="MLB profile",
+        )
+
+    async def _async_localize_logos(self, games) -> None:
+        """Point each game's logos at the local logo cache, downloading new ones."""
+        try:
+            with self.metrics.span("logos"):
+                await self.logos.async_localize(self.hass, list(games))
+        except Exception as error:
+            _LOGGER.warning("Unable to cache logos: %s", error)
+
+    async def _async_archive_finals(self, games) -> None:
+        """Append games that just went final to the local archive."""
+        if not self.config.get(CONF_ARCHIVE):
+            return
+        finals = [
+            game for game in games
+            if game.get("state") == "STATUS_FINAL" and game.get("event_id") not in self._archived
+        ]
+        if not finals:
+            return
+        try:
+            with self.metrics.span("archive"):
+                await self.hass.async_add_executor_job(_archive(self.hass).add_games, finals)
+        except Exception as error:
+            _LOGGER.warning("Unable to archive final games: %s", error)
+            return
+        self._archived.update(game["event_id"] for game in finals)
+
+    async def _async_fetch_summary(self, event_id) -> dict | None:
+        """Fetch the game summary, logging rather than failing the update on errors."""
+        try:
+            return await async_get_summary(self.engine, event_id, self.metrics, cache_age(self.config))
+        except Exception as error:
+            _LOGGER.debug("Unable to fetch summary for %s: %s", event_id, error)
+            return None
+
+    @callback
+    def _async_update_plays(self, data, summary) -> None:
+        """Pull new plays from the game summary read while the game is live."""
+        event_id = data.get("event_id")
+        if summary is not None:
+            with self.metrics.span("diff"):
+                plays = self._plays.update(event_id, summary)
+            for play in plays:
+                self.hass.bus.async_fire(EVENT_PLAY, {
+                    "team_id": self.config[CONF_TEAM_ID],
+                    "event_id": event_id,
+                    **play,
+                })
+        if self._plays.event_id == event_id:
+            data["recent_plays"] = self._plays.recent()
+        else:
+            data["recent_plays"] = []
+
+    def _needs_summary(self, data, transition_types) -> bool:
+        """Return True if this update should read the game summary.
+
+        The play feed needs it on every live update and the boxscore when the
+        game reaches a point where it changes meaningfully. Otherwise it is
+        only read for the win probability, at most every ``WIN_PCT_INTERVAL``
+        seconds while the game is live, and one last time as it goes final.
+        """
+        if data.get("event_id") is None:
+            return False
+        if EVENT_GAME_FINAL in transition_types or self._boxscore_due(data, transition_types):
+            return True
+        if data.get("state") not in LIVE_STATES:
+            return False
+        return (
+            self._plays is not None
+            or self._summary_read is None
+            or time.monotonic() - self._summary_read >= WIN_PCT_INTERVAL
+        )
+
+    def _boxscore_due(self, data, transition_types) -> bool:
+        """Return True if the boxscore is missing or one of its triggers fired."""
+        event_id = data.get("event_id")
+        if event_id is None or data.get("state") not in ["STATUS_IN_PROGRESS", "STATUS_FINAL"]:
+            return False
+        return event_id not in self.boxscores or bool(transition_types & BOXSCORE_TRIGGERS)
+
+    @callback
+    def _async_update_boxscore(self, data, transition_types, summary) -> None:
+        """Refresh the boxscore only when the game reaches a point where it changes meaningfully."""
+        if summary is not None and self._boxscore_due(data, transition_types):
+            self.boxscores.update(data["event_id"], summary)
+
+    @property
+    def archived_games(self) -> int:
+        """Return how many final games this coordinator has archived since it started."""
+        return len(self._archived)
+
+    def runtime_metrics(self) -> dict:
+        """Return request and update metrics, with the current polling interval."""
+        return {
+            **self.metrics.as_dict(),
+            "update_interval": self.update_interval.total_seconds() if self.update_interval else None,
+        }
+
+
+class LeagueDataUpdateCoordinator(AlertsDataUpdateCoordinator):
+    """Class to manage fetching every game on the MLB scoreboard at once."""
+
+    def __init__(self, hass, config, the_timeout: int):
+        """Initialize."""
+        super().__init__(hass, config, the_timeout)
+        self.scoreboard = ScoreboardWindow(MLB, LEAGUE_SCOREBOARD_DAYS)
+        self._game_events = {}
 
-async def update_game(config) -> dict:
+    async def _async_update_data(self):
+        """Fetch data"""
+        started = time.perf_counter()
+        async with timeout(self.timeout):
+            try:
+                data = await async_get_league_state(
+                    self.config, self.engine, self.metrics, self.group_cache, self.scoreboard
+                )
+                self.update_interval = poll_interval(
+                    data["games"].values(), self.fast_interval, self.slow_interval, PREGAME_WINDOW
+                )
+            except Exception as error:
+                self.metrics.record_error(error)
+                raise UpdateFailed(error) from error
+
+            # Track transitions per game, forgetting games that left the slate
+            self._game_events = {
+                event_id: self._game_events.get(event_id) or GameEventTracker(LEAGUE_TEAM_ID)
+                for event_id in data["games"]
+            }
+            with self.metrics.span("diff"):
+                transitions = [
+                    transition
+                    for event_id, game in data["games"].items()
+                    for transition in self._game_events[event_id].update(game)
+                ]
+                self.timelines.update(data["games"].values())
+            await self._async_localize_logos(data["games"].values())
+            await self._async_archive_finals(data["games"].values())
+
+            for event_type, event_data in transitions:
+                self.hass.bus.async_fire(event_type, event_data)
+            self.metrics.record_update(time.perf_counter() - started)
+            return data
+
+
+async def update_game(config, engine, team_cache=None, metrics=None, group_cache=None, scoreboard=None) -> dict:
     """Fetch new state data for the sensor.
     This is the only method that should fetch new data for Home Assistant.
     """
 
-    data = await async_get_state(config)
+    data = await async_get_state(config, engine, team_cache, metrics, group_cache, scoreboard)
     return data
 
-async def async_get_state(config) -> dict:
+async def async_get_summary(engine, event_id, metrics=None, max_age=ENGINE_CACHE_TTL) -> dict:
+    """Query the game summary (boxscore and plays) for one event."""
+
+    summary_url = MLB.summary_url(event_id)
+    _LOGGER.debug("Getting summary for %s from %s" % (event_id, summary_url))
+    return await engine.async_get_json(summary_url, metrics, max_age)
+
+async def async_get_league_state(config, engine, metrics=None, group_cache=None, scoreboard=None) -> dict:
+    """Query today's scoreboard and parse every game on it, plus games still going from yesterday."""
+
+    if scoreboard is None:
+        scoreboard = ScoreboardWindow(MLB, LEAGUE_SCOREBOARD_DAYS)
+    _LOGGER.debug("Getting league state for %s" % (", ".join(scoreboard.dates())))
+    await scoreboard.async_update(engine, metrics, cache_age(config))
+
+    extract_started = time.perf_counter()
+    groups = attribute_groups(config)
+    games = {}
+    for event in scoreboard.slate():
+        # Games are reported from the home team's point of view
+        home_team_id = event["competitions"][0]["competitors"][0]["team"]["abbreviation"]
+        values = _extract_cached(MLB, event, home_team_id, groups, group_cache, metrics)
+        MLB.refresh_rate(values, home_team_id)
+        games[values["event_id"]] = values
+    if group_cache is not None:
+        group_cache.retain(games)
+    if metrics is not None:
+        metrics.record_extract(time.perf_counter() - extract_started)
+
+    return {
+        "games": games,
+        "last_update": now_w3c(),
+        "private_fast_refresh": any(game["private_fast_refresh"] for game in games.values()),
+    }
+
+async def async_get_state(config, engine, team_cache=None, metrics=None, group_cache=None, scoreboard=None) -> dict:
     """Query API for status."""
 
     values = {}
-    headers = {"User-Agent": USER_AGENT, "Accept": "application/ld+json"}
     data = None
-    gameday_url = API_SCOREBOARD_ENDPOINT
     team_id = config[CONF_TEAM_ID]
-    async with aiohttp.ClientSession() as session:
-        async with session.get(gameday_url, headers=headers) as r:
-            _LOGGER.debug("Getting state for %s from %s" % (team_id, gameday_url))
-            if r.status == 200:
-                data = await r.json()
+    groups = attribute_groups(config)
+    if team_cache is None:
+        team_cache = TeamCache(team_id, MLB, metrics)
+    if scoreboard is None:
+        scoreboard = ScoreboardWindow(MLB)
+    try:
+        index = await team_cache.async_get_index(engine)
+    except Exception as error:
+        _LOGGER.debug("Unable to get schedule for %s: %s" % (team_id, error))
+        index = None
+
+    # With no game around right now the scoreboard can't have anything
+    # for us, so the state is built from the cached schedule instead.
+    index_started = time.perf_counter()
+    game_near = index is None or not len(index) or index.game_near(time.time(), SCOREBOARD_LOOKBACK, PREGAME_WINDOW)
+    if metrics is not None:
+        metrics.add_span("index", time.perf_counter() - index_started)
+    if not game_near:
+        # The schedule is only downloaded once a day, so also check the team's own
+        # next event for games added since: makeups, doubleheaders and postseason games
+        try:
+            listed = _listed_next_event(await team_cache.async_get_team(engine, team_id))
+        except Exception as error:
+            _LOGGER.debug("Unable to get team details for %s: %s" % (team_id, error))
+            listed = None
+        start = seconds_until(listed.get("date")) if listed is not None else None
+        game_near = start is not None and -SCOREBOARD_LOOKBACK <= start < PREGAME_WINDOW
+    if not game_near:
+        _LOGGER.debug("No game near for %s; skipping the scoreboard." % (team_id))
+        data = {"events": []}
+        if metrics is not None:
+            metrics.record_cache(True)
+    else:
+        _LOGGER.debug("Getting state for %s for %s" % (team_id, ", ".join(scoreboard.dates())))
+        await scoreboard.async_update(engine, metrics, cache_age(config))
+        data = {"events": scoreboard.events()}
+        if metrics is not None:
+            metrics.record_cache(False)
 
     found_team = False
     if data is not None:
-        for event in data["events"]:
-            #_LOGGER.debug("Looking at this event: %s" % event)
-            if team_id in event["shortName"]:
-                _LOGGER.debug("Found team event for %s; parsing data." % (team_id))
-                found_team = True
-                # Determine whether our team is Competitor 0 or 1
-                team_index = 0 if event["competitions"][0]["competitors"][0]["team"]["abbreviation"] == team_id else 1
-                team_home_away = event["competitions"][0]["competitors"][team_index]["homeAway"]
-                oppo_index = abs((team_index-1))
-                
-                try:
-                    values["state"] = event["status"]["type"]["name"]
-                except:
-                    values["state"] = None
-                
-                try:
-                    values["date"] = event["date"]
-                except:
-                    values["date"] = None
-                
-                try:
-                    values["attendance"] = event["competitions"][0]["attendance"]
-                except:
-                    values["attendance"] = None
-                
-                # Formatted as full team names like "New York Mets at Washington Nationals"
-                try:
-                    values["event_name"] = event["name"]
-                except:
-                    values["event_name"] = None
-                
-                # Formatted as abbreviations like "NYM @ WSH"
-                try:
-                    values["event_short_name"] = event["shortName"]
-                except:
-                    values["event_short_name"] = None
-
-                 # Formatted as "STD", "RD16", "QTR"
-                try:
-                    values["event_type"] = event["competitions"][0]["type"]["abbreviation"]
-                except:
-                    values["event_type"] = None
-                
-                # Formatted as "East 1st Round - Game 7", "East 2nd Round - Game 1"
-                try:
-                    values["game_notes"] = event["competitions"][0]["notes"][0]["headline"]
-                except:
-                    values["game_notes"] = None
-                
-                # Formatted as "Series Tied 3-3"
-                try:
-                    values["series_summary"] = event["competitions"][0]["series"]["summary"]
-                except:
-                    values["series_summary"] = None   
-            
-                try:
-                    values["venue_name"] = event["competitions"][0]["venue"]["fullName"]
-                except:
-                    values["venue_name"] = None
-                
-                try:
-                    values["venue_city"] = event["competitions"][0]["venue"]["address"]["city"]
-                except:
-                    values["venue_city"] = None
-                
-                try:
-                    values["venue_state"] = event["competitions"][0]["venue"]["address"]["state"]
-                except:
-                    values["venue_state"] = None
-                
-                try:
-                    values["venue_capacity"] = event["competitions"][0]["venue"]["capacity"]
-                except:
-                    values["venue_capacity"] = None
-                
-                # Formatted as true/false
-                try:
-                    values["venue_indoor"] = event["competitions"][0]["venue"]["indoor"]
-                except:
-                    values["venue_indoor"] = None
-                
-                # Formatted as an integer like "3"
-                try:
-                    values["inning"] = event["competitions"][0]["status"]["period"]
-                except:
-                    values["inning"] = None
-                
-                # Formatted like "Top 3rd"
-                try:
-                    values["inning_description"] = event["competitions"][0]["status"]["type"]["shortDetail"]
-                except:
-                    values["inning_description"] = None
-                
-                # Formatted like "Mostly clear"
-                try:
-                    values["weather_conditions"] = event["weather"]["displayValue"]
-                except:
-                    values["weather_conditions"] = None
-
-                # Integer like "68"
-                try:
-                    values["weather_temp"] = event["weather"]["temperature"]
-                except:
-                    values["weather_temp"] = None
-
-                if values["state"] in ['STATUS_FINAL']:
-                    try:
-                        featuredAthlete_0_Type = event["competitions"][0]["status"]["featuredAthletes"][0]["name"]
-                    except:
-                        featuredAthlete_0_Type = None
-
-                    try:
-                        featuredAthlete_1_Type = event["competitions"][0]["status"]["featuredAthletes"][1]["name"]
-                    except:
-                        featuredAthlete_1_Type = None
-
-                    try:
-                        featuredAthlete_2_Type = event["competitions"][0]["status"]["featuredAthletes"][2]["name"]
-
-                    except:
-                        featuredAthlete_2_Type = None
-
-                    wp_index = -1
-                    lp_index = -1
-                    sp_index = -1
-
-                    if featuredAthlete_0_Type == 'winningPitcher':
-                        wp_index = 0
-                    elif featuredAthlete_0_Type == 'losingPitcher':
-                        lp_index = 0
-                    elif featuredAthlete_0_Type == 'savingPitcher':
-                        sp_index = 0
-
-                    if featuredAthlete_1_Type == 'winningPitcher':
-                        wp_index = 1
-                    elif featuredAthlete_1_Type == 'losingPitcher':
-                        lp_index = 1
-                    elif featuredAthlete_1_Type == 'savingPitcher':
-                        sp_index = 1
-
-                    if featuredAthlete_2_Type == 'winningPitcher':
-                        wp_index = 2
-                    elif featuredAthlete_2_Type == 'losingPitcher':
-                        lp_index = 2
-                    elif featuredAthlete_2_Type == 'savingPitcher':
-                        sp_index = 2
-
-                    try:
-                        values["winning_pitcher"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["athlete"]["fullName"]
-                    except:
-                        values["winning_pitcher"] = None
-                    
-                    try:
-                        if event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][0]["name"] == "wins":
-                            values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][0]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][1]["name"] == "wins":
-                            values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][1]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][2]["name"] == "wins":
-                            values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][2]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][3]["name"] == "wins":
-                            values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][3]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][4]["name"] == "wins":
-                            values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][4]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][5]["name"] == "wins":
-                            values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][5]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][6]["name"] == "wins":
-                            values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][6]["displayValue"]
-                        else:
-                            values["winning_pitcher_wins"] = None
-                    except:
-                        values["winning_pitcher_wins"] = None
-                    
-                    try:
-                        if event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][0]["name"] == "losses":
-                            values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][0]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][1]["name"] == "losses":
-                            values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][1]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][2]["name"] == "losses":
-                            values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][2]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][3]["name"] == "losses":
-                            values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][3]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][4]["name"] == "losses":
-                            values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][4]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][5]["name"] == "losses":
-                            values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][5]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][6]["name"] == "losses":
-                            values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][6]["displayValue"]
-                        else:
-                            values["winning_pitcher_losses"] = None
-                    except:
-                        values["winning_pitcher_losses"] = None
-
-                    
-                    try:
-                        if event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][0]["name"] == "ERA":
-                            values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][0]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][1]["name"] == "ERA":
-                            values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][1]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][2]["name"] == "ERA":
-                            values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][2]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][3]["name"] == "ERA":
-                            values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][3]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][4]["name"] == "ERA":
-                            values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][4]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][5]["name"] == "ERA":
-                            values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][5]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][6]["name"] == "ERA":
-                            values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][6]["displayValue"]
-                        else:
-                            values["winning_pitcher_era"] = None
-                    except:
-                        values["winning_pitcher_era"] = None
-
-                    try:
-                        values["losing_pitcher"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["athlete"]["fullName"]
-                    except:
-                        values["losing_pitcher"] = None
-                        
-
-                    try:
-                        if event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][0]["name"] == "wins":
-                            values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][0]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][1]["name"] == "wins":
-                            values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][1]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][2]["name"] == "wins":
-                            values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][2]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][3]["name"] == "wins":
-                            values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][3]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][4]["name"] == "wins":
-                            values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][4]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][5]["name"] == "wins":
-                            values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][5]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][6]["name"] == "wins":
-                            values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][6]["displayValue"]
-                        else:
-                            values["losing_pitcher_wins"] = None
-                    except:
-                        values["losing_pitcher_wins"] = None
-                    
-                    try:
-                        if event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][0]["name"] == "losses":
-                            values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][0]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][1]["name"] == "losses":
-                            values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][1]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][2]["name"] == "losses":
-                            values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][2]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][3]["name"] == "losses":
-                            values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][3]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][4]["name"] == "losses":
-                            values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][4]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][5]["name"] == "losses":
-                            values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][5]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][6]["name"] == "losses":
-                            values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][6]["displayValue"]
-                        else:
-                            values["losing_pitcher_losses"] = None
-                    except:
-                        values["losing_pitcher_losses"] = None
-
-                    
-                    try:
-                        if event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][0]["name"] == "ERA":
-                            values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][0]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][1]["name"] == "ERA":
-                            values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][1]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][2]["name"] == "ERA":
-                            values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][2]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][3]["name"] == "ERA":
-                            values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][3]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][4]["name"] == "ERA":
-                            values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][4]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][5]["name"] == "ERA":
-                            values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][5]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][6]["name"] == "ERA":
-                            values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][6]["displayValue"]
-                        else:
-                            values["losing_pitcher_era"] = None
-                    except:
-                        values["losing_pitcher_era"] = None
-
-                    try:
-                        values["saving_pitcher"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["athlete"]["fullName"]
-                    except:
-                        values["saving_pitcher"] = None
-                        
-
-                    try:
-                        if event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][0]["name"] == "saves":
-                            values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][0]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][1]["name"] == "saves":
-                            values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][1]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][2]["name"] == "saves":
-                            values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][2]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][3]["name"] == "saves":
-                            values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][3]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][4]["name"] == "saves":
-                            values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][4]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][5]["name"] == "saves":
-                            values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][5]["displayValue"]
-                        elif event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][6]["name"] == "saves":
-                            values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][6]["displayValue"]
-                        else:
-                            values["saving_pitcher_saves"] = None
-                    except:
-                        values["saving_pitcher_saves"] = None
-                    
-
-                else:
-                    values["winning_pitcher"] = None
-                    values["winning_pitcher_wins"] = None
-                    values["winning_pitcher_losses"] = None
-                    values["winning_pitcher_era"] = None
-                    values["losing_pitcher"] = None
-                    values["losing_pitcher_wins"] = None
-                    values["losing_pitcher_losses"] = None
-                    values["losing_pitcher_era"] = None
-                    values["saving_pitcher"] = None
-                    values["saving_pitcher_saves"] = None
-
-
-                try:
-                    values["game_status"] = event["status"]["type"]["shortDetail"]
-                except:
-                    values["game_status"] = None
-                
-                values["home_team_abbr"] = event["competitions"][0]["competitors"][0]["team"]["abbreviation"]
-                values["home_team_id"] = event["competitions"][0]["competitors"][0]["team"]["id"]
-                values["home_team_city"] = event["competitions"][0]["competitors"][0]["team"]["location"]
-                values["home_team_name"] = event["competitions"][0]["competitors"][0]["team"]["name"]
-                values["home_team_color"] = event["competitions"][0]["competitors"][0]["team"]["color"]
-                values["home_team_alt_color"] = event["competitions"][0]["competitors"][0]["team"]["alternateColor"]
-                values["home_team_logo"] = event["competitions"][0]["competitors"][0]["team"]["logo"]
-                values["home_team_runs"] = event["competitions"][0]["competitors"][0]["score"]
-                values["home_team_hits"] = event["competitions"][0]["competitors"][0]["hits"]
-                values["home_team_errors"] = event["competitions"][0]["competitors"][0]["errors"]
-
-                try:
-                    values["home_team_colors"] = [''.join(('#',event["competitions"][0]["competitors"][0]["team"]["color"])), 
-                        ''.join(('#',event["competitions"][0]["competitors"][0]["team"]["alternateColor"]))]
-                except:
-                    values["home_team_colors"] = ['#013369','#013369']
-                
-                try:
-                    values["home_team_ls_1"] = event["competitions"][0]["competitors"][0]["linescores"][0]["value"]
-                except:
-                    values["home_team_ls_1"] = None
-
-                try:
-                    values["home_team_ls_2"] = event["competitions"][0]["competitors"][0]["linescores"][1]["value"]
-                except:
-                    values["home_team_ls_2"] = None
-
-                try:
-                    values["home_team_ls_3"] = event["competitions"][0]["competitors"][0]["linescores"][2]["value"]
-                except:
-                    values["home_team_ls_3"] = None
-
-                try:
-                    values["home_team_ls_4"] = event["competitions"][0]["competitors"][0]["linescores"][3]["value"]
-                except:
-                    values["home_team_ls_4"] = None
-
-                try:
-                    values["home_team_ls_5"] = event["competitions"][0]["competitors"][0]["linescores"][4]["value"]
-                except:
-                    values["home_team_ls_5"] = None
-
-                try:
-                    values["home_team_ls_6"] = event["competitions"][0]["competitors"][0]["linescores"][5]["value"]
-                except:
-                    values["home_team_ls_6"] = None
-
-                try:
-                    values["home_team_ls_7"] = event["competitions"][0]["competitors"][0]["linescores"][6]["value"]
-                except:
-                    values["home_team_ls_7"] = None
-
-                try:
-                    values["home_team_ls_8"] = event["competitions"][0]["competitors"][0]["linescores"][7]["value"]
-                except:
-                    values["home_team_ls_8"] = None
-
-                try:
-                    values["home_team_ls_9"] = event["competitions"][0]["competitors"][0]["linescores"][8]["value"]
-                except:
-                    values["home_team_ls_9"] = None
-                
-                values["home_team_record"] = event["competitions"][0]["competitors"][0]["records"][0]["summary"]
-                
-                values["away_team_abbr"] = event["competitions"][0]["competitors"][1]["team"]["abbreviation"]
-                values["away_team_id"] = event["competitions"][0]["competitors"][1]["team"]["id"]
-                values["away_team_city"] = event["competitions"][0]["competitors"][1]["team"]["location"]
-                values["away_team_name"] = event["competitions"][0]["competitors"][1]["team"]["name"]
-                values["away_team_color"] = event["competitions"][0]["competitors"][1]["team"]["color"]
-                values["away_team_alt_color"] = event["competitions"][0]["competitors"][1]["team"]["alternateColor"]
-                values["away_team_logo"] = event["competitions"][0]["competitors"][1]["team"]["logo"]
-                values["away_team_runs"] = event["competitions"][0]["competitors"][1]["score"]
-                values["away_team_hits"] = event["competitions"][0]["competitors"][1]["hits"]
-                values["away_team_errors"] = event["competitions"][0]["competitors"][1]["errors"]
-
-                try:
-                    values["away_team_colors"] = [''.join(('#',event["competitions"][0]["competitors"][1]["team"]["color"])), 
-                        ''.join(('#',event["competitions"][0]["competitors"][1]["team"]["alternateColor"]))]
-                except:
-                    values["away_team_colors"] = ['#D50A0A','#D50A0A']
-                
-                #if event["status"]["type"]["state"].lower() in ['in']:
-                try:
-                    values["away_team_ls_1"] = event["competitions"][0]["competitors"][1]["linescores"][0]["value"]
-                except:
-                    values["away_team_ls_1"] = None
-
-                try:
-                    values["away_team_ls_2"] = event["competitions"][0]["competitors"][1]["linescores"][1]["value"]
-                except:
-                    values["away_team_ls_2"] = None
-
-                try:
-                    values["away_team_ls_3"] = event["competitions"][0]["competitors"][1]["linescores"][2]["value"]
-                except:
-                    values["away_team_ls_3"] = None
-
-                try:
-                    values["away_team_ls_4"] = event["competitions"][0]["competitors"][1]["linescores"][3]["value"]
-                except:
-                    values["away_team_ls_4"] = None
-
-                try:
-                    values["away_team_ls_5"] = event["competitions"][0]["competitors"][1]["linescores"][4]["value"]
-                except:
-                    values["away_team_ls_5"] = None
-
-                try:
-                    values["away_team_ls_6"] = event["competitions"][0]["competitors"][1]["linescores"][5]["value"]
-                except:
-                    values["away_team_ls_6"] = None
-
-                try:
-                    values["away_team_ls_7"] = event["competitions"][0]["competitors"][1]["linescores"][6]["value"]
-                except:
-                    values["away_team_ls_7"] = None
-
-                try:
-                    values["away_team_ls_8"] = event["competitions"][0]["competitors"][1]["linescores"][7]["value"]
-                except:
-                    values["away_team_ls_8"] = None
-
-                try:
-                    values["away_team_ls_9"] = event["competitions"][0]["competitors"][1]["linescores"][8]["value"]
-                except:
-                    values["away_team_ls_9"] = None
-                
-                values["away_team_record"] = event["competitions"][0]["competitors"][1]["records"][0]["summary"]
-                
-                values["first_pitch_in"] = arrow.get(event["date"]).humanize()
-                
-                try:
-                    values["tv_network"] = event["competitions"][0]["broadcasts"][0]["names"]
-                except:
-                    values["tv_network"] = None
-                
-                try:
-                    values["last_play"] = event["competitions"][0]["situation"]["lastPlay"]["text"]
-                except:
-                    values["last_play"] = None
-
-                try:
-                    values["balls"] = event["competitions"][0]["situation"]["balls"]
-                except:
-                    values["balls"] = None
-
-                try:
-                    values["strikes"] = event["competitions"][0]["situation"]["strikes"]
-                except:
-                    values["strikes"] = None
-
-                try:
-                    values["outs"] = event["competitions"][0]["situation"]["outs"]
-                except:
-                    values["outs"] = None
-                
-                try:
-                    values["runner_on_1st"] = event["competitions"][0]["situation"]["onFirst"]
-                except:
-                    values["runner_on_1st"] = None
-                
-                try:
-                    values["runner_on_2nd"] = event["competitions"][0]["situation"]["onSecond"]
-                except:
-                    values["runner_on_2nd"] = None
-                
-                try:
-                    values["runner_on_3rd"] = event["competitions"][0]["situation"]["onThird"]
-                except:
-                    values["runner_on_3rd"] = None
-                
-                try:
-                    values["current_batter"] = event["competitions"][0]["situation"]["batter"]["athlete"]["fullName"]
-                except:
-                    values["current_batter"] = None
-                    
-                try:
-                    values["current_pitcher"] = event["competitions"][0]["situation"]["pitcher"]["athlete"]["fullName"]
-                except:
-                    values["current_pitcher"] = None
-                
-                # Starting Pitcher
-                try:
-                    values["home_team_starting_pitcher"] = event["competitions"][0]["competitors"][0]["probables"][0]["athlete"]["displayName"]
-                except:
-                    values["home_team_starting_pitcher"] = None
-                
-                try:
-                    values["away_team_starting_pitcher"] = event["competitions"][0]["competitors"][1]["probables"][0]["athlete"]["displayName"]
-                except:
-                    values["away_team_starting_pitcher"] = None
-                
-                try:
-                    values["odds"] = event["competitions"][0]["odds"][0]["details"]
-                except:
-                    values["odds"] = None
-                    
-                try:
-                    values["overunder"] = event["competitions"][0]["odds"][0]["overUnder"]
-                except:
-                    values["overunder"] = None
-                
-                try:
-                    values["home_team_odds_win_pct"] = event["competitions"][0]["odds"][1]["homeTeamOdds"]["winPercentage"]
-                except:
-                    values["home_team_odds_win_pct"] = None
-                
-                try:
-                    values["away_team_odds_win_pct"] = event["competitions"][0]["odds"][1]["awayTeamOdds"]["winPercentage"]
-                except:
-                    values["away_team_odds_win_pct"] = None
-                
-                try:
-                    values["headlines"] = event["competitions"][0]["headlines"][0]["shortLinkText"]
-                except:
-                    values["headlines"] = None
-
-                try:
-                    if values["state"] in ['STATUS_FINAL']:
-                        if values["home_team_abbr"] == team_id:
-                            if values["home_team_runs"] > values["away_team_runs"]:
-                                values["win_or_loss"] = "win"
-                            else:
-                                values["win_or_loss"] = "loss"
-                        else:
-                            if values["home_team_runs"] > values["away_team_runs"]:
-                                values["win_or_loss"] = "loss"
-                            else:
-                                values["win_or_loss"] = "win"
-                    else:
-                        values["win_or_loss"] = None
-                except:
-                    values["win_or_loss"] = None
-
-                if values["state"] in ['STATUS_POSTPONED']:
-                    try:
-                        values["headlines"] = event["competitions"][0]["notes"][0]["headline"]
-                    except:
-                        values["headlines"] = None
-                
-                values["last_update"] = arrow.now().format(arrow.FORMAT_W3C)
-                values["private_fast_refresh"] = False
+        extract_started = time.perf_counter()
+        # The window can hold a team's games from yesterday, today and tomorrow
+        event = pick_team_event(data["events"], team_id, time.time(), SCOREBOARD_LOOKBACK)
+        if event is not None:
+            _LOGGER.debug("Found team event for %s; parsing data." % (team_id))
+            found_team = True
+            values = _extract_cached(MLB, event, team_id, groups, group_cache, metrics)
+            if group_cache is not None:
+                group_cache.retain([values["event_id"]])
+        if metrics is not None and found_team:
+            metrics.record_extract(time.perf_counter() - extract_started)
         
         # Never found the team. Either off today or a post-season condition
         if not found_team:
-            _LOGGER.debug("Team not found on scoreboard feed.  Using team API.")
-            
-            team_url = API_TEAM_ENDPOINT + team_id
-            _LOGGER.debug(team_url)
-            async with aiohttp.ClientSession() as session:
-                async with session.get(team_url, headers=headers) as r:
-                    if r.status == 200:
-                        data = await r.json()
-            team_data = data["team"]
+            _LOGGER.debug("Team not found on scoreboard feed.  Using cached schedule.")
+
+            team_data = await team_cache.async_get_team(engine, team_id)
+
+            next_event = None
+            if team_cache.index is not None:
+                next_event = team_cache.index.next_game(time.time())
+            next_event = _sooner_event(next_event, _listed_next_event(team_data))
+            if next_event is None:
+                # Off-season, or the team is out of the postseason
+                _LOGGER.debug("No upcoming game for %s." % (team_id))
+                values = await async_clear_states(config)
+                values["state"] = "NOT_FOUND"
+                values["last_update"] = now_w3c()
+                _drop_unselected_groups(values, groups)
+                return values
 
             # Determine if our team is home or away.  hoome team is always index 0.
-            team_index = 0 if team_data["nextEvent"][0]["competitions"][0]["competitors"][0]["team"]["abbreviation"] == team_id else 1
+            team_index = 0 if next_event["competitions"][0]["competitors"][0]["team"]["abbreviation"] == team_id else 1
             oppo_index = abs((team_index - 1))
-            
+
             # Determine our opponents team id (abbreviation) so that we can lookup their information as well
-            oppo_id = team_data["nextEvent"][0]["competitions"][0]["competitors"][oppo_index]["team"]["abbreviation"]
-            oppo_url = API_TEAM_ENDPOINT + oppo_id
-            _LOGGER.debug(oppo_url)
-            async with aiohttp.ClientSession() as session:
-                async with session.get(oppo_url, headers=headers) as r:
-                    if r.status == 200:
-                        data = await r.json()
-            oppo_data = data["team"]
+            oppo_id = next_event["competitions"][0]["competitors"][oppo_index]["team"]["abbreviation"]
+            oppo_data = await team_cache.async_get_team(engine, oppo_id)
+
+            try:
+                values["event_id"] = next_event["id"]
+            except:
+                values["event_id"] = None
 
             try:
-                values["state"] = team_data["nextEvent"][0]["competitions"][0]["status"]["type"]["name"]
+                values["state"] = next_event["competitions"][0]["status"]["type"]["name"]
             except:
                 values["state"] = None
 
             try:
-                values["date"] = team_data["nextEvent"][0]["date"]
+                values["date"] = next_event["date"]
             except:
                 values["date"] = None
             
-            values["last_update"] = arrow.now().format(arrow.FORMAT_W3C)
+            values["last_update"] = now_w3c()
 
             values["attendance"] = None
 
             try:
-                values["event_name"] = team_data["nextEvent"][0]["name"]
+                values["event_name"] = next_event["name"]
             except:
                 values["event_name"] = None
 
             try:
-                values["event_short_name"] = team_data["nextEvent"][0]["shortName"]
+                values["event_short_name"] = next_event["shortName"]
             except:
                 values["event_short_name"] = None
 
             try:
-                values["event_type"] = team_data["nextEvent"][0]["competitions"][0]["type"]["abbreviation"]
+                values["event_type"] = next_event["competitions"][0]["type"]["abbreviation"]
             except:
                 values["event_type"] = None
             
             try:
-                values["game_notes"] = team_data["nextEvent"][0]["competitions"][0]["notes"]["headline"]
+                values["game_notes"] = next_event["competitions"][0]["notes"]["headline"]
             except:
                 values["game_notes"] = None
             
             try:
-                values["series_summary"] = team_data["nextEvent"][0]["competitions"][0]["series"]["summary"]
+                values["series_summary"] = next_event["competitions"][0]["series"]["summary"]
             except:
                 values["series_summary"] = None
  
             try:           
-                values["venue_name"] = team_data["nextEvent"][0]["competitions"][0]["venue"]["fullName"]
+                values["venue_name"] = next_event["competitions"][0]["venue"]["fullName"]
             except:
                 values["venue_name"] = None
 
             try:
-                values["venue_city"] = team_data["nextEvent"][0]["competitions"][0]["venue"]["address"]["city"]
+                values["venue_city"] = next_event["competitions"][0]["venue"]["address"]["city"]
             except:
                 values["venue_city"] = None
 
             try:
-                values["venue_state"] = team_data["nextEvent"][0]["competitions"][0]["venue"]["address"]["state"]
+                values["venue_state"] = next_event["competitions"][0]["venue"]["address"]["state"]
             except:
                 values["venue_state"] = None
             
@@ -861,22 +1000,22 @@ async def async_get_state(config) -> dict:
             values["game_status"] = None
 
             try:
-                values["home_team_abbr"] = team_data["nextEvent"][0]["competitions"][0]["competitors"][0]["team"]["abbreviation"]
+                values["home_team_abbr"] = next_event["competitions"][0]["competitors"][0]["team"]["abbreviation"]
             except:
                 values["home_team_abbr"] = None
 
             try:
-                values["home_team_id"] = team_data["nextEvent"][0]["competitions"][0]["competitors"][0]["team"]["id"]
+                values["home_team_id"] = next_event["competitions"][0]["competitors"][0]["team"]["id"]
             except:
                 values["home_team_id"] = None
 
             try:
-                values["home_team_city"] = team_data["nextEvent"][0]["competitions"][0]["competitors"][0]["team"]["location"]
+                values["home_team_city"] = next_event["competitions"][0]["competitors"][0]["team"]["location"]
             except:
                 values["home_team_city"] = None
 
             try:
-                values["home_team_name"] = team_data["nextEvent"][0]["competitions"][0]["competitors"][0]["team"]["shortDisplayName"]
+                values["home_team_name"] = next_event["competitions"][0]["competitors"][0]["team"]["shortDisplayName"]
             except:
                 values["home_team_name"] = None
 
@@ -902,7 +1041,7 @@ async def async_get_state(config) -> dict:
                     values["home_team_record"] = None
 
             try:            
-                values["home_team_logo"] = team_data["nextEvent"][0]["competitions"][0]["competitors"][0]["team"]["logos"][2]["href"]
+                values["home_team_logo"] = next_event["competitions"][0]["competitors"][0]["team"]["logos"][2]["href"]
             except:
                 values["home_team_logo"] = None
 
@@ -918,24 +1057,25 @@ async def async_get_state(config) -> dict:
             values["home_team_ls_7"] = None
             values["home_team_ls_8"] = None
             values["home_team_ls_9"] = None
+            values["home_team_linescores"] = None
 
             try:
-                values["away_team_abbr"] = team_data["nextEvent"][0]["competitions"][0]["competitors"][1]["team"]["abbreviation"]
+                values["away_team_abbr"] = next_event["competitions"][0]["competitors"][1]["team"]["abbreviation"]
             except:
                 values["away_team_abbr"] = None
 
             try:
-                values["away_team_id"] = team_data["nextEvent"][0]["competitions"][0]["competitors"][1]["team"]["id"]
+                values["away_team_id"] = next_event["competitions"][0]["competitors"][1]["team"]["id"]
             except:
                 values["away_team_id"] = None
 
             try:
-                values["away_team_city"] = team_data["nextEvent"][0]["competitions"][0]["competitors"][1]["team"]["location"]
+                values["away_team_city"] = next_event["competitions"][0]["competitors"][1]["team"]["location"]
             except:
                 values["away_team_city"] = None
 
             try:
-                values["away_team_name"] = team_data["nextEvent"][0]["competitions"][0]["competitors"][1]["team"]["shortDisplayName"]
+                values["away_team_name"] = next_event["competitions"][0]["competitors"][1]["team"]["shortDisplayName"]
             except:
                 values["away_team_name"] = None
 
@@ -961,7 +1101,7 @@ async def async_get_state(config) -> dict:
                     values["away_team_record"] = None
 
             try:            
-                values["away_team_logo"] = team_data["nextEvent"][0]["competitions"][0]["competitors"][1]["team"]["logos"][2]["href"]
+                values["away_team_logo"] = next_event["competitions"][0]["competitors"][1]["team"]["logos"][2]["href"]
             except:
                 values["away_team_logo"] = None
 
@@ -977,14 +1117,10 @@ async def async_get_state(config) -> dict:
             values["away_team_ls_7"] = None
             values["away_team_ls_8"] = None
             values["away_team_ls_9"] = None
-
-            try:
-                values["first_pitch_in"] = arrow.get(team_data["nextEvent"][0]["date"]).humanize()  
-            except:
-                values["first_pitch_in"] = None
+            values["away_team_linescores"] = None
 
             try:     
-                values["tv_network"] = team_data["nextEvent"][0]["competitions"][0]["broadcasts"][0]["media"]["shortName"]
+                values["tv_network"] = next_event["competitions"][0]["broadcasts"][0]["media"]["shortName"]
             except:
                 values["tv_network"] = None
 
@@ -999,12 +1135,12 @@ async def async_get_state(config) -> dict:
             values["current_pitcher"] = None
 
             try:
-                values["home_team_starting_pitcher"] = team_data["nextEvent"][0]["competitions"][0]["competitors"][0]["probables"][0]["athlete"]["displayName"]
+                values["home_team_starting_pitcher"] = next_event["competitions"][0]["competitors"][0]["probables"][0]["athlete"]["displayName"]
             except:
                 values["home_team_starting_pitcher"] = None
 
             try:
-                values["away_team_starting_pitcher"] = team_data["nextEvent"][0]["competitions"][0]["competitors"][1]["probables"][0]["athlete"]["displayName"]
+                values["away_team_starting_pitcher"] = next_event["competitions"][0]["competitors"][1]["probables"][0]["athlete"]["displayName"]
             except:
                 values["away_team_starting_pitcher"] = None
 
@@ -1014,39 +1150,715 @@ async def async_get_state(config) -> dict:
             values["away_team_odds_win_pct"] = None
  
             try:
-                values["headlines"] = team_data["nextEvent"][0]["competitions"][0]["notes"][0]["headline"]
+                values["headlines"] = next_event["competitions"][0]["notes"][0]["headline"]
             except:
                 values["headlines"] = None
 
             values["win_or_loss"] = None
 
-        if values["state"] == 'STATUS_SCHEDULED' and ((arrow.get(values["date"])-arrow.now()).total_seconds() < 1200):
-            _LOGGER.debug("Event for %s is within 20 minutes, setting refresh rate to 5 seconds." % (team_id))
-            values["private_fast_refresh"] = True
-        elif values["state"] == 'STATUS_IN_PROGRESS':
-            _LOGGER.debug("Event for %s is in progress, setting refresh rate to 5 seconds." % (team_id))
-            values["private_fast_refresh"] = True
-        elif values["state"] in ['STATUS_FINAL', 'OFF']: 
-            _LOGGER.debug("Event for %s is over, setting refresh back to 20 minutes." % (team_id))
-            values["private_fast_refresh"] = False
+            # Built from the schedule, so drop the groups that weren't asked for
+            _drop_unselected_groups(values, groups)
+
+        MLB.refresh_rate(values, team_id)
+
+    return values
+
+
+def _listed_next_event(team_data: dict) -> dict | None:
+    """Return the next event the team API lists for a team, if any."""
+    return next(iter(team_data.get("nextEvent") or []), None)
+
+
+def _sooner_event(scheduled: dict | None, listed: dict | None) -> dict | None:
+    """Return the schedule's next game, or the team's listed next event if it starts first.
+
+    The listed event is only taken over the schedule when it hasn't started
+    yet, so a game added after the schedule was downloaded still shows up.
+    """
+    if scheduled is None or listed is None:
+        return scheduled or listed
+    listed_start = seconds_until(listed.get("date"))
+    scheduled_start = seconds_until(scheduled.get("date"))
+    if listed_start is not None and scheduled_start is not None and 0 <= listed_start < scheduled_start:
+        return listed
+    return scheduled
+
+
+def _drop_unselected_groups(values, groups) -> None:
+    """Remove the attributes of groups an entry didn't select."""
+    for group, keys in ATTRIBUTE_GROUPS.items():
+        if group not in groups:
+            for key in keys:
+                values.pop(key, None)
+
+
+def _extract_cached(league, event, team_id, groups, group_cache=None, metrics=None) -> dict:
+    """Parse a scoreboard event, reusing the attribute groups the cache still holds."""
+    if group_cache is None:
+        return league.extract_event(event, team_id, groups)
+    try:
+        state = event["status"]["type"]["name"]
+    except:
+        state = None
+    now = time.monotonic()
+    stale, cached = group_cache.split(event.get("id"), state, groups, now)
+    values = league.extract_event(event, team_id, stale)
+    values.update(cached)
+    group_cache.store(values["event_id"], values["state"], values, stale, now)
+    if metrics is not None:
+        metrics.record_groups(len(groups) - len(stale), len(stale))
+    return values
+
+
+def _extract_event(event, team_id, groups=None) -> dict:
+    """Parse one scoreboard event from the point of view of the given team.
+
+    Only the attribute groups in ``groups`` are extracted, on top of the
+    core score and status fields. None extracts every group.
+    """
+
+    if groups is None:
+        groups = ATTRIBUTE_GROUPS
+    values = {}
+    # Determine whether our team is Competitor 0 or 1
+    team_index = 0 if event["competitions"][0]["competitors"][0]["team"]["abbreviation"] == team_id else 1
+    team_home_away = event["competitions"][0]["competitors"][team_index]["homeAway"]
+    oppo_index = abs((team_index-1))
+    
+    values["event_id"] = event.get("id")
+
+    try:
+        values["state"] = event["status"]["type"]["name"]
+    except:
+        values["state"] = None
+    
+    try:
+        values["date"] = event["date"]
+    except:
+        values["date"] = None
+    
+    # Formatted as full team names like "New York Mets at Washington Nationals"
+    try:
+        values["event_name"] = event["name"]
+    except:
+        values["event_name"] = None
+    
+    # Formatted as abbreviations like "NYM @ WSH"
+    try:
+        values["event_short_name"] = event["shortName"]
+    except:
+        values["event_short_name"] = None
+
+     # Formatted as "STD", "RD16", "QTR"
+    try:
+        values["event_type"] = event["competitions"][0]["type"]["abbreviation"]
+    except:
+        values["event_type"] = None
+
+    # ESPN's season, which a late game's UTC start date can't be trusted for
+    try:
+        values["season"] = event["season"]["year"]
+    except:
+        values["season"] = None
+
+    # 1 for spring training, 2 for the regular season and 3 for the postseason
+    try:
+        values["season_type"] = event["season"]["type"]
+    except:
+        values["season_type"] = None
+    
+    if ATTR_GROUP_DETAILS in groups:
+        try:
+            values["attendance"] = event["competitions"][0]["attendance"]
+        except:
+            values["attendance"] = None
+    
+        # Formatted as "East 1st Round - Game 7", "East 2nd Round - Game 1"
+        try:
+            values["game_notes"] = event["competitions"][0]["notes"][0]["headline"]
+        except:
+            values["game_notes"] = None
+    
+        # Formatted as "Series Tied 3-3"
+        try:
+            values["series_summary"] = event["competitions"][0]["series"]["summary"]
+        except:
+            values["series_summary"] = None
+
+    if ATTR_GROUP_VENUE in groups:
+        try:
+            values["venue_name"] = event["competitions"][0]["venue"]["fullName"]
+        except:
+            values["venue_name"] = None
+    
+        try:
+            values["venue_city"] = event["competitions"][0]["venue"]["address"]["city"]
+        except:
+            values["venue_city"] = None
+    
+        try:
+            values["venue_state"] = event["competitions"][0]["venue"]["address"]["state"]
+        except:
+            values["venue_state"] = None
+    
+        try:
+            values["venue_capacity"] = event["competitions"][0]["venue"]["capacity"]
+        except:
+            values["venue_capacity"] = None
+    
+        # Formatted as true/false
+        try:
+            values["venue_indoor"] = event["competitions"][0]["venue"]["indoor"]
+        except:
+            values["venue_indoor"] = None
+
+    # Formatted as an integer like "3"
+    try:
+        values["inning"] = event["competitions"][0]["status"]["period"]
+    except:
+        values["inning"] = None
+    
+    # Formatted like "Top 3rd"
+    try:
+        values["inning_description"] = event["competitions"][0]["status"]["type"]["shortDetail"]
+    except:
+        values["inning_description"] = None
+    
+    if ATTR_GROUP_WEATHER in groups:
+        # Formatted like "Mostly clear"
+        try:
+            values["weather_conditions"] = event["weather"]["displayValue"]
+        except:
+            values["weather_conditions"] = None
+
+        # Integer like "68"
+        try:
+            values["weather_temp"] = event["weather"]["temperature"]
+        except:
+            values["weather_temp"] = None
+
+    if ATTR_GROUP_DECISIONS in groups:
+        if values["state"] in ['STATUS_FINAL']:
+            try:
+                featuredAthlete_0_Type = event["competitions"][0]["status"]["featuredAthletes"][0]["name"]
+            except:
+                featuredAthlete_0_Type = None
+
+            try:
+                featuredAthlete_1_Type = event["competitions"][0]["status"]["featuredAthletes"][1]["name"]
+            except:
+                featuredAthlete_1_Type = None
+
+            try:
+                featuredAthlete_2_Type = event["competitions"][0]["status"]["featuredAthletes"][2]["name"]
+
+            except:
+                featuredAthlete_2_Type = None
+
+            wp_index = -1
+            lp_index = -1
+            sp_index = -1
+
+            if featuredAthlete_0_Type == 'winningPitcher':
+                wp_index = 0
+            elif featuredAthlete_0_Type == 'losingPitcher':
+                lp_index = 0
+            elif featuredAthlete_0_Type == 'savingPitcher':
+                sp_index = 0
+
+            if featuredAthlete_1_Type == 'winningPitcher':
+                wp_index = 1
+            elif featuredAthlete_1_Type == 'losingPitcher':
+                lp_index = 1
+            elif featuredAthlete_1_Type == 'savingPitcher':
+                sp_index = 1
+
+            if featuredAthlete_2_Type == 'winningPitcher':
+                wp_index = 2
+            elif featuredAthlete_2_Type == 'losingPitcher':
+                lp_index = 2
+            elif featuredAthlete_2_Type == 'savingPitcher':
+                sp_index = 2
+
+            try:
+                values["winning_pitcher"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["athlete"]["fullName"]
+            except:
+                values["winning_pitcher"] = None
+        
+            try:
+                if event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][0]["name"] == "wins":
+                    values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][0]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][1]["name"] == "wins":
+                    values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][1]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][2]["name"] == "wins":
+                    values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][2]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][3]["name"] == "wins":
+                    values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][3]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][4]["name"] == "wins":
+                    values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][4]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][5]["name"] == "wins":
+                    values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][5]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][6]["name"] == "wins":
+                    values["winning_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][6]["displayValue"]
+                else:
+                    values["winning_pitcher_wins"] = None
+            except:
+                values["winning_pitcher_wins"] = None
+        
+            try:
+                if event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][0]["name"] == "losses":
+                    values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][0]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][1]["name"] == "losses":
+                    values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][1]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][2]["name"] == "losses":
+                    values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][2]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][3]["name"] == "losses":
+                    values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][3]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][4]["name"] == "losses":
+                    values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][4]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][5]["name"] == "losses":
+                    values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][5]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][6]["name"] == "losses":
+                    values["winning_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][6]["displayValue"]
+                else:
+                    values["winning_pitcher_losses"] = None
+            except:
+                values["winning_pitcher_losses"] = None
+
+        
+            try:
+                if event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][0]["name"] == "ERA":
+                    values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][0]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][1]["name"] == "ERA":
+                    values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][1]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][2]["name"] == "ERA":
+                    values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][2]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][3]["name"] == "ERA":
+                    values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][3]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][4]["name"] == "ERA":
+                    values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][4]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][5]["name"] == "ERA":
+                    values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][5]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][6]["name"] == "ERA":
+                    values["winning_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][wp_index]["statistics"][6]["displayValue"]
+                else:
+                    values["winning_pitcher_era"] = None
+            except:
+                values["winning_pitcher_era"] = None
+
+            try:
+                values["losing_pitcher"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["athlete"]["fullName"]
+            except:
+                values["losing_pitcher"] = None
+            
+
+            try:
+                if event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][0]["name"] == "wins":
+                    values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][0]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][1]["name"] == "wins":
+                    values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][1]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][2]["name"] == "wins":
+                    values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][2]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][3]["name"] == "wins":
+                    values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][3]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][4]["name"] == "wins":
+                    values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][4]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][5]["name"] == "wins":
+                    values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][5]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][6]["name"] == "wins":
+                    values["losing_pitcher_wins"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][6]["displayValue"]
+                else:
+                    values["losing_pitcher_wins"] = None
+            except:
+                values["losing_pitcher_wins"] = None
+        
+            try:
+                if event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][0]["name"] == "losses":
+                    values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][0]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][1]["name"] == "losses":
+                    values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][1]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][2]["name"] == "losses":
+                    values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][2]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][3]["name"] == "losses":
+                    values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][3]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][4]["name"] == "losses":
+                    values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][4]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][5]["name"] == "losses":
+                    values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][5]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][6]["name"] == "losses":
+                    values["losing_pitcher_losses"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][6]["displayValue"]
+                else:
+                    values["losing_pitcher_losses"] = None
+            except:
+                values["losing_pitcher_losses"] = None
+
+        
+            try:
+                if event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][0]["name"] == "ERA":
+                    values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][0]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][1]["name"] == "ERA":
+                    values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][1]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][2]["name"] == "ERA":
+                    values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][2]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][3]["name"] == "ERA":
+                    values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][3]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][4]["name"] == "ERA":
+                    values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][4]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][5]["name"] == "ERA":
+                    values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][5]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][6]["name"] == "ERA":
+                    values["losing_pitcher_era"] = event["competitions"][0]["status"]["featuredAthletes"][lp_index]["statistics"][6]["displayValue"]
+                else:
+                    values["losing_pitcher_era"] = None
+            except:
+                values["losing_pitcher_era"] = None
+
+            try:
+                values["saving_pitcher"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["athlete"]["fullName"]
+            except:
+                values["saving_pitcher"] = None
+            
+
+            try:
+                if event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][0]["name"] == "saves":
+                    values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][0]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][1]["name"] == "saves":
+                    values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][1]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][2]["name"] == "saves":
+                    values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][2]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][3]["name"] == "saves":
+                    values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][3]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][4]["name"] == "saves":
+                    values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][4]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][5]["name"] == "saves":
+                    values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][5]["displayValue"]
+                elif event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][6]["name"] == "saves":
+                    values["saving_pitcher_saves"] = event["competitions"][0]["status"]["featuredAthletes"][sp_index]["statistics"][6]["displayValue"]
+                else:
+                    values["saving_pitcher_saves"] = None
+            except:
+                values["saving_pitcher_saves"] = None
+        
+
         else:
-            _LOGGER.debug("Event for %s is other state, setting refresh to 20 minutes." % (team_id))
-            values["private_fast_refresh"] = False
+            values["winning_pitcher"] = None
+            values["winning_pitcher_wins"] = None
+            values["winning_pitcher_losses"] = None
+            values["winning_pitcher_era"] = None
+            values["losing_pitcher"] = None
+            values["losing_pitcher_wins"] = None
+            values["losing_pitcher_losses"] = None
+            values["losing_pitcher_era"] = None
+            values["saving_pitcher"] = None
+            values["saving_pitcher_saves"] = None
+
+    try:
+        values["game_status"] = event["status"]["type"]["shortDetail"]
+    except:
+        values["game_status"] = None
+    
+    values["home_team_abbr"] = event["competitions"][0]["competitors"][0]["team"]["abbreviation"]
+    values["home_team_id"] = event["competitions"][0]["competitors"][0]["team"]["id"]
+    values["home_team_runs"] = event["competitions"][0]["competitors"][0]["score"]
+    values["home_team_hits"] = event["competitions"][0]["competitors"][0]["hits"]
+    values["home_team_errors"] = event["competitions"][0]["competitors"][0]["errors"]
+
+    if ATTR_GROUP_TEAMS in groups:
+        values["home_team_city"] = event["competitions"][0]["competitors"][0]["team"]["location"]
+        values["home_team_name"] = event["competitions"][0]["competitors"][0]["team"]["name"]
+        values["home_team_color"] = event["competitions"][0]["competitors"][0]["team"]["color"]
+        values["home_team_alt_color"] = event["competitions"][0]["competitors"][0]["team"]["alternateColor"]
+        values["home_team_logo"] = event["competitions"][0]["competitors"][0]["team"]["logo"]
+
+        try:
+            values["home_team_colors"] = [''.join(('#',event["competitions"][0]["competitors"][0]["team"]["color"])), 
+                ''.join(('#',event["competitions"][0]["competitors"][0]["team"]["alternateColor"]))]
+        except:
+            values["home_team_colors"] = ['#013369','#013369']
+
+        values["home_team_record"] = event["competitions"][0]["competitors"][0]["records"][0]["summary"]
+
+    if ATTR_GROUP_LINESCORES in groups:
+        try:
+            values["home_team_ls_1"] = event["competitions"][0]["competitors"][0]["linescores"][0]["value"]
+        except:
+            values["home_team_ls_1"] = None
+
+        try:
+            values["home_team_ls_2"] = event["competitions"][0]["competitors"][0]["linescores"][1]["value"]
+        except:
+            values["home_team_ls_2"] = None
+
+        try:
+            values["home_team_ls_3"] = event["competitions"][0]["competitors"][0]["linescores"][2]["value"]
+        except:
+            values["home_team_ls_3"] = None
+
+        try:
+            values["home_team_ls_4"] = event["competitions"][0]["competitors"][0]["linescores"][3]["value"]
+        except:
+            values["home_team_ls_4"] = None
+
+        try:
+            values["home_team_ls_5"] = event["competitions"][0]["competitors"][0]["linescores"][4]["value"]
+        except:
+            values["home_team_ls_5"] = None
+
+        try:
+            values["home_team_ls_6"] = event["competitions"][0]["competitors"][0]["linescores"][5]["value"]
+        except:
+            values["home_team_ls_6"] = None
+
+        try:
+            values["home_team_ls_7"] = event["competitions"][0]["competitors"][0]["linescores"][6]["value"]
+        except:
+            values["home_team_ls_7"] = None
+
+        try:
+            values["home_team_ls_8"] = event["competitions"][0]["competitors"][0]["linescores"][7]["value"]
+        except:
+            values["home_team_ls_8"] = None
+
+        try:
+            values["home_team_ls_9"] = event["competitions"][0]["competitors"][0]["linescores"][8]["value"]
+        except:
+            values["home_team_ls_9"] = None
+
+        # Every inning, including extra innings, for the results archive
+        try:
+            values["home_team_linescores"] = [ls["value"] for ls in event["competitions"][0]["competitors"][0]["linescores"]]
+        except:
+            values["home_team_linescores"] = None
+
+    
+    values["away_team_abbr"] = event["competitions"][0]["competitors"][1]["team"]["abbreviation"]
+    values["away_team_id"] = event["competitions"][0]["competitors"][1]["team"]["id"]
+    values["away_team_runs"] = event["competitions"][0]["competitors"][1]["score"]
+    values["away_team_hits"] = event["competitions"][0]["competitors"][1]["hits"]
+    values["away_team_errors"] = event["competitions"][0]["competitors"][1]["errors"]
+
+    if ATTR_GROUP_TEAMS in groups:
+        values["away_team_city"] = event["competitions"][0]["competitors"][1]["team"]["location"]
+        values["away_team_name"] = event["competitions"][0]["competitors"][1]["team"]["name"]
+        values["away_team_color"] = event["competitions"][0]["competitors"][1]["team"]["color"]
+        values["away_team_alt_color"] = event["competitions"][0]["competitors"][1]["team"]["alternateColor"]
+        values["away_team_logo"] = event["competitions"][0]["competitors"][1]["team"]["logo"]
+
+        try:
+            values["away_team_colors"] = [''.join(('#',event["competitions"][0]["competitors"][1]["team"]["color"])), 
+                ''.join(('#',event["competitions"][0]["competitors"][1]["team"]["alternateColor"]))]
+        except:
+            values["away_team_colors"] = ['#D50A0A','#D50A0A']
+
+        values["away_team_record"] = event["competitions"][0]["competitors"][1]["records"][0]["summary"]
+
+    if ATTR_GROUP_LINESCORES in groups:
+        try:
+            values["away_team_ls_1"] = event["competitions"][0]["competitors"][1]["linescores"][0]["value"]
+        except:
+            values["away_team_ls_1"] = None
+
+        try:
+            values["away_team_ls_2"] = event["competitions"][0]["competitors"][1]["linescores"][1]["value"]
+        except:
+            values["away_team_ls_2"] = None
+
+        try:
+            values["away_team_ls_3"] = event["competitions"][0]["competitors"][1]["linescores"][2]["value"]
+        except:
+            values["away_team_ls_3"] = None
+
+        try:
+            values["away_team_ls_4"] = event["competitions"][0]["competitors"][1]["linescores"][3]["value"]
+        except:
+            values["away_team_ls_4"] = None
+
+        try:
+            values["away_team_ls_5"] = event["competitions"][0]["competitors"][1]["linescores"][4]["value"]
+        except:
+            values["away_team_ls_5"] = None
+
+        try:
+            values["away_team_ls_6"] = event["competitions"][0]["competitors"][1]["linescores"][5]["value"]
+        except:
+            values["away_team_ls_6"] = None
 
+        try:
+            values["away_team_ls_7"] = event["competitions"][0]["competitors"][1]["linescores"][6]["value"]
+        except:
+            values["away_team_ls_7"] = None
 
+        try:
+            values["away_team_ls_8"] = event["competitions"][0]["competitors"][1]["linescores"][7]["value"]
+        except:
+            values["away_team_ls_8"] = None
+
+        try:
+            values["away_team_ls_9"] = event["competitions"][0]["competitors"][1]["linescores"][8]["value"]
+        except:
+            values["away_team_ls_9"] = None
+
+        # Every inning, including extra innings, for the results archive
+        try:
+            values["away_team_linescores"] = [ls["value"] for ls in event["competitions"][0]["competitors"][1]["linescores"]]
+        except:
+            values["away_team_linescores"] = None
+
+    if ATTR_GROUP_BROADCASTS in groups:
+        try:
+            values["tv_network"] = event["competitions"][0]["broadcasts"][0]["names"]
+        except:
+            values["tv_network"] = None
+
+    if ATTR_GROUP_SITUATION in groups:
+        try:
+            values["last_play"] = event["competitions"][0]["situation"]["lastPlay"]["text"]
+        except:
+            values["last_play"] = None
+
+        try:
+            values["balls"] = event["competitions"][0]["situation"]["balls"]
+        except:
+            values["balls"] = None
+
+        try:
+            values["strikes"] = event["competitions"][0]["situation"]["strikes"]
+        except:
+            values["strikes"] = None
+
+        try:
+            values["outs"] = event["competitions"][0]["situation"]["outs"]
+        except:
+            values["outs"] = None
+    
+        try:
+            values["runner_on_1st"] = event["competitions"][0]["situation"]["onFirst"]
+        except:
+            values["runner_on_1st"] = None
+    
+        try:
+            values["runner_on_2nd"] = event["competitions"][0]["situation"]["onSecond"]
+        except:
+            values["runner_on_2nd"] = None
+    
+        try:
+            values["runner_on_3rd"] = event["competitions"][0]["situation"]["onThird"]
+        except:
+            values["runner_on_3rd"] = None
+    
+        try:
+            values["current_batter"] = event["competitions"][0]["situation"]["batter"]["athlete"]["fullName"]
+        except:
+            values["current_batter"] = None
+        
+        try:
+            values["current_pitcher"] = event["competitions"][0]["situation"]["pitcher"]["athlete"]["fullName"]
+        except:
+            values["current_pitcher"] = None
+
+    if ATTR_GROUP_PROBABLES in groups:
+        # Starting Pitcher
+        try:
+            values["home_team_starting_pitcher"] = event["competitions"][0]["competitors"][0]["probables"][0]["athlete"]["displayName"]
+        except:
+            values["home_team_starting_pitcher"] = None
+    
+        try:
+            values["away_team_starting_pitcher"] = event["competitions"][0]["competitors"][1]["probables"][0]["athlete"]["displayName"]
+        except:
+            values["away_team_starting_pitcher"] = None
+
+    if ATTR_GROUP_ODDS in groups:
+        try:
+            values["odds"] = event["competitions"][0]["odds"][0]["details"]
+        except:
+            values["odds"] = None
+        
+        try:
+            values["overunder"] = event["competitions"][0]["odds"][0]["overUnder"]
+        except:
+            values["overunder"] = None
+    
+        try:
+            values["home_team_odds_win_pct"] = event["competitions"][0]["odds"][1]["homeTeamOdds"]["winPercentage"]
+        except:
+            values["home_team_odds_win_pct"] = None
+    
+        try:
+            values["away_team_odds_win_pct"] = event["competitions"][0]["odds"][1]["awayTeamOdds"]["winPercentage"]
+        except:
+            values["away_team_odds_win_pct"] = None
+
+    if ATTR_GROUP_DETAILS in groups:
+        try:
+            values["headlines"] = event["competitions"][0]["headlines"][0]["shortLinkText"]
+        except:
+            values["headlines"] = None
+
+    try:
+        if values["state"] in ['STATUS_FINAL']:
+            if values["home_team_abbr"] == team_id:
+                if values["home_team_runs"] > values["away_team_runs"]:
+                    values["win_or_loss"] = "win"
+                else:
+                    values["win_or_loss"] = "loss"
+            else:
+                if values["home_team_runs"] > values["away_team_runs"]:
+                    values["win_or_loss"] = "loss"
+                else:
+                    values["win_or_loss"] = "win"
+        else:
+            values["win_or_loss"] = None
+    except:
+        values["win_or_loss"] = None
+
+    if ATTR_GROUP_DETAILS in groups and values["state"] in ['STATUS_POSTPONED']:
+        try:
+            values["headlines"] = event["competitions"][0]["notes"][0]["headline"]
+        except:
+            values["headlines"] = None
+    
+    values["last_update"] = now_w3c()
+    values["private_fast_refresh"] = False
     return values
 
+
+def _set_refresh_rate(values, team_id) -> None:
+    """Flag whether the game needs the fast refresh rate."""
+
+    time_to_start = seconds_until(values["date"])
+    if values["state"] == 'STATUS_SCHEDULED' and time_to_start is not None and time_to_start < PREGAME_WINDOW:
+        _LOGGER.debug("Event for %s is within 20 minutes, setting refresh rate to 5 seconds." % (team_id))
+        values["private_fast_refresh"] = True
+    elif values["state"] == 'STATUS_IN_PROGRESS':
+        _LOGGER.debug("Event for %s is in progress, setting refresh rate to 5 seconds." % (team_id))
+        values["private_fast_refresh"] = True
+    elif values["state"] in ['STATUS_FINAL', 'OFF']: 
+        _LOGGER.debug("Event for %s is over, setting refresh back to 20 minutes." % (team_id))
+        values["private_fast_refresh"] = False
+    else:
+        _LOGGER.debug("Event for %s is other state, setting refresh to 20 minutes." % (team_id))
+        values["private_fast_refresh"] = False
+
+
+# MLB's schema for the scoreboard engine
+MLB = League(SPORT, LEAGUE, extract_event=_extract_event, refresh_rate=_set_refresh_rate)
+
+
 async def async_clear_states(config) -> dict:
     """Clear all state attributes"""
     
     values = {}
     # Reset values
     values = {
+        "event_id": None,
         "date": None,
         "attendance": None,
         "event_name": None,
         "event_short_name": None,
         "event_type": None,
+        "season": None,
+        "season_type": None,
         "game_notes": None,
         "series_summary": None,
         "venue_name": None,
@@ -1089,6 +1901,7 @@ async def async_clear_states(config) -> dict:
         "home_team_ls_7": None,
         "home_team_ls_8": None,
         "home_team_ls_9": None,
+        "home_team_linescores": None,
         "home_team_record": None,
         "away_team_abbr": None,
         "away_team_id": None,
@@ -1110,8 +1923,8 @@ async def async_clear_states(config) -> dict:
         "away_team_ls_7": None,
         "away_team_ls_8": None,
         "away_team_ls_9": None,
+        "away_team_linescores": None,
         "away_team_record": None,
-        "first_pitch_in": None,
         "tv_network": None,
         "last_play": None,
         "balls": None,
@@ -0,0 +1,161 @@
+"""Season analytics over the MLB results archive."""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+
+from homeassistant.core import HomeAssistant, callback
+
+from .archive import async_get_archive
+from .const import ANALYTICS, DOMAIN, PYTHAGOREAN_EXPONENT, ROLLING_GAMES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _linescore_matrix(np, linescores: list[str | None]):
+    """Return line scores as a games x innings array, padded with NaN."""
+    parsed = [json.loads(value) if value else None for value in linescores]
+    innings = max((len(row) for row in parsed if row), default=0)
+    matrix = np.full((len(parsed), innings), np.nan)
+    for position, row in enumerate(parsed):
+        if row:
+            matrix[position, : len(row)] = [np.nan if runs is None else runs for runs in row]
+    return matrix
+
+
+def compute_analytics(columns: dict) -> dict[str, dict]:
+    """Compute per-team analytics for every team in a season's archived games.
+
+    Each game becomes two team-game rows, one per side, sorted by team and
+    then by date. Totals and records come from ``np.bincount`` over the team
+    indices, and per-inning sums from ``np.add.reduceat`` over each team's
+    rows. The rolling win
+    percentage over the last ``ROLLING_GAMES`` games and the current streaks
+    come from one cumulative sum over every row. Python only loops over the
+    teams at the end, to build their result dicts.
+    """
+    import numpy as np
+
+    count = len(columns["home_team"])
+    home_runs = np.asarray(columns["home_runs"], dtype=float)
+    away_runs = np.asarray(columns["away_runs"], dtype=float)
+    home_innings = _linescore_matrix(np, columns["home_linescores"])
+    away_innings = _linescore_matrix(np, columns["away_linescores"])
+    innings = max(home_innings.shape[1], away_innings.shape[1])
+    home_innings = np.pad(home_innings, ((0, 0), (0, innings - home_innings.shape[1])), constant_values=np.nan)
+    away_innings = np.pad(away_innings, ((0, 0), (0, innings - away_innings.shape[1])), constant_values=np.nan)
+
+    # Team-game rows: every game from the home side, then from the away side
+    team = np.asarray(list(columns["home_team"]) + list(columns["away_team"]), dtype=object)
+    runs_for = np.concatenate([home_runs, away_runs])
+    runs_against = np.concatenate([away_runs, home_runs])
+    innings_for = np.concatenate([home_innings, away_innings])
+    innings_against = np.concatenate([away_innings, home_innings])
+    is_home = np.arange(2 * count) < count
+    game_order = np.tile(np.arange(count), 2)
+    scored = ~(np.isnan(runs_for) | np.isnan(runs_against))
+    if not scored.any():
+        return {}
+
+    teams, team_index = np.unique(team[scored], return_inverse=True)
+    # Columns are already oldest first, so ordering by team then game keeps each team's games in date order
+    order = np.lexsort((game_order[scored], team_index))
+    team_index = team_index[order]
+    runs_for = runs_for[scored][order]
+    runs_against = runs_against[scored][order]
+    innings_for = innings_for[scored][order]
+    innings_against = innings_against[scored][order]
+    is_home = is_home[scored][order]
+    won = runs_for > runs_against
+
+    size = len(teams)
+    games = np.bincount(team_index, minlength=size)
+    ends = np.cumsum(games)
+    starts = ends - games
+    wins = np.bincount(team_index, weights=won, minlength=size)
+    home_wins = np.bincount(team_index, weights=won & is_home, minlength=size)
+    home_games = np.bincount(team_index, weights=is_home, minlength=size)
+    scored_runs = np.bincount(team_index, weights=runs_for, minlength=size)
+    allowed_runs = np.bincount(team_index, weights=runs_against, minlength=size)
+
+    # Win percentage over each team's last ROLLING_GAMES games, after every game
+    rows = np.arange(len(won))
+    wins_so_far = np.concatenate([[0], np.cumsum(won)])
+    window_start = np.maximum(rows - ROLLING_GAMES + 1, starts[team_index])
+    rolling = (wins_so_far[rows + 1] - wins_so_far[window_start]) / (rows + 1 - window_start)
+
+    # A streak starts at a team's first game or wherever the result flips
+    flips = np.ones(len(won), dtype=bool)
+    flips[1:] = (won[1:] != won[:-1]) | (team_index[1:] != team_index[:-1])
+    streak_starts = np.flatnonzero(flips)
+    last = ends - 1
+    streaks = last - streak_starts[np.cumsum(flips)[last] - 1] + 1
+
+    # Rows are grouped by team, so each team's inning totals are one reduceat segment
+    inning_sums_for = np.add.reduceat(np.nan_to_num(innings_for), starts, axis=0)
+    inning_sums_against = np.add.reduceat(np.nan_to_num(innings_against), starts, axis=0)
+    inning_games_for = np.add.reduceat(~np.isnan(innings_for), starts, axis=0, dtype=float)
+    inning_games_against = np.add.reduceat(~np.isnan(innings_against), starts, axis=0, dtype=float)
+    with np.errstate(all="ignore"):
+        runs_per_inning = inning_sums_for / inning_games_for
+        allowed_per_inning = inning_sums_against / inning_games_against
+        scored_power = scored_runs ** PYTHAGOREAN_EXPONENT
+        allowed_power = allowed_runs ** PYTHAGOREAN_EXPONENT
+        pythagorean = scored_power / (scored_power + allowed_power)
+
+    def _rounded(values, digits):
+        return [None if value != value else round(value, digits) for value in values.tolist()]
+
+    results = {}
+    for position, name in enumerate(teams):
+        played, won_games = int(games[position]), int(wins[position])
+        home_played, home_won = int(home_games[position]), int(home_wins[position])
+        results[str(name)] = {
+            "games": played,
+            "wins": won_games,
+            "losses": played - won_games,
+            "win_pct": round(won_games / played, 3),
+            "last_10_win_pct": round(float(rolling[last[position]]), 3),
+            "rolling_win_pct": np.round(rolling[starts[position]:ends[position]], 3).tolist(),
+            "home_record": f"{home_won}-{home_played - home_won}",
+            "away_record": f"{won_games - home_won}-{played - home_played - (won_games - home_won)}",
+            "runs_scored": int(scored_runs[position]),
+            "runs_allowed": int(allowed_runs[position]),
+            "run_differential": int(scored_runs[position] - allowed_runs[position]),
+            "pythagorean_win_pct": _rounded(pythagorean[position:position + 1], 3)[0],
+            "streak": f"{'W' if won[last[position]] else 'L'}{int(streaks[position])}",
+            "runs_per_inning": _rounded(runs_per_inning[position], 2),
+            "runs_allowed_per_inning": _rounded(allowed_per_inning[position], 2),
+        }
+    return results
+
+
+class SeasonAnalytics:
+    """Analytics for every team in a season, recomputed only when the archive changes."""
+
+    def __init__(self, archive) -> None:
+        """Initialize."""
+        self.archive = archive
+        self._lock = threading.Lock()
+        self._key = None
+        self._results = {}
+
+    def get(self, season: int, team: str) -> dict | None:
+        """Return one team's analytics for a season. Blocks, so call from the executor."""
+        with self._lock:
+            key = (season, self.archive.version)
+            if key != self._key:
+                self._results = compute_analytics(self.archive.season_columns(season))
+                self._key = key
+                _LOGGER.debug("Computed %s analytics for %s teams", season, len(self._results))
+            return self._results.get(team)
+
+
+@callback
+def async_get_analytics(hass: HomeAssistant) -> SeasonAnalytics:
+    """Return the analytics cache shared by every entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if ANALYTICS not in domain_data:
+        domain_data[ANALYTICS] = SeasonAnalytics(async_get_archive(hass))
+    return domain_data[ANALYTICS]
@@ -0,0 +1,269 @@
+"""Local archive of final MLB game results."""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import ARCHIVE, ARCHIVE_FILENAME, DOMAIN
+from .util import parse_date
+
+_LOGGER = logging.getLogger(__name__)
+
+# ESPN's season types: 1 is spring training, 2 the regular season, 3 the postseason
+REGULAR_SEASON = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    event_id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    game_date TEXT,
+    season INTEGER NOT NULL,
+    season_type INTEGER,
+    event_type TEXT,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    home_runs INTEGER,
+    away_runs INTEGER,
+    home_hits INTEGER,
+    away_hits INTEGER,
+    home_errors INTEGER,
+    away_errors INTEGER,
+    home_linescores TEXT,
+    away_linescores TEXT,
+    winning_pitcher TEXT,
+    losing_pitcher TEXT,
+    saving_pitcher TEXT,
+    attendance INTEGER,
+    venue TEXT
+);
+"""
+
+# Created after any migration, since older databases lack some indexed columns
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_games_date ON games (date);
+CREATE INDEX IF NOT EXISTS idx_games_game_date ON games (game_date);
+CREATE INDEX IF NOT EXISTS idx_games_home ON games (home_team, date);
+CREATE INDEX IF NOT EXISTS idx_games_away ON games (away_team, date);
+CREATE INDEX IF NOT EXISTS idx_games_matchup ON games (home_team, away_team, date);
+"""
+
+_COLUMNS = (
+    "event_id", "date", "game_date", "season", "season_type", "event_type", "home_team", "away_team",
+    "home_runs", "away_runs", "home_hits", "away_hits", "home_errors", "away_errors",
+    "home_linescores", "away_linescores", "winning_pitcher", "losing_pitcher",
+    "saving_pitcher", "attendance", "venue",
+)
+
+
+def _as_int(value) -> int | None:
+    """Return a value as an integer, or None if it isn't one."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def local_date(value: str) -> str | None:
+    """Return the local calendar date of an ESPN start time, as YYYY-MM-DD.
+
+    ESPN's times are UTC, so an evening game in the Americas starts on the
+    next day's date there.
+    """
+    start = parse_date(value)
+    return dt_util.as_local(start).date().isoformat() if start is not None else None
+
+
+def game_record(values: dict) -> tuple | None:
+    """Build an archive row from a final game snapshot."""
+    if values.get("event_id") is None or not values.get("date"):
+        return None
+    game_date = local_date(values["date"])
+    if game_date is None:
+        return None
+    return (
+        values["event_id"],
+        values["date"],
+        game_date,
+        _as_int(values.get("season")) or int(game_date[:4]),
+        _as_int(values.get("season_type")),
+        values.get("event_type"),
+        values.get("home_team_abbr"),
+        values.get("away_team_abbr"),
+        _as_int(values.get("home_team_runs")),
+        _as_int(values.get("away_team_runs")),
+        _as_int(values.get("home_team_hits")),
+        _as_int(values.get("away_team_hits")),
+        _as_int(values.get("home_team_errors")),
+        _as_int(values.get("away_team_errors")),
+        json.dumps(values.get("home_team_linescores")),
+        json.dumps(values.get("away_team_linescores")),
+        values.get("winning_pitcher"),
+        values.get("losing_pitcher"),
+        values.get("saving_pitcher"),
+        _as_int(values.get("attendance")),
+        values.get("venue_name"),
+    )
+
+
+class GameArchive:
+    """SQLite archive of final games.
+
+    All methods block, so call them from the executor. A single connection is
+    shared between executor threads and guarded by a lock.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = None
+        # Bumped on every write so derived data knows when to recompute
+        self.version = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.executescript(_SCHEMA)
+            self._migrate(self._connection)
+            self._connection.executescript(_INDEXES)
+        return self._connection
+
+    @staticmethod
+    def _migrate(connection: sqlite3.Connection) -> None:
+        """Add the columns databases created before they were stored lack."""
+        columns = {row["name"] for row in connection.execute("PRAGMA table_info(games)")}
+        if "season_type" not in columns:
+            # Games archived before it was stored keep an unknown season type
+            _LOGGER.debug("Adding season types to the archive")
+            with connection:
+                connection.execute("ALTER TABLE games ADD COLUMN season_type INTEGER")
+        if "game_date" in columns:
+            return
+        _LOGGER.debug("Adding local game dates to the archive")
+        with connection:
+            connection.execute("ALTER TABLE games ADD COLUMN game_date TEXT")
+            connection.executemany(
+                "UPDATE games SET game_date = ? WHERE event_id = ?",
+                [
+                    (local_date(row["date"]), row["event_id"])
+                    for row in connection.execute("SELECT event_id, date FROM games")
+                ],
+            )
+
+    def add_games(self, games: list[dict]) -> int:
+        """Insert or replace final games, returning how many were written."""
+        rows = [row for row in map(game_record, games) if row is not None]
+        if not rows:
+            return 0
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO games ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    rows,
+                )
+            self.version += 1
+        _LOGGER.debug("Archived %s games", len(rows))
+        return len(rows)
+
+    def query(
+        self,
+        team: str,
+        opponent: str | None = None,
+        location: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = 10,
+    ) -> list[dict]:
+        """Return a team's archived games, newest first, from the team's point of view."""
+        if location == "home":
+            clauses, params = ["home_team = ?"], [team]
+            if opponent:
+                clauses.append("away_team = ?")
+                params.append(opponent)
+        elif location == "away":
+            clauses, params = ["away_team = ?"], [team]
+            if opponent:
+                clauses.append("home_team = ?")
+                params.append(opponent)
+        elif opponent:
+            clauses = ["((home_team = ? AND away_team = ?) OR (home_team = ? AND away_team = ?))"]
+            params = [team, opponent, opponent, team]
+        else:
+            clauses, params = ["(home_team = ? OR away_team = ?)"], [team, team]
+        if start_date:
+            clauses.append("game_date >= ?")
+            params.append(start_date)
+        if end_date:
+            clauses.append("game_date <= ?")
+            params.append(end_date)
+        sql = f"SELECT * FROM games WHERE {' AND '.join(clauses)} ORDER BY date DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [self._team_view(dict(row), team) for row in rows]
+
+    def season_columns(self, season: int) -> dict[str, list]:
+        """Return a season's regular-season games, oldest first, as one list per column.
+
+        Spring training and postseason games are left out. Games archived
+        before the season type was stored can't be told apart, so are kept.
+        """
+        columns = ("home_team", "away_team", "home_runs", "away_runs", "home_linescores", "away_linescores")
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT {', '.join(columns)} FROM games WHERE season = ?"
+                " AND (season_type = ? OR season_type IS NULL) ORDER BY date",
+                (season, REGULAR_SEASON),
+            ).fetchall()
+        return {column: [row[position] for row in rows] for position, column in enumerate(columns)}
+
+    @staticmethod
+    def _team_view(game: dict, team: str) -> dict:
+        """Add team-relative fields to an archived game."""
+        home = game["home_team"] == team
+        game["home_linescores"] = json.loads(game["home_linescores"] or "null")
+        game["away_linescores"] = json.loads(game["away_linescores"] or "null")
+        game["location"] = "home" if home else "away"
+        game["opponent"] = game["away_team"] if home else game["home_team"]
+        game["runs_for"] = game["home_runs"] if home else game["away_runs"]
+        game["runs_against"] = game["away_runs"] if home else game["home_runs"]
+        if game["runs_for"] is None or game["runs_against"] is None:
+            game["result"] = None
+        else:
+            game["result"] = "win" if game["runs_for"] > game["runs_against"] else "loss"
+        return game
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+@callback
+def async_get_archive(hass: HomeAssistant) -> GameArchive:
+    """Return the archive shared by every entry, opening it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if ARCHIVE not in domain_data:
+        archive = GameArchive(hass.config.path(ARCHIVE_FILENAME))
+        domain_data[ARCHIVE] = archive
+
+        async def _async_close(event) -> None:
+            await hass.async_add_executor_job(archive.close)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close)
+    return domain_data[ARCHIVE]
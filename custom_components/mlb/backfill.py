@@ -0,0 +1,204 @@
+"""Backfill the results archive from dated scoreboard pages."""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, timedelta
+import gzip
+import json
+import logging
+import os
+
+import aiohttp
+from homeassistant.util import dt as dt_util
+
+from . import MLB
+from .const import (
+    BACKFILL_CONCURRENCY,
+    BACKFILL_RETRIES,
+    USER_AGENT,
+)
+from .scoreboard import event_state
+
+_LOGGER = logging.getLogger(__name__)
+
+# Statuses worth another try; anything else is treated as a permanent failure
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def scoreboard_dates(start_date: date, end_date: date) -> list[str]:
+    """Return every date in the range, inclusive, as ESPN's YYYYMMDD."""
+    return [
+        (start_date + timedelta(days=offset)).strftime("%Y%m%d")
+        for offset in range((end_date - start_date).days + 1)
+    ]
+
+
+def parse_scoreboard(data: dict) -> list[dict]:
+    """Return the final games on a scoreboard page, from the home team's point of view."""
+    games = []
+    for event in data.get("events") or []:
+        try:
+            home_team_id = event["competitions"][0]["competitors"][0]["team"]["abbreviation"]
+            values = MLB.extract_event(event, home_team_id)
+        except (KeyError, IndexError, TypeError) as error:
+            # One malformed event shouldn't cost the rest of the day
+            _LOGGER.debug("Skipping event %s: %r" % (event.get("id"), error))
+            continue
+        if values.get("state") == "STATUS_FINAL":
+            games.append(values)
+    return games
+
+
+def load_fixture(directory: str, day: str) -> dict | None:
+    """Return a recorded scoreboard page for a date, from DAY.json or DAY.json.gz."""
+    path = os.path.join(directory, day + ".json")
+    if os.path.exists(path):
+        with open(path, "rb") as fixture:
+            return json.loads(fixture.read())
+    if os.path.exists(path + ".gz"):
+        with gzip.open(path + ".gz", "rb") as fixture:
+            return json.loads(fixture.read())
+    return None
+
+
+def day_complete(data: dict, day: str, today: str) -> bool:
+    """Return True if a scoreboard page will never gain another final game.
+
+    That is when every game on it is over. A date with no games only counts
+    once it is in the past, since ESPN may not have listed its games yet.
+    """
+    events = data.get("events") or []
+    if not events:
+        return day < today
+    return all(event_state(event) == "post" for event in events)
+
+
+def checkpoint_source(fixtures: str | None) -> str:
+    """Return what a run reads its scoreboards from, as recorded in the checkpoint."""
+    return "espn" if fixtures is None else "fixtures:" + os.path.abspath(fixtures)
+
+
+def load_checkpoint(path: str, source: str) -> set[str]:
+    """Return the dates a previous run from the same source already archived."""
+    try:
+        with open(path, encoding="utf-8") as checkpoint:
+            data = json.load(checkpoint)
+        if data.get("source") != source:
+            # Dates archived from recorded fixtures say nothing about what ESPN has, and vice versa
+            _LOGGER.info("Backfill checkpoint %s is for %s; starting over", path, data.get("source"))
+            return set()
+        return set(data.get("completed") or [])
+    except FileNotFoundError:
+        return set()
+    except (OSError, ValueError, AttributeError) as error:
+        _LOGGER.warning("Ignoring unreadable backfill checkpoint %s: %s", path, error)
+        return set()
+
+
+def save_checkpoint(path: str, completed: set[str], source: str) -> None:
+    """Record the archived dates, replacing the file atomically."""
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as checkpoint:
+        json.dump({"source": source, "completed": sorted(completed)}, checkpoint)
+    os.replace(temp_path, path)
+
+
+async def async_fetch_scoreboard(session, day: str, retries: int = BACKFILL_RETRIES) -> dict | None:
+    """Fetch the scoreboard for one date, backing off between failed attempts."""
+    headers = {"User-Agent": USER_AGENT, "Accept": "application/ld+json"}
+    url = MLB.scoreboard_date_url(day)
+    for attempt in range(retries + 1):
+        if attempt:
+            await asyncio.sleep(2 ** (attempt - 1))
+        try:
+            async with session.get(url, headers=headers) as r:
+                _LOGGER.debug("Getting scoreboard for %s from %s" % (day, url))
+                if r.status == 200:
+                    return await r.json()
+                if r.status not in RETRY_STATUSES:
+                    _LOGGER.debug("Scoreboard for %s returned %s" % (day, r.status))
+                    return None
+                _LOGGER.debug("Scoreboard for %s returned %s, retrying" % (day, r.status))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            _LOGGER.debug("Unable to get scoreboard for %s: %s" % (day, error))
+    return None
+
+
+async def async_backfill(
+    archive,
+    start_date: date,
+    end_date: date,
+    concurrency: int = BACKFILL_CONCURRENCY,
+    retries: int = BACKFILL_RETRIES,
+    checkpoint: str | None = None,
+    fixtures: str | None = None,
+    session=None,
+) -> dict:
+    """Archive every final game between two dates.
+
+    Dates are fetched concurrently, at most ``concurrency`` at a time. Each
+    date is recorded in the checkpoint file once all of its games are over
+    and archived, so an interrupted run picks up where it stopped while
+    dates with games still to finish are fetched again. The checkpoint is
+    tied to where the pages come from, ESPN or a fixtures directory. With ``fixtures`` set the
+    pages are read from a directory of recorded JSON instead of ESPN. Pass
+    ``session`` to reuse an existing connection pool; otherwise one is opened
+    for the run. Backfills keep their own concurrency limit rather than
+    spending the scoreboard engine's request budget, which live polls need.
+    """
+    loop = asyncio.get_running_loop()
+    days = scoreboard_dates(start_date, end_date)
+    today = dt_util.now().strftime("%Y%m%d")
+    source = checkpoint_source(fixtures)
+    completed = set()
+    if checkpoint is not None:
+        completed = await loop.run_in_executor(None, load_checkpoint, checkpoint, source)
+    pending = [day for day in days if day not in completed]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    checkpoint_lock = asyncio.Lock()
+    failed = []
+    incomplete = []
+    archived = 0
+
+    async def _async_backfill_day(session, day: str) -> None:
+        nonlocal archived
+        async with semaphore:
+            if fixtures is not None:
+                data = await loop.run_in_executor(None, load_fixture, fixtures, day)
+            else:
+                data = await async_fetch_scoreboard(session, day, retries)
+        if data is None:
+            failed.append(day)
+            return
+        games = parse_scoreboard(data)
+        if games:
+            written = await loop.run_in_executor(None, archive.add_games, games)
+            archived += written
+        if not day_complete(data, day, today):
+            incomplete.append(day)
+        elif checkpoint is not None:
+            async with checkpoint_lock:
+                completed.add(day)
+                await loop.run_in_executor(None, save_checkpoint, checkpoint, set(completed), source)
+
+    _LOGGER.info(
+        "Backfilling %s dates (%s already done) with up to %s requests at a time",
+        len(pending), len(days) - len(pending), concurrency,
+    )
+    if fixtures is not None:
+        await asyncio.gather(*(_async_backfill_day(None, day) for day in pending))
+    elif session is not None:
+        await asyncio.gather(*(_async_backfill_day(session, day) for day in pending))
+    else:
+        async with aiohttp.ClientSession() as session:
+            await asyncio.gather(*(_async_backfill_day(session, day) for day in pending))
+
+    return {
+        "dates": len(days),
+        "skipped": len(days) - len(pending),
+        "fetched": len(pending) - len(failed),
+        "failed": sorted(failed),
+        # Dates with games not yet over, which a later run fetches again
+        "incomplete": sorted(incomplete),
+        "games": archived,
+    }
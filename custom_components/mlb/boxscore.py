@@ -0,0 +1,62 @@
+"""Per-player boxscore lines from ESPN's game summary."""
+from __future__ import annotations
+
+import logging
+
+from .const import BOXSCORE_CACHE_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_boxscore(summary: dict) -> dict:
+    """Return batting and pitching lines per team from a game summary.
+
+    Each group is kept as one list of column labels plus one row per player,
+    rather than a dict per player, to keep the response small.
+    """
+    teams = {}
+    for team in (summary.get("boxscore") or {}).get("players") or []:
+        abbreviation = (team.get("team") or {}).get("abbreviation")
+        groups = {}
+        for group in team.get("statistics") or []:
+            group_type = group.get("type")
+            if group_type not in ["batting", "pitching"]:
+                continue
+            groups[group_type] = {
+                "labels": group.get("labels") or group.get("names") or [],
+                "players": [
+                    [(athlete.get("athlete") or {}).get("displayName"), *(athlete.get("stats") or [])]
+                    for athlete in group.get("athletes") or []
+                ],
+            }
+        if abbreviation is not None:
+            teams[abbreviation] = groups
+    return teams
+
+
+class BoxscoreCache:
+    """Keep the parsed boxscore of the last few games, keyed by ESPN event id."""
+
+    def __init__(self, size: int = BOXSCORE_CACHE_SIZE) -> None:
+        """Initialize."""
+        self.size = size
+        self._games = {}
+
+    def __contains__(self, event_id) -> bool:
+        return event_id in self._games
+
+    def __iter__(self):
+        return iter(self._games)
+
+    def get(self, event_id) -> dict | None:
+        """Return the cached boxscore for a game, if any."""
+        return self._games.get(event_id)
+
+    def update(self, event_id, summary: dict) -> dict:
+        """Parse and store the boxscore from a game summary."""
+        self._games.pop(event_id, None)
+        self._games[event_id] = parse_boxscore(summary)
+        while len(self._games) > self.size:
+            self._games.pop(next(iter(self._games)))
+        _LOGGER.debug("Refreshed boxscore for event %s", event_id)
+        return self._games[event_id]
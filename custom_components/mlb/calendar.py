@@ -0,0 +1,93 @@
+"""Calendar of a team's season schedule for MLB."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util, slugify
+
+from . import entry_config, is_league_mode
+from .const import COORDINATOR, DEFAULT_ICON, DOMAIN, GAME_LENGTH
+from .util import parse_date
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Setup the calendar platform."""
+    if is_league_mode(entry_config(entry)):
+        return
+    async_add_entities([MLBScheduleCalendar(hass, entry)])
+
+
+def _calendar_event(event: dict) -> CalendarEvent:
+    """Build a calendar event from a schedule index entry."""
+    start = parse_date(event["date"])
+    competition = event["competitions"][0]
+    try:
+        location = competition["venue"]["fullName"]
+    except (KeyError, TypeError):
+        location = None
+    return CalendarEvent(
+        start=start,
+        end=start + timedelta(seconds=GAME_LENGTH),
+        summary=event.get("shortName") or event.get("name") or "",
+        description=event.get("name"),
+        location=location,
+        uid=event.get("id"),
+    )
+
+
+class MLBScheduleCalendar(CoordinatorEntity, CalendarEntity):
+    """A team's schedule, answered from the coordinator's cached schedule index."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the calendar."""
+        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+        self._config = entry
+        self._name = entry_config(entry)[CONF_NAME]
+        self._icon = DEFAULT_ICON
+
+    @property
+    def unique_id(self):
+        """
+        Return a unique, Home Assistant friendly identifier for this entity.
+        """
+        return f"{slugify(self._name)}_{self._config.entry_id}_calendar"
+
+    @property
+    def name(self):
+        """Return the name of the calendar."""
+        return f"{self._name} Schedule"
+
+    @property
+    def icon(self):
+        """Return the icon to use in the frontend, if any."""
+        return self._icon
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the game in progress or the next one."""
+        index = self.coordinator.team_cache.index
+        if index is None:
+            return None
+        # A game that started less than a game length ago may still be on
+        event = index.next_game(dt_util.utcnow().timestamp() - GAME_LENGTH)
+        return _calendar_event(event) if event is not None else None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the games overlapping a date range, without fetching anything."""
+        index = self.coordinator.team_cache.index
+        if index is None:
+            return []
+        games = index.games_between(
+            start_date.timestamp() - GAME_LENGTH, end_date.timestamp()
+        )
+        return [_calendar_event(event) for event in games]
@@ -10,13 +10,36 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    ATTR_GROUP_BROADCASTS,
+    ATTR_GROUP_DECISIONS,
+    ATTR_GROUP_DETAILS,
+    ATTR_GROUP_LINESCORES,
+    ATTR_GROUP_ODDS,
+    ATTR_GROUP_PROBABLES,
+    ATTR_GROUP_SITUATION,
+    ATTR_GROUP_TEAMS,
+    ATTR_GROUP_VENUE,
+    ATTR_GROUP_WEATHER,
+    ATTRIBUTE_GROUPS,
+    CONF_ARCHIVE,
+    CONF_ATTRIBUTE_GROUPS,
+    CONF_FAST_REFRESH_INTERVAL,
+    CONF_MQTT_TOPIC,
+    CONF_PLAY_BY_PLAY,
+    CONF_RECORD_PAYLOADS,
+    CONF_SLOW_REFRESH_INTERVAL,
     CONF_TIMEOUT,
     CONF_TEAM_ID,
+    DEFAULT_ARCHIVE,
     DEFAULT_NAME,
+    DEFAULT_PLAY_BY_PLAY,
     DEFAULT_TIMEOUT,
     DOMAIN,
+    FAST_REFRESH_INTERVAL,
+    SLOW_REFRESH_INTERVAL,
     USER_AGENT,
 )
 
@@ -26,6 +49,19 @@ JSON_ID = "id"
 
 _LOGGER = logging.getLogger(__name__)
 
+ATTRIBUTE_GROUP_LABELS = {
+    ATTR_GROUP_DETAILS: "Game details (attendance, notes, series, headlines)",
+    ATTR_GROUP_VENUE: "Venue",
+    ATTR_GROUP_WEATHER: "Weather",
+    ATTR_GROUP_DECISIONS: "Pitcher decisions",
+    ATTR_GROUP_TEAMS: "Team names, colors, logos and records",
+    ATTR_GROUP_LINESCORES: "Line scores",
+    ATTR_GROUP_SITUATION: "At-bat situation (count, runners, batter, pitcher)",
+    ATTR_GROUP_PROBABLES: "Starting pitchers",
+    ATTR_GROUP_BROADCASTS: "TV network",
+    ATTR_GROUP_ODDS: "Odds",
+}
+
 
 def _get_schema(hass: Any, user_input: list, default_dict: list) -> Any:
     """Gets a schema using the default_dict as a backup."""
@@ -41,6 +77,34 @@ def _get_schema(hass: Any, user_input: list, default_dict: list) -> Any:
             vol.Required(CONF_TEAM_ID, default=_get_default(CONF_TEAM_ID)): str,
             vol.Optional(CONF_NAME, default=_get_default(CONF_NAME)): str,
             vol.Optional(CONF_TIMEOUT, default=_get_default(CONF_TIMEOUT)): int,
+            vol.Optional(
+                CONF_FAST_REFRESH_INTERVAL,
+                default=_get_default(CONF_FAST_REFRESH_INTERVAL) or FAST_REFRESH_INTERVAL,
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(
+                CONF_SLOW_REFRESH_INTERVAL,
+                default=_get_default(CONF_SLOW_REFRESH_INTERVAL) or SLOW_REFRESH_INTERVAL,
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(
+                CONF_PLAY_BY_PLAY, default=bool(_get_default(CONF_PLAY_BY_PLAY))
+            ): bool,
+            vol.Optional(
+                CONF_ARCHIVE, default=bool(_get_default(CONF_ARCHIVE))
+            ): bool,
+            vol.Optional(
+                CONF_MQTT_TOPIC, default=_get_default(CONF_MQTT_TOPIC) or ""
+            ): str,
+            vol.Optional(
+                CONF_RECORD_PAYLOADS, default=bool(_get_default(CONF_RECORD_PAYLOADS))
+            ): bool,
+            vol.Optional(
+                CONF_ATTRIBUTE_GROUPS,
+                default=list(
+                    ATTRIBUTE_GROUPS
+                    if _get_default(CONF_ATTRIBUTE_GROUPS) is None
+                    else _get_default(CONF_ATTRIBUTE_GROUPS)
+                ),
+            ): cv.multi_select(ATTRIBUTE_GROUP_LABELS),
         }
     )
 
@@ -123,6 +187,13 @@ class MLBScoresFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         defaults = {
             CONF_NAME: DEFAULT_NAME,
             CONF_TIMEOUT: DEFAULT_TIMEOUT,
+            CONF_FAST_REFRESH_INTERVAL: FAST_REFRESH_INTERVAL,
+            CONF_SLOW_REFRESH_INTERVAL: SLOW_REFRESH_INTERVAL,
+            CONF_PLAY_BY_PLAY: DEFAULT_PLAY_BY_PLAY,
+            CONF_ARCHIVE: DEFAULT_ARCHIVE,
+            CONF_MQTT_TOPIC: "",
+            CONF_RECORD_PAYLOADS: False,
+            CONF_ATTRIBUTE_GROUPS: list(ATTRIBUTE_GROUPS),
             CONF_TEAM_ID: self._team_list,
         }
 
@@ -144,7 +215,8 @@ class MLBScoresOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry):
         """Initialize."""
         self.config = config_entry
-        self._data = dict(config_entry.options)
+        # Start from the current settings, which may still only be in the entry data
+        self._data = {**config_entry.data, **config_entry.options}
         self._errors = {}
 
     async def async_step_init(self, user_input=None):
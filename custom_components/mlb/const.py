@@ -1,23 +1,167 @@
 # API
-API_SCOREBOARD_ENDPOINT = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
-API_TEAM_ENDPOINT = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/"
+ESPN_API_BASE = "https://site.api.espn.com/apis/site/v2/sports/"
+SPORT = "baseball"
+LEAGUE = "mlb"
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 11_6) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Safari/605.1.15"
 
 # Config
 CONF_TIMEOUT = "timeout"
 CONF_TEAM_ID = "team_id"
+CONF_PLAY_BY_PLAY = "play_by_play"
+CONF_ARCHIVE = "archive"
+CONF_ATTRIBUTE_GROUPS = "attribute_groups"
+CONF_FAST_REFRESH_INTERVAL = "fast_refresh_interval"
+CONF_SLOW_REFRESH_INTERVAL = "slow_refresh_interval"
+CONF_MQTT_TOPIC = "mqtt_topic"
+CONF_RECORD_PAYLOADS = "record_payloads"
+
+# Attribute groups, each extracted only when selected
+ATTR_GROUP_DETAILS = "details"
+ATTR_GROUP_VENUE = "venue"
+ATTR_GROUP_WEATHER = "weather"
+ATTR_GROUP_DECISIONS = "decisions"
+ATTR_GROUP_TEAMS = "teams"
+ATTR_GROUP_LINESCORES = "linescores"
+ATTR_GROUP_SITUATION = "situation"
+ATTR_GROUP_PROBABLES = "probables"
+ATTR_GROUP_BROADCASTS = "broadcasts"
+ATTR_GROUP_ODDS = "odds"
+ATTRIBUTE_GROUPS = {
+    ATTR_GROUP_DETAILS: ["attendance", "game_notes", "series_summary", "headlines"],
+    ATTR_GROUP_VENUE: ["venue_name", "venue_city", "venue_state", "venue_capacity", "venue_indoor"],
+    ATTR_GROUP_WEATHER: ["weather_conditions", "weather_temp"],
+    ATTR_GROUP_DECISIONS: [
+        "winning_pitcher", "winning_pitcher_wins", "winning_pitcher_losses", "winning_pitcher_era",
+        "losing_pitcher", "losing_pitcher_wins", "losing_pitcher_losses", "losing_pitcher_era",
+        "saving_pitcher", "saving_pitcher_saves",
+    ],
+    ATTR_GROUP_TEAMS: [
+        f"{side}_team_{key}"
+        for side in ("home", "away")
+        for key in ("city", "name", "color", "alt_color", "logo", "colors", "record")
+    ],
+    ATTR_GROUP_LINESCORES: [
+        f"{side}_team_{key}"
+        for side in ("home", "away")
+        for key in [f"ls_{inning}" for inning in range(1, 10)] + ["linescores"]
+    ],
+    ATTR_GROUP_SITUATION: [
+        "last_play", "balls", "strikes", "outs", "runner_on_1st", "runner_on_2nd",
+        "runner_on_3rd", "current_batter", "current_pitcher",
+    ],
+    ATTR_GROUP_PROBABLES: ["home_team_starting_pitcher", "away_team_starting_pitcher"],
+    ATTR_GROUP_BROADCASTS: ["tv_network"],
+    ATTR_GROUP_ODDS: ["odds", "overunder", "home_team_odds_win_pct", "away_team_odds_win_pct"],
+}
+# Attribute group cache tiers, and how long (seconds) each reuses a game's
+# values while its state doesn't change. Live groups are never reused.
+TIER_STATIC = "static"
+TIER_GAME = "game"
+TIER_PREGAME = "pregame"
+TIER_LIVE = "live"
+TIER_TTLS = {TIER_STATIC: 21600, TIER_GAME: 1800, TIER_PREGAME: 300, TIER_LIVE: 0}
+GROUP_TIERS = {
+    ATTR_GROUP_VENUE: TIER_STATIC,
+    ATTR_GROUP_TEAMS: TIER_STATIC,
+    ATTR_GROUP_DETAILS: TIER_GAME,
+    ATTR_GROUP_DECISIONS: TIER_GAME,
+    ATTR_GROUP_PROBABLES: TIER_GAME,
+    ATTR_GROUP_BROADCASTS: TIER_GAME,
+    ATTR_GROUP_WEATHER: TIER_PREGAME,
+    ATTR_GROUP_ODDS: TIER_PREGAME,
+    ATTR_GROUP_LINESCORES: TIER_LIVE,
+    ATTR_GROUP_SITUATION: TIER_LIVE,
+}
+# The results archive stores these whatever the sensor shows
+ARCHIVE_ATTRIBUTE_GROUPS = [ATTR_GROUP_DETAILS, ATTR_GROUP_VENUE, ATTR_GROUP_DECISIONS, ATTR_GROUP_LINESCORES]
+# Game events are detected from these (the pitcher, the last play and a
+# postponement's headline) whatever the sensor shows
+EVENT_ATTRIBUTE_GROUPS = [ATTR_GROUP_SITUATION, ATTR_GROUP_DETAILS]
 
 # Defaults
 DEFAULT_ICON = "mdi:baseball"
 DEFAULT_NAME = "MLB"
 DEFAULT_TIMEOUT = 180
+DEFAULT_PLAY_BY_PLAY = False
+DEFAULT_ARCHIVE = False
+PLAY_BUFFER_SIZE = 20
+TIMELINE_SIZE = 720
+# Seconds between game summary reads that are only for the win probability
+WIN_PCT_INTERVAL = 60
+BOXSCORE_CACHE_SIZE = 3
+PYTHAGOREAN_EXPONENT = 1.83
+ROLLING_GAMES = 10
+BACKFILL_CONCURRENCY = 4
+BACKFILL_RETRIES = 3
+METRICS_SAMPLE_SIZE = 100
+TRACE_BUFFER_SIZE = 50
+PROFILE_MODES = ["cprofile", "tracemalloc"]
+PROFILE_POLLS = 5
+PROFILE_TOP_STATS = 50
+TRACEMALLOC_FRAMES = 10
+ENGINE_CONCURRENCY = 4
+ENGINE_REQUEST_BUDGET = 120
+ENGINE_BUDGET_WINDOW = 60
+ENGINE_CACHE_TTL = 3
+ENGINE_CACHE_SIZE = 32
+# Scoreboard dates fetched, in days from today
+SCOREBOARD_DAYS = (-1, 0, 1)
+LEAGUE_SCOREBOARD_DAYS = (-1, 0)
+# Longest side of stored logos, in pixels, when Pillow is installed
+LOGO_SIZE = 200
+# Cap on recorded ESPN responses kept on disk, in bytes, and on responses waiting to be written
+RECORDER_MAX_BYTES = 256 * 1024 * 1024
+RECORDER_QUEUE_SIZE = 64
+
+# Refresh (seconds)
+FAST_REFRESH_INTERVAL = 5
+SLOW_REFRESH_INTERVAL = 1200
+PREGAME_WINDOW = 1200
+COUNTDOWN_INTERVAL = 60
+SCHEDULE_REFRESH_INTERVAL = 86400
+SCOREBOARD_LOOKBACK = 43200
+SCOREBOARD_DAY_TTL = 1800
+GAME_LENGTH = 14400
+LOGO_RETRY_INTERVAL = 3600
+
+# Events
+EVENT_RUN_SCORED = "mlb_run_scored"
+EVENT_LEAD_CHANGE = "mlb_lead_change"
+EVENT_INNING_CHANGE = "mlb_inning_change"
+EVENT_PITCHING_CHANGE = "mlb_pitching_change"
+EVENT_GAME_FINAL = "mlb_game_final"
+EVENT_POSTPONED = "mlb_postponed"
+EVENT_PLAY = "mlb_play"
+
+# Services
+SERVICE_GET_BOXSCORE = "get_boxscore"
+SERVICE_GET_TIMELINE = "get_timeline"
+SERVICE_QUERY_GAMES = "query_games"
+SERVICE_BACKFILL = "backfill"
+SERVICE_PROFILE = "profile"
+WS_SUBSCRIBE = "mlb/subscribe"
 
 # Misc
 TEAM_ID = ""
+LEAGUE_TEAM_ID = "ALL"
 VERSION = "0.4.2"
 ISSUE_URL = "https://github.com/tj335/hacs_mlb"
 DOMAIN = "mlb"
 PLATFORM = "sensor"
 ATTRIBUTION = "Data provided by ESPN"
 COORDINATOR = "coordinator"
-PLATFORMS = ["sensor"]
+ARCHIVE = "archive"
+ARCHIVE_FILENAME = "mlb_archive.db"
+ANALYTICS = "analytics"
+DELTAS = "deltas"
+PUBLISHER = "publisher"
+# Shared with other leagues' integrations, so deliberately not under DOMAIN
+ENGINE = "espn_scoreboard_engine"
+LOGOS = "logos"
+RECORDER = "recorder"
+LOGO_DIRECTORY = "mlb_logos"
+RECORDER_DIRECTORY = "mlb_payloads"
+LOGO_URL_PATH = "/api/mlb/logo"
+GAMES_URL_PATH = "/api/mlb/games"
+BACKFILL_CHECKPOINT_FILENAME = "mlb_backfill.json"
+PLATFORMS = ["sensor", "calendar", "image"]
@@ -0,0 +1,36 @@
+"""Diagnostics support for MLB."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import COORDINATOR, DOMAIN, PUBLISHER, RECORDER
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data[COORDINATOR]
+    index = coordinator.team_cache.index
+    return {
+        "entry": {
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "class": type(coordinator).__name__,
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": repr(coordinator.last_exception) if coordinator.last_exception else None,
+            "schedule_games": len(index) if index is not None else None,
+            "boxscores": list(coordinator.boxscores),
+            "timelines": coordinator.timelines.as_dict(),
+            "archived": coordinator.archived_games,
+        },
+        "metrics": coordinator.runtime_metrics(),
+        "engine": coordinator.engine.as_dict(),
+        "scoreboard": coordinator.scoreboard.as_dict(),
+        "publisher": entry_data[PUBLISHER].as_dict() if PUBLISHER in entry_data else None,
+        "recorder": hass.data[DOMAIN][RECORDER].as_dict() if RECORDER in hass.data[DOMAIN] else None,
+        "traces": list(coordinator.metrics.traces),
+        "data": coordinator.data,
+    }
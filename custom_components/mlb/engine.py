@@ -0,0 +1,210 @@
+"""League-agnostic scoreboard engine for the ESPN site API.
+
+The engine does the fetching, response caching and request budgeting, and
+picks polling intervals. Everything league specific (endpoints, how an event
+is parsed and when a game needs fast polling) comes from a ``League``. One
+engine is kept in ``hass.data`` under a key that isn't tied to this
+integration, so integrations for other leagues built on the same engine
+share its connection pool, budget and cache when installed together.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from datetime import timedelta
+import logging
+import time
+from typing import Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    ENGINE,
+    ENGINE_BUDGET_WINDOW,
+    ENGINE_CACHE_SIZE,
+    ENGINE_CACHE_TTL,
+    ENGINE_CONCURRENCY,
+    ENGINE_REQUEST_BUDGET,
+    ESPN_API_BASE,
+    USER_AGENT,
+)
+from .metrics import async_get_json
+from .util import seconds_until
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class League:
+    """A league's schema: where its endpoints are and how its events are parsed.
+
+    ``extract_event(event, team_id, groups)`` turns a scoreboard event into
+    sensor values, and ``refresh_rate(values, team_id)`` flags values that
+    need the fast polling interval.
+    """
+
+    def __init__(
+        self,
+        sport: str,
+        league: str,
+        extract_event: Callable | None = None,
+        refresh_rate: Callable | None = None,
+    ) -> None:
+        """Initialize."""
+        self.sport = sport
+        self.league = league
+        self.extract_event = extract_event
+        self.refresh_rate = refresh_rate
+        self.base_url = f"{ESPN_API_BASE}{sport}/{league}/"
+
+    def __repr__(self) -> str:
+        return f"<League {self.sport}/{self.league}>"
+
+    @property
+    def scoreboard_url(self) -> str:
+        """Return the scoreboard endpoint."""
+        return self.base_url + "scoreboard"
+
+    def scoreboard_date_url(self, day: str) -> str:
+        """Return the scoreboard endpoint for one date, as YYYYMMDD."""
+        return self.scoreboard_url + "?dates=" + day
+
+    def team_url(self, team_id: str) -> str:
+        """Return a team's details endpoint."""
+        return self.base_url + "teams/" + team_id
+
+    def schedule_url(self, team_id: str) -> str:
+        """Return a team's season schedule endpoint."""
+        return self.base_url + "teams/" + team_id + "/schedule"
+
+    def summary_url(self, event_id) -> str:
+        """Return an event's summary endpoint."""
+        return self.base_url + "summary?event=" + str(event_id)
+
+
+class ScoreboardEngine:
+    """One connection pool, request budget and response cache for every league.
+
+    GETs of the same URL within ``ENGINE_CACHE_TTL`` seconds, or while one is
+    already in flight, share a single request. At most ``ENGINE_CONCURRENCY``
+    requests run at once and at most ``ENGINE_REQUEST_BUDGET`` are made per
+    ``ENGINE_BUDGET_WINDOW`` seconds; past the budget, a cached response is
+    served however old it is, or the request waits for the window to move.
+
+    Cached responses are shared between callers, so treat them as read-only.
+    """
+
+    def __init__(self, session) -> None:
+        """Initialize."""
+        self.session = session
+        self.headers = {"User-Agent": USER_AGENT, "Accept": "application/ld+json"}
+        self._semaphore = asyncio.Semaphore(ENGINE_CONCURRENCY)
+        self._request_times = deque()
+        self._cache = OrderedDict()
+        self._inflight = {}
+        self.requests = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.budget_waits = 0
+        # Set while something, such as a PayloadRecorder, wants the raw responses
+        self.recorder = None
+
+    async def async_get_json(self, url: str, metrics=None, max_age: float = ENGINE_CACHE_TTL):
+        """GET a URL and decode its JSON body, or return None if the status isn't 200.
+
+        ``metrics`` only records requests that actually went out.
+        """
+        cached = self._cache.get(url)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            self.cache_hits += 1
+            return cached[1]
+        inflight = self._inflight.get(url)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[url] = future
+        try:
+            data = await self._async_fetch(url, metrics)
+        except Exception as error:
+            future.set_exception(error)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            del self._inflight[url]
+            # Cancelled: release the callers sharing this request rather than leave them waiting
+            if not future.done():
+                future.cancel()
+
+    async def _async_fetch(self, url: str, metrics):
+        # Wait for the budget before taking a connection, so a request waiting
+        # for the window to move doesn't hold up ones that are in budget
+        while not self._within_budget():
+            cached = self._cache.get(url)
+            if cached is not None:
+                _LOGGER.debug("Request budget spent; serving %s from the cache" % (url))
+                self.cache_hits += 1
+                return cached[1]
+            self.budget_waits += 1
+            await asyncio.sleep(self._request_times[0] + ENGINE_BUDGET_WINDOW - time.monotonic())
+        self._request_times.append(time.monotonic())
+        self.requests += 1
+        async with self._semaphore:
+            data = await async_get_json(self.session, url, self.headers, metrics, self.recorder)
+        if data is not None:
+            self._cache[url] = (time.monotonic(), data)
+            self._cache.move_to_end(url)
+            while len(self._cache) > ENGINE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return data
+
+    def _within_budget(self) -> bool:
+        """Return True if another request fits in the budget window."""
+        cutoff = time.monotonic() - ENGINE_BUDGET_WINDOW
+        while self._request_times and self._request_times[0] <= cutoff:
+            self._request_times.popleft()
+        return len(self._request_times) < ENGINE_REQUEST_BUDGET
+
+    def as_dict(self) -> dict:
+        """Return the engine's counters as plain data for diagnostics."""
+        self._within_budget()
+        return {
+            "requests": self.requests,
+            "requests_in_window": len(self._request_times),
+            "request_budget": ENGINE_REQUEST_BUDGET,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "budget_waits": self.budget_waits,
+            "cached_urls": len(self._cache),
+        }
+
+
+def poll_interval(games, fast: timedelta, slow: timedelta, pregame_window: float) -> timedelta:
+    """Return how long to wait before the next poll of a set of parsed games.
+
+    Any game flagged for fast refresh polls at ``fast``. Otherwise the slow
+    interval is cut short to wake up ``pregame_window`` seconds before the
+    next scheduled game.
+    """
+    interval = slow.total_seconds()
+    for game in games:
+        if game.get("private_fast_refresh"):
+            return fast
+        if game.get("state") == "STATUS_SCHEDULED":
+            time_to_start = seconds_until(game.get("date"))
+            if time_to_start is not None:
+                interval = min(interval, max(time_to_start - pregame_window, fast.total_seconds()))
+    return timedelta(seconds=interval)
+
+
+@callback
+def async_get_engine(hass: HomeAssistant) -> ScoreboardEngine:
+    """Return the engine shared by every league, creating it on first use."""
+    if ENGINE not in hass.data:
+        hass.data[ENGINE] = ScoreboardEngine(async_get_clientsession(hass))
+    return hass.data[ENGINE]
@@ -0,0 +1,159 @@
+"""Game transitions between consecutive MLB snapshots."""
+from __future__ import annotations
+
+import logging
+
+from .const import (
+    EVENT_GAME_FINAL,
+    EVENT_INNING_CHANGE,
+    EVENT_LEAD_CHANGE,
+    EVENT_PITCHING_CHANGE,
+    EVENT_POSTPONED,
+    EVENT_RUN_SCORED,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _as_int(value) -> int | None:
+    """Return a score as an integer, or None if it is missing."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _half(snapshot: dict) -> str | None:
+    """Return "top" or "bottom" from an inning description like "Top 3rd"."""
+    description = (snapshot.get("inning_description") or "").lower()
+    if description.startswith("top"):
+        return "top"
+    if description.startswith("bot"):
+        return "bottom"
+    return None
+
+
+def _leader(snapshot: dict) -> str | None:
+    """Return the abbreviation of the team in the lead, or None when tied."""
+    home = _as_int(snapshot.get("home_team_runs"))
+    away = _as_int(snapshot.get("away_team_runs"))
+    if home is None or away is None or home == away:
+        return None
+    return snapshot.get("home_team_abbr") if home > away else snapshot.get("away_team_abbr")
+
+
+class GameEventTracker:
+    """Compute typed transitions between consecutive snapshots of one team's game.
+
+    Only the fields needed to detect a transition are remembered, so the
+    full snapshot never has to be re-evaluated by automations.
+    """
+
+    def __init__(self, team_id: str) -> None:
+        """Initialize."""
+        self.team_id = team_id
+        self._previous = None
+        self._pitchers = {}
+
+    def update(self, snapshot: dict) -> list[tuple[str, dict]]:
+        """Remember the new snapshot and return the (event type, data) pairs it produced."""
+        previous = self._previous
+        self._previous = snapshot
+
+        if previous is None or previous.get("event_id") != snapshot.get("event_id"):
+            self._pitchers = {}
+            self._track_pitcher(snapshot)
+            return []
+
+        base = {
+            "team_id": self.team_id,
+            "event_id": snapshot.get("event_id"),
+            "event_short_name": snapshot.get("event_short_name"),
+        }
+        events = []
+
+        old_home = _as_int(previous.get("home_team_runs"))
+        old_away = _as_int(previous.get("away_team_runs"))
+        new_home = _as_int(snapshot.get("home_team_runs"))
+        new_away = _as_int(snapshot.get("away_team_runs"))
+        for side, old_runs, new_runs in (
+            ("home", old_home, new_home),
+            ("away", old_away, new_away),
+        ):
+            if old_runs is not None and new_runs is not None and new_runs > old_runs:
+                last_play = snapshot.get("last_play") or ""
+                events.append((EVENT_RUN_SCORED, {
+                    **base,
+                    "team": snapshot.get(f"{side}_team_abbr"),
+                    "runs": new_runs - old_runs,
+                    "home_team_runs": new_home,
+                    "away_team_runs": new_away,
+                    "inning": snapshot.get("inning"),
+                    "home_run": "homer" in last_play.lower() or "home run" in last_play.lower(),
+                    "last_play": snapshot.get("last_play"),
+                }))
+
+        old_leader = _leader(previous)
+        new_leader = _leader(snapshot)
+        if new_leader is not None and new_leader != old_leader:
+            events.append((EVENT_LEAD_CHANGE, {
+                **base,
+                "leader": new_leader,
+                "previous_leader": old_leader,
+                "home_team_runs": new_home,
+                "away_team_runs": new_away,
+                "inning": snapshot.get("inning"),
+            }))
+
+        half = _half(snapshot)
+        if half is not None and (
+            half != _half(previous) or snapshot.get("inning") != previous.get("inning")
+        ):
+            events.append((EVENT_INNING_CHANGE, {
+                **base,
+                "inning": snapshot.get("inning"),
+                "half": half,
+            }))
+
+        pitching_change = self._track_pitcher(snapshot)
+        if pitching_change is not None:
+            events.append((EVENT_PITCHING_CHANGE, {**base, **pitching_change}))
+
+        state = snapshot.get("state")
+        if state != previous.get("state"):
+            if state == "STATUS_FINAL":
+                events.append((EVENT_GAME_FINAL, {
+                    **base,
+                    "home_team_runs": new_home,
+                    "away_team_runs": new_away,
+                    "win_or_loss": snapshot.get("win_or_loss"),
+                }))
+            elif state == "STATUS_POSTPONED":
+                events.append((EVENT_POSTPONED, {
+                    **base,
+                    "date": snapshot.get("date"),
+                    "headlines": snapshot.get("headlines"),
+                }))
+
+        if events:
+            _LOGGER.debug("Transitions for %s: %s", self.team_id, [e[0] for e in events])
+        return events
+
+    def _track_pitcher(self, snapshot: dict) -> dict | None:
+        """Remember the pitcher for the fielding team and report when it changes."""
+        half = _half(snapshot)
+        pitcher = snapshot.get("current_pitcher")
+        if half is None or pitcher is None:
+            return None
+        # The home team pitches in the top of the inning
+        side = "home" if half == "top" else "away"
+        previous = self._pitchers.get(side)
+        self._pitchers[side] = pitcher
+        if previous is None or previous == pitcher:
+            return None
+        return {
+            "team": snapshot.get(f"{side}_team_abbr"),
+            "pitcher": pitcher,
+            "previous_pitcher": previous,
+            "inning": snapshot.get("inning"),
+        }
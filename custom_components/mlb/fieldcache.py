@@ -0,0 +1,59 @@
+"""Reuse slow-changing attribute groups between polls."""
+from __future__ import annotations
+
+from .const import ATTRIBUTE_GROUPS, GROUP_TIERS, TIER_TTLS
+
+
+class GroupCache:
+    """Attribute groups extracted for each game, reused until their tier's TTL runs out.
+
+    Every group belongs to a tier in ``GROUP_TIERS`` and is reused for that
+    tier's TTL, unless the game's state changes first: the first pitch and the
+    final are when most of these fields change. Live groups have no TTL and are
+    extracted on every poll.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._games = {}
+
+    def split(self, event_id, state, groups, now: float) -> tuple[set, dict]:
+        """Return the groups of a game that need extracting, and the cached values of the rest."""
+        game = self._games.get(event_id)
+        if game is None or game["state"] != state:
+            return set(groups), {}
+        fresh = set()
+        cached = {}
+        for expires, tier_groups, values in game["tiers"].values():
+            if expires > now:
+                fresh.update(tier_groups)
+                cached.update(values)
+        return set(groups) - fresh, cached
+
+    def store(self, event_id, state, values: dict, groups, now: float) -> None:
+        """Remember the groups of a game that were just extracted.
+
+        The groups of a tier are stored together, so they also expire together.
+        """
+        game = self._games.get(event_id)
+        if game is None or game["state"] != state:
+            game = self._games[event_id] = {"state": state, "tiers": {}}
+        tiers = {}
+        for group in groups:
+            tiers.setdefault(GROUP_TIERS[group], []).append(group)
+        for tier, tier_groups in tiers.items():
+            if TIER_TTLS[tier]:
+                game["tiers"][tier] = (
+                    now + TIER_TTLS[tier],
+                    tier_groups,
+                    {key: values[key] for group in tier_groups for key in ATTRIBUTE_GROUPS[group] if key in values},
+                )
+
+    def clear(self) -> None:
+        """Forget every game, for when the selected groups change."""
+        self._games.clear()
+
+    def retain(self, event_ids) -> None:
+        """Forget every game but these."""
+        for event_id in [event_id for event_id in self._games if event_id not in event_ids]:
+            del self._games[event_id]
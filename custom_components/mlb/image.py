@@ -0,0 +1,101 @@
+"""Team logos for MLB, served from the local logo cache."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_ATTRIBUTION, CONF_NAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util, slugify
+
+from . import entry_config, is_league_mode
+from .const import ATTRIBUTION, CONF_TEAM_ID, COORDINATOR, DOMAIN
+from .logos import async_get_logo_cache, content_type
+
+_LOGGER = logging.getLogger(__name__)
+
+SIDES = {"team": "Logo", "opponent": "Opponent Logo"}
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Setup the image platform."""
+    if is_league_mode(entry_config(entry)):
+        return
+    async_add_entities([MLBLogoImage(hass, entry, side) for side in SIDES])
+
+
+class MLBLogoImage(CoordinatorEntity, ImageEntity):
+    """The logo of the tracked team, or of its opponent, in the current or next game."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, side: str) -> None:
+        """Initialize the image."""
+        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+        ImageEntity.__init__(self, hass)
+        self._config = entry
+        self._name = entry_config(entry)[CONF_NAME]
+        self._side = side
+        self._logos = async_get_logo_cache(hass)
+        self._filename = None
+        self._attr_extra_state_attributes = {ATTR_ATTRIBUTION: ATTRIBUTION}
+        self._update_filename()
+
+    @property
+    def unique_id(self):
+        """
+        Return a unique, Home Assistant friendly identifier for this entity.
+        """
+        return f"{slugify(self._name)}_{self._config.entry_id}_{self._side}_logo"
+
+    @property
+    def name(self):
+        """Return the name of the image."""
+        return f"{self._name} {SIDES[self._side]}"
+
+    @property
+    def available(self) -> bool:
+        """Return True once the logo is cached."""
+        return super().available and self._filename is not None
+
+    @property
+    def content_type(self) -> str:
+        """Return the content type of the cached logo."""
+        return content_type(self._filename) if self._filename else "image/png"
+
+    def _logo_url(self) -> str | None:
+        """Return the upstream URL of the logo this entity shows."""
+        data = self.coordinator.data or {}
+        team_id = str(self.coordinator.config[CONF_TEAM_ID]).upper()
+        home = str(data.get("home_team_abbr") or "").upper() == team_id
+        if self._side == "opponent":
+            home = not home
+        return data.get("home_team_logo" if home else "away_team_logo")
+
+    def _update_filename(self) -> None:
+        filename = self._logos.filename(self._logo_url())
+        if filename != self._filename:
+            self._filename = filename
+            self._attr_image_last_updated = dt_util.utcnow() if filename else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Point at a new file only when the logo changes, so clients keep their copy."""
+        self._update_filename()
+        super()._handle_coordinator_update()
+
+    async def async_image(self) -> bytes | None:
+        """Return the cached logo."""
+        if self._filename is None:
+            return None
+        path = self._logos.path(self._filename)
+        try:
+            return await self.hass.async_add_executor_job(_read, path)
+        except OSError as error:
+            _LOGGER.debug("Unable to read logo %s: %s", path, error)
+            return None
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as logo:
+        return logo.read()
@@ -0,0 +1,241 @@
+"""Local cache of team logos, served with long-lived cache headers."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import time
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    LOGO_DIRECTORY,
+    LOGO_RETRY_INTERVAL,
+    LOGO_SIZE,
+    LOGO_URL_PATH,
+    LOGOS,
+)
+from .engine import async_get_engine
+
+_LOGGER = logging.getLogger(__name__)
+
+LOGO_KEYS = ("home_team_logo", "away_team_logo")
+INDEX_FILENAME = "index.json"
+
+# Only raster images are stored, so nothing served from Home Assistant's origin can run script
+_IMAGE_TYPES = {
+    b"\x89PNG\r\n\x1a\n": (".png", "image/png"),
+    b"\xff\xd8\xff": (".jpg", "image/jpeg"),
+    b"GIF87a": (".gif", "image/gif"),
+    b"GIF89a": (".gif", "image/gif"),
+}
+_FILENAME = re.compile(r"^[0-9a-f]{16}\.(png|jpg|gif)$")
+
+
+def image_type(content: bytes) -> tuple[str, str] | None:
+    """Return the file extension and content type of a raster image, from its magic bytes."""
+    for magic, kind in _IMAGE_TYPES.items():
+        if content.startswith(magic):
+            return kind
+    return None
+
+
+def content_type(filename: str) -> str:
+    """Return the content type of a stored logo."""
+    extension = os.path.splitext(filename)[1]
+    return next(kind[1] for kind in _IMAGE_TYPES.values() if kind[0] == extension)
+
+
+def resize(content: bytes, size: int) -> bytes:
+    """Shrink an image to fit in a square of ``size`` pixels, if Pillow is installed."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return content
+    with Image.open(io.BytesIO(content)) as image:
+        if max(image.size) <= size:
+            return content
+        image.thumbnail((size, size))
+        output = io.BytesIO()
+        image.save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
+
+class LogoCache:
+    """Team logos downloaded once and stored on disk under a hash of their content.
+
+    A logo that changes upstream gets a new file name, so clients can cache
+    every file forever. The URL-to-file index is kept next to the files, so
+    logos survive restarts without being downloaded again.
+    """
+
+    def __init__(self, directory: str, session) -> None:
+        """Initialize."""
+        self.directory = directory
+        self.session = session
+        self._files = None
+        self._failed = {}
+        self._pending = {}
+        self._index_lock = asyncio.Lock()
+
+    def local_url(self, url: str | None) -> str | None:
+        """Return the local URL of a logo, or None if it isn't cached."""
+        filename = self.filename(url)
+        return f"{LOGO_URL_PATH}/{filename}" if filename is not None else None
+
+    def filename(self, url: str | None) -> str | None:
+        """Return the file a logo is stored in, or None if it isn't cached."""
+        if not url or self._files is None:
+            return None
+        return self._files.get(url)
+
+    def path(self, filename: str) -> str:
+        """Return the path of a stored logo."""
+        return os.path.join(self.directory, filename)
+
+    async def async_localize(self, hass: HomeAssistant, games) -> None:
+        """Add the local URL of each game's logos, downloading logos seen for the first time."""
+        if self._files is None:
+            self._files = await hass.async_add_executor_job(self._load)
+        now = time.monotonic()
+        missing = {
+            game.get(key)
+            for game in games
+            for key in LOGO_KEYS
+            if game.get(key) and game.get(key) not in self._files
+        }
+        missing = [
+            url for url in missing
+            if now - self._failed.get(url, -LOGO_RETRY_INTERVAL) >= LOGO_RETRY_INTERVAL
+        ]
+        if missing:
+            await asyncio.gather(*(self._async_fetch(hass, url) for url in missing))
+            if any(url in self._files for url in missing):
+                await self._async_save_index(hass)
+        for game in games:
+            for key in LOGO_KEYS:
+                if key in game:
+                    game[key + "_local"] = self.local_url(game[key])
+
+    async def _async_fetch(self, hass: HomeAssistant, url: str) -> None:
+        """Download a logo, sharing the download with anyone already waiting on it."""
+        if url not in self._pending:
+            self._pending[url] = hass.async_create_task(self._async_download(hass, url))
+        await asyncio.shield(self._pending[url])
+
+    async def _async_download(self, hass: HomeAssistant, url: str) -> None:
+        try:
+            async with self.session.get(url) as r:
+                r.raise_for_status()
+                content = await r.read()
+            filename = await hass.async_add_executor_job(self._store, content)
+        except Exception as error:
+            _LOGGER.debug("Unable to cache logo %s: %s" % (url, error))
+            self._failed[url] = time.monotonic()
+            return
+        finally:
+            self._pending.pop(url, None)
+        self._files[url] = filename
+        self._failed.pop(url, None)
+        _LOGGER.debug("Cached logo %s as %s" % (url, filename))
+
+    async def _async_save_index(self, hass: HomeAssistant) -> None:
+        """Write the index from the live URL-to-file map, one writer at a time.
+
+        The map is copied once the lock is held, so a write never replaces the
+        index with an older copy missing logos another download just added.
+        """
+        async with self._index_lock:
+            try:
+                await hass.async_add_executor_job(self._write_index, dict(self._files))
+            except OSError as error:
+                _LOGGER.warning("Unable to save logo index: %s", error)
+
+    def _load(self) -> dict:
+        """Read the index, dropping entries whose files are gone. Blocks."""
+        os.makedirs(self.directory, exist_ok=True)
+        try:
+            with open(self.path(INDEX_FILENAME), encoding="utf-8") as index:
+                files = json.load(index)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as error:
+            _LOGGER.warning("Ignoring unreadable logo index: %s", error)
+            return {}
+        return {
+            url: filename
+            for url, filename in files.items()
+            if _FILENAME.match(filename) and os.path.isfile(self.path(filename))
+        }
+
+    def _store(self, content: bytes) -> str:
+        """Write a logo under the hash of its content and return its file name. Blocks."""
+        if image_type(content) is None:
+            raise ValueError("not a PNG, JPEG or GIF image")
+        if LOGO_SIZE:
+            content = resize(content, LOGO_SIZE)
+        extension = image_type(content)[0]
+        filename = hashlib.sha256(content).hexdigest()[:16] + extension
+        path = self.path(filename)
+        if not os.path.exists(path):
+            with open(path + ".tmp", "wb") as logo:
+                logo.write(content)
+            os.replace(path + ".tmp", path)
+        return filename
+
+    def _write_index(self, files: dict) -> None:
+        """Replace the index with ``files``. Blocks."""
+        index_path = self.path(INDEX_FILENAME)
+        with open(index_path + ".tmp", "w", encoding="utf-8") as index:
+            json.dump(files, index)
+        os.replace(index_path + ".tmp", index_path)
+
+
+class MLBLogoView(HomeAssistantView):
+    """Serve cached logos.
+
+    No authentication is required, since the logos are public ESPN images and
+    dashboard image tags can't send a token. Only file names the cache writes
+    are served.
+    """
+
+    url = LOGO_URL_PATH + "/{filename}"
+    name = "api:mlb:logo"
+    requires_auth = False
+
+    def __init__(self, cache: LogoCache) -> None:
+        """Initialize."""
+        self.cache = cache
+
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
+        """Return a logo, cacheable for a year since its name changes with its content."""
+        if not _FILENAME.match(filename):
+            raise web.HTTPNotFound()
+        path = self.cache.path(filename)
+        if not await request.app[KEY_HASS].async_add_executor_job(os.path.isfile, path):
+            raise web.HTTPNotFound()
+        return web.FileResponse(
+            path,
+            headers={
+                "Cache-Control": "public, max-age=31536000, immutable",
+                "Content-Type": content_type(filename),
+            },
+        )
+
+
+@callback
+def async_get_logo_cache(hass: HomeAssistant) -> LogoCache:
+    """Return the logo cache shared by every entry, serving it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if LOGOS not in domain_data:
+        cache = LogoCache(hass.config.path(LOGO_DIRECTORY), async_get_engine(hass).session)
+        domain_data[LOGOS] = cache
+        hass.http.register_view(MLBLogoView(cache))
+    return domain_data[LOGOS]
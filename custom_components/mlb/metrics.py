@@ -0,0 +1,207 @@
+"""Runtime metrics for MLB requests and updates."""
+from __future__ import annotations
+
+from collections import Counter, deque
+from contextlib import contextmanager
+import json
+import logging
+import math
+import time
+
+from .const import METRICS_SAMPLE_SIZE, TRACE_BUFFER_SIZE
+from .util import now_w3c
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = 3600
+
+
+def _percentile(samples: list[float], percent: float) -> float | None:
+    """Return the nearest-rank percentile of a sorted list of samples."""
+    if not samples:
+        return None
+    rank = max(0, math.ceil(percent / 100 * len(samples)) - 1)
+    return round(samples[rank], 1)
+
+
+def _summary(samples) -> dict:
+    """Return p50/p90/p99 and max, in milliseconds, of a window of samples."""
+    ordered = sorted(samples)
+    return {
+        "p50": _percentile(ordered, 50),
+        "p90": _percentile(ordered, 90),
+        "p99": _percentile(ordered, 99),
+        "max": round(ordered[-1], 1) if ordered else None,
+    }
+
+
+class FetchMetrics:
+    """Counters and recent timings for one coordinator.
+
+    Timings are kept for the last ``METRICS_SAMPLE_SIZE`` samples only, and
+    request timestamps for the last hour, so memory use stays flat.
+
+    Each poll is also traced: the time spent fetching, decoding, indexing,
+    extracting, diffing and writing state is summed per span and the last
+    ``TRACE_BUFFER_SIZE`` traces are kept.
+    """
+
+    def __init__(self, sample_size: int = METRICS_SAMPLE_SIZE) -> None:
+        """Initialize."""
+        self.fetch_ms = deque(maxlen=sample_size)
+        self.decode_ms = deque(maxlen=sample_size)
+        self.extract_ms = deque(maxlen=sample_size)
+        self.update_ms = deque(maxlen=sample_size)
+        self._request_times = deque()
+        self.requests = 0
+        self.bytes = 0
+        self.responses = Counter()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.groups_reused = 0
+        self.groups_extracted = 0
+        self.updates = 0
+        self.errors = 0
+        self.last_error = None
+        self.last_error_time = None
+        self.traces = deque(maxlen=TRACE_BUFFER_SIZE)
+        self._poll = None
+
+    def begin_poll(self) -> None:
+        """Start tracing a poll."""
+        self._poll = {
+            "start": now_w3c(),
+            "started": time.perf_counter(),
+            "requests": 0,
+            "spans": {},
+        }
+
+    def end_poll(self, success: bool) -> None:
+        """Finish tracing a poll and add it to the trace buffer."""
+        poll, self._poll = self._poll, None
+        if poll is None:
+            return
+        self.traces.append({
+            "start": poll["start"],
+            "total_ms": round((time.perf_counter() - poll["started"]) * 1000, 2),
+            "success": success,
+            "requests": poll["requests"],
+            "spans": {name: round(ms, 2) for name, ms in poll["spans"].items()},
+        })
+
+    def add_span(self, name: str, seconds: float) -> None:
+        """Add time to a span of the poll being traced."""
+        if self._poll is not None:
+            spans = self._poll["spans"]
+            spans[name] = spans.get(name, 0.0) + seconds * 1000
+
+    @contextmanager
+    def span(self, name: str):
+        """Time a block as a span of the poll being traced."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, time.perf_counter() - started)
+
+    def record_fetch(self, status: int, size: int, fetch_s: float, decode_s: float | None) -> None:
+        """Record one HTTP request."""
+        now = time.monotonic()
+        self.requests += 1
+        self._request_times.append(now)
+        self.bytes += size
+        self.responses[status] += 1
+        self.fetch_ms.append(fetch_s * 1000)
+        self.add_span("fetch", fetch_s)
+        if decode_s is not None:
+            self.decode_ms.append(decode_s * 1000)
+            self.add_span("decode", decode_s)
+        if self._poll is not None:
+            self._poll["requests"] += 1
+
+    def record_cache(self, hit: bool) -> None:
+        """Record a request that was, or wasn't, answered from a local cache."""
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    def record_groups(self, reused: int, extracted: int) -> None:
+        """Record how many attribute groups were reused from the group cache."""
+        self.groups_reused += reused
+        self.groups_extracted += extracted
+
+    def record_extract(self, extract_s: float) -> None:
+        """Record the time spent turning a response into sensor values."""
+        self.extract_ms.append(extract_s * 1000)
+        self.add_span("extract", extract_s)
+
+    def record_update(self, update_s: float) -> None:
+        """Record a successful coordinator update."""
+        self.updates += 1
+        self.update_ms.append(update_s * 1000)
+
+    def record_error(self, error: Exception) -> None:
+        """Record a failed coordinator update."""
+        self.errors += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        self.last_error_time = now_w3c()
+
+    def requests_last_hour(self) -> int:
+        """Return the number of requests made in the last hour."""
+        cutoff = time.monotonic() - HOUR
+        while self._request_times and self._request_times[0] < cutoff:
+            self._request_times.popleft()
+        return len(self._request_times)
+
+    def as_dict(self) -> dict:
+        """Return the metrics as plain data for diagnostics and attributes."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "requests": self.requests,
+            "requests_last_hour": self.requests_last_hour(),
+            "bytes_downloaded": self.bytes,
+            "responses": {str(status): count for status, count in sorted(self.responses.items())},
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": round(self.cache_hits / lookups, 3) if lookups else None,
+            "group_reuse_rate": (
+                round(self.groups_reused / (self.groups_reused + self.groups_extracted), 3)
+                if self.groups_reused + self.groups_extracted else None
+            ),
+            "fetch_ms": _summary(self.fetch_ms),
+            "decode_ms": _summary(self.decode_ms),
+            "extract_ms": _summary(self.extract_ms),
+            "update_ms": _summary(self.update_ms),
+            "updates": self.updates,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "last_error_time": self.last_error_time,
+            "last_poll": self.traces[-1] if self.traces else None,
+        }
+
+
+async def async_get_json(
+    session, url: str, headers: dict, metrics: FetchMetrics | None = None, recorder=None
+):
+    """GET a URL and decode its JSON body, or return None if the status isn't 200.
+
+    A ``recorder`` is handed the raw body of every 200 response.
+    """
+    started = time.perf_counter()
+    async with session.get(url, headers=headers) as r:
+        body = await r.read()
+        fetched = time.perf_counter()
+        data = None
+        if r.status == 200:
+            data = json.loads(body)
+            if recorder is not None:
+                recorder.record(url, body)
+    if metrics is not None:
+        metrics.record_fetch(
+            r.status,
+            len(body),
+            fetched - started,
+            time.perf_counter() - fetched if r.status == 200 else None,
+        )
+    return data
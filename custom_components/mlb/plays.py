@@ -0,0 +1,76 @@
+"""Incremental play-by-play feed for MLB."""
+from __future__ import annotations
+
+from collections import deque
+import logging
+
+from .const import PLAY_BUFFER_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _compact_play(play: dict) -> dict:
+    """Return the handful of fields we keep for a play from ESPN's game summary."""
+    period = play.get("period") or {}
+    half = (period.get("type") or "").lower()
+    return {
+        "seq": int(play["sequenceNumber"]),
+        "inning": period.get("number"),
+        "half": "top" if half.startswith("top") else "bottom" if half.startswith("bot") else half or None,
+        "type": (play.get("type") or {}).get("text"),
+        "text": play.get("text"),
+        "scoring": bool(play.get("scoringPlay")),
+        "home": play.get("homeScore"),
+        "away": play.get("awayScore"),
+    }
+
+
+class PlayFeed:
+    """Track the plays of one game, keeping a bounded buffer of the most recent ones."""
+
+    def __init__(self, maxlen: int = PLAY_BUFFER_SIZE) -> None:
+        """Initialize."""
+        self.event_id = None
+        self.cursor = -1
+        self.plays = deque(maxlen=maxlen)
+        self._primed = False
+
+    def update(self, event_id: str, summary: dict) -> list[dict]:
+        """Consume a game summary and return only the plays not seen before.
+
+        The first summary for a game only fills the buffer; plays that
+        happened before we started following the game are not reported.
+        """
+        if event_id != self.event_id:
+            self.event_id = event_id
+            self.cursor = -1
+            self.plays.clear()
+            self._primed = False
+
+        # Plays are ordered by sequence number, so walk back from the end
+        # until we reach the cursor instead of re-reading the whole game.
+        new_plays = []
+        for play in reversed(summary.get("plays") or []):
+            try:
+                sequence = int(play["sequenceNumber"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if sequence <= self.cursor:
+                break
+            new_plays.append(_compact_play(play))
+            if not self._primed and len(new_plays) == self.plays.maxlen:
+                break
+        new_plays.reverse()
+
+        if new_plays:
+            self.cursor = new_plays[-1]["seq"]
+            self.plays.extend(new_plays)
+            _LOGGER.debug("%s new plays for event %s, cursor at %s", len(new_plays), event_id, self.cursor)
+        if not self._primed:
+            self._primed = True
+            return []
+        return new_plays
+
+    def recent(self) -> list[dict]:
+        """Return the buffered plays, oldest first."""
+        return list(self.plays)
@@ -0,0 +1,132 @@
+"""On-demand profiling of MLB polls."""
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+import tracemalloc
+
+from .const import PROFILE_MODES, PROFILE_TOP_STATS, TRACEMALLOC_FRAMES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollProfiler:
+    """Capture a cProfile or tracemalloc profile over a coordinator's next few polls.
+
+    cProfile is only enabled while a poll is running, but it runs on the event
+    loop, so other tasks that run while the poll awaits show up too.
+    tracemalloc is process wide, so it compares a snapshot taken before the
+    first poll with one taken after the last.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.mode = None
+        self.remaining = 0
+        self.polls = 0
+        self._profile = None
+        self._baseline = None
+        self._started_tracing = False
+        self._enabled = False
+
+    @property
+    def active(self) -> bool:
+        """Return True while a capture is in progress."""
+        return self.mode is not None
+
+    def start(self, mode: str, polls: int) -> None:
+        """Capture the next ``polls`` polls."""
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode {mode}")
+        self.cancel()
+        self.mode = mode
+        self.polls = self.remaining = polls
+        if mode == "cprofile":
+            self._profile = cProfile.Profile()
+        else:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+                self._started_tracing = True
+            self._baseline = tracemalloc.take_snapshot()
+
+    def poll_started(self) -> None:
+        """Enable the profiler for a poll."""
+        if self.mode != "cprofile" or self.remaining <= 0:
+            return
+        try:
+            self._profile.enable()
+            self._enabled = True
+        except ValueError as error:
+            # Another profiler, such as Home Assistant's own, is already running
+            _LOGGER.warning("Unable to start profiling: %s", error)
+            self.cancel()
+
+    def poll_finished(self) -> bool:
+        """Disable the profiler after a poll, returning True once the last poll is captured."""
+        if self._enabled:
+            self._profile.disable()
+            self._enabled = False
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return self.remaining == 0
+
+    def dump(self, path: str) -> list[str]:
+        """Write the finished capture next to ``path`` and return the files written.
+
+        Blocks, so call it from the executor.
+        """
+        files = []
+        if self.mode == "cprofile":
+            self._profile.dump_stats(path + ".prof")
+            files.append(path + ".prof")
+            report = self._cprofile_report()
+        else:
+            report = self._tracemalloc_report()
+        with open(path + ".txt", "w", encoding="utf-8") as output:
+            output.write(report)
+        files.append(path + ".txt")
+        self.cancel()
+        return files
+
+    def cancel(self) -> None:
+        """Stop any capture in progress without a report."""
+        if self._enabled:
+            self._profile.disable()
+            self._enabled = False
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self.mode = None
+        self.remaining = 0
+        self._profile = None
+        self._baseline = None
+
+    def _cprofile_report(self) -> str:
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        stream.write(f"cProfile of {self.polls} polls, sorted by cumulative time\n\n")
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP_STATS)
+        return stream.getvalue()
+
+    def _tracemalloc_report(self) -> str:
+        if not tracemalloc.is_tracing():
+            return "tracemalloc was stopped before the capture finished\n"
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ]
+        snapshot = tracemalloc.take_snapshot().filter_traces(filters)
+        baseline = self._baseline.filter_traces(filters)
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [
+            f"tracemalloc over {self.polls} polls: {current / 1024:.1f} KiB traced now, {peak / 1024:.1f} KiB peak",
+            f"Top {PROFILE_TOP_STATS} allocation changes by line:",
+            "",
+        ]
+        for stat in snapshot.compare_to(baseline, "lineno")[:PROFILE_TOP_STATS]:
+            lines.append(str(stat))
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,135 @@
+"""Optional MQTT publisher of MLB games.
+
+Only imported when an entry has an MQTT topic, so Home Assistant's MQTT
+integration isn't loaded for everyone else.
+"""
+from __future__ import annotations
+
+from collections import deque
+import logging
+
+import voluptuous as vol
+from homeassistant.components import mqtt
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+
+from .websocket_api import game_changes, games_of
+
+_LOGGER = logging.getLogger(__name__)
+
+# Changes every poll, so it alone doesn't make a game worth republishing
+IGNORED_CHANGES = {"last_update"}
+
+ONLINE = b"online"
+OFFLINE = b"offline"
+
+
+class MqttPublisher:
+    """Publish one entry's games to MQTT whenever they change.
+
+    Under the entry's topic prefix:
+
+    - ``status`` is ``online`` or ``offline``, retained.
+    - ``games/<event_id>`` is the game's fields without nulls, retained, so a
+      new subscriber gets every game at once. It is cleared when the game
+      leaves the entry's data.
+    - ``games/<event_id>/diff`` is only the fields that changed, with null for
+      fields that are gone. It isn't retained, since it only makes sense on
+      top of the snapshot before it.
+
+    Games that didn't change in an update, apart from ``last_update``,
+    publish nothing.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator, prefix: str) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.prefix = prefix.strip("/")
+        self._games = {}
+        self._unsub = None
+        self._queue = deque()
+        self._task = None
+        self.messages = 0
+        self.bytes = 0
+        self.errors = 0
+
+    async def async_start(self) -> bool:
+        """Start publishing, returning False if MQTT isn't set up or the topic is invalid."""
+        try:
+            mqtt.valid_publish_topic(self.topic("status"))
+        except vol.Invalid as error:
+            _LOGGER.warning("Not publishing games to MQTT topic %s: %s", self.prefix, error)
+            return False
+        if not await mqtt.async_wait_for_mqtt_client(self.hass):
+            _LOGGER.warning("MQTT is not available; not publishing games to %s", self.prefix)
+            return False
+        self._unsub = self.coordinator.async_add_listener(self._async_update)
+        self._async_queue([(self.topic("status"), ONLINE, True)])
+        self._async_update()
+        return True
+
+    async def async_stop(self) -> None:
+        """Stop publishing and mark the entry offline."""
+        if self._unsub is None:
+            return
+        self._unsub()
+        self._unsub = None
+        self._async_queue([(self.topic("status"), OFFLINE, True)])
+        await self._task
+
+    def topic(self, *parts: str) -> str:
+        """Return a topic under the entry's prefix."""
+        return "/".join((self.prefix, *parts))
+
+    @callback
+    def _async_update(self) -> None:
+        """Publish the games that changed in this update."""
+        games = games_of(self.coordinator.data)
+        messages = []
+        for event_id, game in games.items():
+            old = self._games.get(event_id)
+            changes = game_changes(old or {}, game)
+            if not changes.keys() - IGNORED_CHANGES:
+                continue
+            snapshot = {key: value for key, value in game.items() if value is not None}
+            messages.append((self.topic("games", event_id), json_bytes(snapshot), True))
+            if old is not None:
+                messages.append((self.topic("games", event_id, "diff"), json_bytes(changes), False))
+        for event_id in self._games:
+            if event_id not in games:
+                # An empty retained message clears the retained snapshot
+                messages.append((self.topic("games", event_id), b"", True))
+        self._games = games
+        if messages:
+            self._async_queue(messages)
+
+    @callback
+    def _async_queue(self, messages) -> None:
+        """Queue messages behind any still being published, so diffs never overtake their snapshot."""
+        self._queue.extend(messages)
+        if self._task is None or self._task.done():
+            self._task = self.hass.async_create_task(self._async_publish())
+
+    async def _async_publish(self) -> None:
+        """Publish queued messages in order, logging rather than raising on failures."""
+        while self._queue:
+            topic, payload, retain = self._queue.popleft()
+            try:
+                await mqtt.async_publish(self.hass, topic, payload, qos=0, retain=retain)
+            except Exception as error:
+                self.errors += 1
+                _LOGGER.debug("Unable to publish to %s: %s", topic, error)
+                continue
+            self.messages += 1
+            self.bytes += len(payload)
+
+    def as_dict(self) -> dict:
+        """Return the publisher's counters as plain data for diagnostics."""
+        return {
+            "prefix": self.prefix,
+            "games": len(self._games),
+            "messages": self.messages,
+            "bytes": self.bytes,
+            "errors": self.errors,
+        }
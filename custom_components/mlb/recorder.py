@@ -0,0 +1,285 @@
+"""Opt-in recorder of raw ESPN responses, for building fixture corpora."""
+from __future__ import annotations
+
+from collections import deque
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, RECORDER, RECORDER_DIRECTORY, RECORDER_MAX_BYTES, RECORDER_QUEUE_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+HISTORY = "history"
+SCOREBOARD = "scoreboard"
+INDEX_FILENAME = "index.jsonl"
+EXTENSION = ".json.gz"
+
+_DATES = re.compile(r"[?&]dates=(\d{8})(?:&|$)")
+
+
+def payload_kind(path: str) -> str:
+    """Return which endpoint a path under the league's base URL is, eg. scoreboard, teams or summary."""
+    return re.split(r"[/?]", path, maxsplit=1)[0] or "unknown"
+
+
+def write_atomic(path: str, content: bytes) -> None:
+    """Write a file so readers never see it half written."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(content)
+    os.replace(temp_path, path)
+
+
+def iter_history(directory: str):
+    """Yield each recorded response's index entry and body, oldest first.
+
+    ``directory`` is the recorder's directory. An entry for a response seen
+    on an earlier day names that day in ``day``, since the body is only stored
+    once. Entries whose file has since been rotated away are skipped.
+    """
+    history = os.path.join(directory, HISTORY)
+    try:
+        days = sorted(os.listdir(history))
+    except FileNotFoundError:
+        return
+    for day in days:
+        try:
+            with open(os.path.join(history, day, INDEX_FILENAME), encoding="utf-8") as index:
+                lines = index.readlines()
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                with gzip.open(os.path.join(history, entry.get("day", day), entry["file"]), "rb") as file:
+                    body = file.read()
+            except (OSError, ValueError, KeyError) as error:
+                _LOGGER.debug("Skipping recorded response %s: %s" % (line.strip(), error))
+                continue
+            yield entry, body
+
+
+class PayloadRecorder:
+    """Write the raw ESPN responses the engine fetches to a compressed corpus on disk.
+
+    Under ``directory``:
+
+    - ``scoreboard/YYYYMMDD.json.gz`` is the latest scoreboard page fetched
+      for each date, in the layout the backfill ``fixtures`` option reads.
+    - ``history/YYYYMMDD/`` holds every distinct response recorded that day as
+      ``HHMMSS_<kind>_<hash>.json.gz``, plus an ``index.jsonl`` with one line
+      per response giving its time, URL and file, so polls can be replayed
+      in order.
+
+    A response identical to one already in the history isn't stored again:
+    its index line points at the existing file instead.
+    Once the history passes ``max_bytes`` its oldest days are deleted; if
+    today's responses alone don't fit, recording pauses until tomorrow. The
+    scoreboard pages aren't rotated, as they are one small file per date.
+
+    Responses are queued from the fetch path and hashed, compressed and
+    written in the executor. If the writer falls ``queue_size`` responses
+    behind, new responses are dropped rather than held in memory.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        directory: str,
+        prefix: str,
+        max_bytes: int = RECORDER_MAX_BYTES,
+        queue_size: int = RECORDER_QUEUE_SIZE,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.queue_size = queue_size
+        self.entries = set()
+        self._queue = deque()
+        self._task = None
+        # Hash of every response in the history to its (day, file), and bytes used per day, oldest first
+        self._digests = None
+        self._days = None
+        # Hash of the scoreboard page last written for each date
+        self._fixtures = {}
+        self._full_day = None
+        self.recorded = 0
+        self.duplicates = 0
+        self.dropped = 0
+        self.errors = 0
+        self.bytes = 0
+
+    @callback
+    def async_attach(self, engine, entry_id: str) -> None:
+        """Start recording the engine's responses for an entry."""
+        self.entries.add(entry_id)
+        engine.recorder = self
+
+    @callback
+    def async_detach(self, engine, entry_id: str) -> None:
+        """Stop recording for an entry, and altogether once no entry wants it."""
+        self.entries.discard(entry_id)
+        if not self.entries and engine.recorder is self:
+            engine.recorder = None
+
+    @callback
+    def record(self, url: str, body: bytes) -> None:
+        """Queue a response to be written, without blocking the fetch it came from."""
+        if not url.startswith(self.prefix):
+            return
+        if len(self._queue) >= self.queue_size:
+            self.dropped += 1
+            return
+        self._queue.append((dt_util.now(), url, body))
+        if self._task is None or self._task.done():
+            self._task = self.hass.async_create_background_task(
+                self._async_write(), f"{DOMAIN} payload recorder"
+            )
+
+    async def _async_write(self) -> None:
+        """Write queued responses until the queue is empty."""
+        while self._queue:
+            batch = list(self._queue)
+            self._queue.clear()
+            await self.hass.async_add_executor_job(self._write, batch)
+
+    def _load(self) -> None:
+        """Index the history already on disk."""
+        self._digests, self._days = {}, {}
+        history = os.path.join(self.directory, HISTORY)
+        try:
+            days = sorted(os.listdir(history))
+        except FileNotFoundError:
+            return
+        for day in days:
+            path = os.path.join(history, day)
+            if not os.path.isdir(path):
+                continue
+            size = 0
+            for name in os.listdir(path):
+                size += os.path.getsize(os.path.join(path, name))
+                if name.endswith(EXTENSION):
+                    self._digests[name[:-len(EXTENSION)].rsplit("_", 1)[-1]] = (day, name)
+            self._days[day] = size
+
+    def _write(self, batch) -> None:
+        """Write a batch of responses, logging rather than raising on failures."""
+        if self._digests is None:
+            self._load()
+        for when, url, body in batch:
+            try:
+                self._write_response(when, url, body)
+            except OSError as error:
+                self.errors += 1
+                _LOGGER.warning("Unable to record %s to %s: %s", url, self.directory, error)
+
+    def _write_response(self, when, url: str, body: bytes) -> None:
+        path = url[len(self.prefix):]
+        digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+        content = None
+        match = _DATES.search(path)
+        if payload_kind(path) == SCOREBOARD and match and self._fixtures.get(match[1]) != digest:
+            content = gzip.compress(body, mtime=0)
+            write_atomic(os.path.join(self.directory, SCOREBOARD, match[1] + EXTENSION), content)
+            self._fixtures[match[1]] = digest
+
+        day = when.strftime("%Y%m%d")
+        entry = {"time": when.isoformat(), "url": url, "bytes": len(body)}
+        if digest in self._digests:
+            seen_day, filename = self._digests[digest]
+            line = self._index_line(entry, filename, seen_day, day)
+            if not self._make_room(day, len(line)):
+                self.dropped += 1
+                return
+            # Making room can rotate out the day holding the file; then store it again
+            if digest in self._digests:
+                self._append_index(day, line)
+                self.duplicates += 1
+                return
+
+        if content is None:
+            content = gzip.compress(body, mtime=0)
+        filename = f"{when:%H%M%S}_{payload_kind(path)}_{digest}{EXTENSION}"
+        line = self._index_line(entry, filename, day, day)
+        if not self._make_room(day, len(content) + len(line)):
+            self.dropped += 1
+            return
+        directory = os.path.join(self.directory, HISTORY, day)
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, filename), "wb") as file:
+            file.write(content)
+        self._append_index(day, line)
+        self._digests[digest] = (day, filename)
+        self._days[day] += len(content)
+        self.recorded += 1
+        self.bytes += len(content)
+
+    @staticmethod
+    def _index_line(entry: dict, filename: str, file_day: str, day: str) -> str:
+        """Return the index line for a response stored in ``file_day``'s directory."""
+        entry = {**entry, "file": filename}
+        if file_day != day:
+            entry["day"] = file_day
+        return json.dumps(entry) + "\n"
+
+    def _append_index(self, day: str, line: str) -> None:
+        """Add a line to a day's index, so every poll is replayed in order."""
+        directory = os.path.join(self.directory, HISTORY, day)
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, INDEX_FILENAME), "a", encoding="utf-8") as index:
+            index.write(line)
+        self._days[day] = self._days.get(day, 0) + len(line)
+
+    def _make_room(self, day: str, size: int) -> bool:
+        """Delete the oldest days of history until ``size`` more bytes fit, returning False if they can't."""
+        while sum(self._days.values()) + size > self.max_bytes:
+            oldest = next(iter(self._days), None)
+            if oldest is None or oldest == day:
+                if self._full_day != day:
+                    self._full_day = day
+                    _LOGGER.warning(
+                        "Recorded responses in %s reached %s bytes; pausing until tomorrow",
+                        self.directory, self.max_bytes,
+                    )
+                return False
+            _LOGGER.debug("Rotating out responses recorded on %s" % (oldest))
+            shutil.rmtree(os.path.join(self.directory, HISTORY, oldest), ignore_errors=True)
+            del self._days[oldest]
+            self._digests = {
+                digest: seen for digest, seen in self._digests.items() if seen[0] != oldest
+            }
+        return True
+
+    def as_dict(self) -> dict:
+        """Return the recorder's counters as plain data for diagnostics."""
+        return {
+            "directory": self.directory,
+            "entries": len(self.entries),
+            "recorded": self.recorded,
+            "bytes": self.bytes,
+            "history_bytes": sum(self._days.values()) if self._days is not None else None,
+            "duplicates": self.duplicates,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "queued": len(self._queue),
+        }
+
+
+@callback
+def async_get_recorder(hass: HomeAssistant, prefix: str) -> PayloadRecorder:
+    """Return the recorder shared by every entry, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if RECORDER not in domain_data:
+        domain_data[RECORDER] = PayloadRecorder(hass, hass.config.path(RECORDER_DIRECTORY), prefix)
+    return domain_data[RECORDER]
@@ -0,0 +1,173 @@
+"""Season schedule cache for a league's teams."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+import logging
+import time
+
+from .const import GAME_LENGTH, SCHEDULE_REFRESH_INTERVAL
+from .util import parse_date
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _slim_competitor(competitor: dict) -> dict:
+    """Keep only the competitor fields used to describe an upcoming game."""
+    team = competitor.get("team") or {}
+    return {
+        "homeAway": competitor.get("homeAway"),
+        "team": {
+            "abbreviation": team.get("abbreviation"),
+            "id": team.get("id"),
+            "location": team.get("location"),
+            "displayName": team.get("displayName"),
+            "shortDisplayName": team.get("shortDisplayName"),
+            "logos": team.get("logos") or [],
+        },
+        "probables": competitor.get("probables") or [],
+    }
+
+
+def _slim_event(event: dict) -> dict:
+    """Keep only the event fields used to describe an upcoming game.
+
+    The result has the same shape as the team API's "nextEvent" entries,
+    with the home team first.
+    """
+    competition = (event.get("competitions") or [{}])[0]
+    competitors = sorted(
+        (_slim_competitor(c) for c in competition.get("competitors") or []),
+        key=lambda c: c["homeAway"] != "home",
+    )
+    return {
+        "id": event.get("id"),
+        "date": event.get("date"),
+        "name": event.get("name"),
+        "shortName": event.get("shortName"),
+        "competitions": [{
+            "type": competition.get("type"),
+            "notes": competition.get("notes"),
+            "series": competition.get("series"),
+            "venue": competition.get("venue"),
+            "broadcasts": competition.get("broadcasts"),
+            "status": competition.get("status"),
+            "competitors": competitors,
+        }],
+    }
+
+
+class ScheduleIndex:
+    """A team's season schedule, sorted by start time for binary search.
+
+    Start times are kept in a flat array of timestamps, with opponents and
+    slimmed events in parallel lists at the same positions.
+    """
+
+    def __init__(self, team_id: str, events: list[dict]) -> None:
+        """Initialize."""
+        self.team_id = team_id
+        games = []
+        for event in events:
+            start = parse_date(event.get("date"))
+            if start is not None:
+                games.append((start.timestamp(), _slim_event(event)))
+        games.sort(key=lambda game: game[0])
+
+        self.starts = array("d", (start for start, _ in games))
+        self.events = [event for _, event in games]
+        self.opponents = [self._opponent(event) for event in self.events]
+
+    def _opponent(self, event: dict) -> str | None:
+        """Return the abbreviation of the other team in an event."""
+        for competitor in event["competitions"][0]["competitors"]:
+            if competitor["team"]["abbreviation"] != self.team_id:
+                return competitor["team"]["abbreviation"]
+        return None
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def next_game(self, timestamp: float) -> dict | None:
+        """Return the first game starting at or after the timestamp."""
+        position = bisect_left(self.starts, timestamp)
+        return self.events[position] if position < len(self.events) else None
+
+    def previous_game(self, timestamp: float) -> dict | None:
+        """Return the last game that started before the timestamp."""
+        position = bisect_left(self.starts, timestamp)
+        return self.events[position - 1] if position > 0 else None
+
+    def game_near(self, timestamp: float, before: float, after: float) -> bool:
+        """Return True if a game starts within the window around the timestamp."""
+        return bool(self.games_between(timestamp - before, timestamp + after))
+
+    def games_between(self, start: float, end: float) -> list[dict]:
+        """Return the games starting in [start, end)."""
+        return self.events[bisect_left(self.starts, start):bisect_left(self.starts, end)]
+
+
+class TeamCache:
+    """Daily cache of one team's schedule and of the team details it needs.
+
+    The team's own details (colors, records, venue) are refreshed daily, or
+    sooner once another game on the schedule has been played. Opponents'
+    details are refreshed along with the schedule, since nothing on it says
+    when an opponent last played.
+    """
+
+    def __init__(self, team_id: str, league, metrics=None) -> None:
+        """Initialize."""
+        self.team_id = team_id
+        self.league = league
+        self.metrics = metrics
+        self.index = None
+        self._index_fetched = 0.0
+        self._teams = {}
+
+    async def async_get_index(self, engine) -> ScheduleIndex | None:
+        """Return the schedule index, downloading it once a day."""
+        stale = self.index is None or time.time() - self._index_fetched > SCHEDULE_REFRESH_INTERVAL
+        if self.metrics is not None:
+            self.metrics.record_cache(not stale)
+        if stale:
+            schedule_url = self.league.schedule_url(self.team_id)
+            _LOGGER.debug("Getting schedule for %s from %s" % (self.team_id, schedule_url))
+            data = await engine.async_get_json(schedule_url, self.metrics)
+            if data is not None:
+                index_started = time.perf_counter()
+                self.index = ScheduleIndex(self.team_id, data.get("events") or [])
+                if self.metrics is not None:
+                    self.metrics.add_span("index", time.perf_counter() - index_started)
+                self._index_fetched = time.time()
+                _LOGGER.debug("Indexed %s games for %s" % (len(self.index), self.team_id))
+        return self.index
+
+    async def async_get_team(self, engine, team_id: str) -> dict:
+        """Return the team API details for a team, downloading them at most once a day."""
+        marker = None
+        if team_id != self.team_id:
+            marker = self._index_fetched
+        elif self.index is not None:
+            # Records only change once a game is over
+            previous = self.index.previous_game(time.time() - GAME_LENGTH)
+            marker = previous["id"] if previous is not None else None
+
+        cached = self._teams.get(team_id)
+        stale = (
+            cached is None
+            or time.time() - cached[1] > SCHEDULE_REFRESH_INTERVAL
+            or cached[2] != marker
+        )
+        if self.metrics is not None:
+            self.metrics.record_cache(not stale)
+        if stale:
+            team_url = self.league.team_url(team_id)
+            _LOGGER.debug(team_url)
+            data = await engine.async_get_json(team_url, self.metrics)
+            if data is not None:
+                cached = (data["team"], time.time(), marker)
+                self._teams[team_id] = cached
+        if cached is None:
+            raise ValueError(f"Unable to get team details for {team_id}")
+        return cached[0]
@@ -0,0 +1,162 @@
+"""Dated scoreboard pages for a rolling window of days around today."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+import time
+
+from homeassistant.util import dt as dt_util
+
+from .const import ENGINE_CACHE_TTL, PREGAME_WINDOW, SCOREBOARD_DAY_TTL, SCOREBOARD_DAYS
+from .util import parse_date
+
+_LOGGER = logging.getLogger(__name__)
+
+FINAL_STATUSES = {"STATUS_FINAL", "STATUS_POSTPONED", "STATUS_CANCELED", "STATUS_FORFEIT"}
+
+
+def event_state(event: dict) -> str:
+    """Return whether an event is still to come ("pre"), under way ("in") or over ("post")."""
+    try:
+        status_type = event["competitions"][0]["status"]["type"]
+    except (KeyError, IndexError, TypeError):
+        status_type = (event.get("status") or {}).get("type") or {}
+    if status_type.get("state") in ("pre", "in", "post"):
+        return status_type["state"]
+    name = status_type.get("name")
+    if name == "STATUS_SCHEDULED":
+        return "pre"
+    return "post" if name in FINAL_STATUSES else "in"
+
+
+def event_start(event: dict) -> float:
+    """Return an event's start time as a timestamp, or 0 if it has none."""
+    start = parse_date(event.get("date"))
+    return start.timestamp() if start is not None else 0
+
+
+def day_max_age(page: dict | None, past: bool, live_age: float, now: float) -> float | None:
+    """Return how old a day's page may be before it is fetched again, or None if it can't change.
+
+    Pages not fetched yet, or with a game under way or about to start,
+    follow the entry's live cache age. A past day whose games are all over is kept as it is. Any
+    other day only changes when the schedule does.
+    """
+    if page is None:
+        return live_age
+    states = [event_state(event) for event in page.get("events") or []]
+    if past and all(state == "post" for state in states):
+        return None
+    for event, state in zip(page.get("events") or [], states):
+        if state == "in" or (state == "pre" and event_start(event) - now <= PREGAME_WINDOW):
+            return live_age
+    return SCOREBOARD_DAY_TTL
+
+
+def pick_team_event(events, team_id: str, now: float, lookback: float) -> dict | None:
+    """Return the game to show for a team out of a window of scoreboard events.
+
+    A game under way wins, then one about to start, then one that finished
+    within ``lookback`` seconds, then the next game and finally the last one.
+    """
+    games = [event for event in events if team_id in event.get("shortName", "")]
+    if not games:
+        return None
+    upcoming = []
+    finished = []
+    for event in sorted(games, key=event_start):
+        state = event_state(event)
+        if state == "in":
+            return event
+        (upcoming if state == "pre" else finished).append(event)
+    if upcoming and event_start(upcoming[0]) - now <= PREGAME_WINDOW:
+        return upcoming[0]
+    if finished and now - event_start(finished[-1]) <= lookback:
+        return finished[-1]
+    return upcoming[0] if upcoming else finished[-1]
+
+
+class ScoreboardWindow:
+    """A league's dated scoreboards from ``days`` days around today, in local time.
+
+    Each day's page is kept separately and only fetched again once it is
+    older than that day allows: finished past days never are, days with a
+    live game follow the live cache age and the rest follow the schedule.
+    The window rolls over at local midnight, dropping days that left it.
+    """
+
+    def __init__(self, league, days=SCOREBOARD_DAYS) -> None:
+        """Initialize."""
+        self.league = league
+        self.days = tuple(days)
+        self._pages = {}
+
+    def dates(self) -> list[str]:
+        """Return the dates in the window as YYYYMMDD, oldest first."""
+        today = dt_util.now().date()
+        return [(today + timedelta(days=offset)).strftime("%Y%m%d") for offset in self.days]
+
+    @property
+    def today(self) -> str:
+        """Return today's date as YYYYMMDD, in local time."""
+        return dt_util.now().strftime("%Y%m%d")
+
+    async def async_update(self, engine, metrics=None, live_age: float = ENGINE_CACHE_TTL) -> None:
+        """Fetch the pages that may have changed, raising if today's can't be had."""
+        dates = self.dates()
+        today = self.today
+        self._pages = {day: page for day, page in self._pages.items() if day in dates}
+        now = time.time()
+        stale = {}
+        for day in dates:
+            page = self._pages[day][1] if day in self._pages else None
+            max_age = day_max_age(page, day < today, live_age, now)
+            if max_age is not None:
+                stale[day] = max_age
+        results = await asyncio.gather(
+            *(
+                engine.async_get_json(self.league.scoreboard_date_url(day), metrics, max_age)
+                for day, max_age in stale.items()
+            ),
+            return_exceptions=True,
+        )
+        for day, result in zip(stale, results):
+            if isinstance(result, Exception) or result is None:
+                _LOGGER.debug("Unable to get the scoreboard for %s: %s" % (day, result))
+                if day == today and day not in self._pages:
+                    raise ValueError(f"Unable to get the scoreboard for {day}")
+                continue
+            if day not in self._pages or self._pages[day][1] is not result:
+                self._pages[day] = (now, result)
+
+    def events(self) -> list[dict]:
+        """Return every event in the window once, oldest day first."""
+        seen = set()
+        events = []
+        for day in self.dates():
+            for event in self._page_events(day):
+                if event.get("id") not in seen:
+                    seen.add(event.get("id"))
+                    events.append(event)
+        return events
+
+    def slate(self) -> list[dict]:
+        """Return today's events, plus games from other days that are still under way."""
+        today = {event.get("id") for event in self._page_events(self.today)}
+        return [
+            event for event in self.events()
+            if event.get("id") in today or event_state(event) == "in"
+        ]
+
+    def _page_events(self, day: str) -> list[dict]:
+        page = self._pages.get(day)
+        return (page[1].get("events") or []) if page is not None else []
+
+    def as_dict(self) -> dict:
+        """Return each page's age and size for diagnostics."""
+        now = time.time()
+        return {
+            day: {"age": round(now - fetched), "events": len(page.get("events") or [])}
+            for day, (fetched, page) in sorted(self._pages.items())
+        }
@@ -1,21 +1,31 @@
 import logging
 import uuid
+from datetime import timedelta
 
 import voluptuous as vol
-from homeassistant.components.sensor import PLATFORM_SCHEMA
+from homeassistant.components.sensor import (
+    PLATFORM_SCHEMA,
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
-from homeassistant.const import ATTR_ATTRIBUTION, CONF_NAME
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import config_validation as cv
+from homeassistant.const import ATTR_ATTRIBUTION, CONF_NAME, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
-from . import AlertsDataUpdateCoordinator
+from homeassistant.util import dt as dt_util, slugify
+from . import AlertsDataUpdateCoordinator, entry_config, hidden_attributes, is_league_mode
+from .util import countdown
 
 from .const import (
     ATTRIBUTION,
+    CONF_ARCHIVE,
     CONF_TIMEOUT,
     CONF_TEAM_ID,
     COORDINATOR,
+    COUNTDOWN_INTERVAL,
     DEFAULT_ICON,
     DEFAULT_NAME,
     DEFAULT_TIMEOUT,
@@ -33,6 +43,33 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 )
 
 
+# Game attributes in the order they are shown
+GAME_ATTRIBUTES = (
+    "event_id", "date", "attendance", "event_name", "event_short_name", "event_type",
+    "game_notes", "series_summary", "venue_name", "venue_city", "venue_state",
+    "venue_capacity", "venue_indoor", "inning", "inning_description",
+    "weather_conditions", "weather_temp", "winning_pitcher", "winning_pitcher_wins",
+    "winning_pitcher_losses", "winning_pitcher_era", "losing_pitcher",
+    "losing_pitcher_wins", "losing_pitcher_losses", "losing_pitcher_era",
+    "saving_pitcher", "saving_pitcher_saves", "game_status", "home_team_abbr",
+    "home_team_id", "home_team_city", "home_team_name", "home_team_color",
+    "home_team_alt_color", "home_team_logo", "home_team_logo_local", "home_team_runs",
+    "home_team_hits", "home_team_errors", "home_team_colors", "home_team_ls_1", "home_team_ls_2",
+    "home_team_ls_3", "home_team_ls_4", "home_team_ls_5", "home_team_ls_6",
+    "home_team_ls_7", "home_team_ls_8", "home_team_ls_9", "home_team_record",
+    "away_team_abbr", "away_team_id", "away_team_city", "away_team_name",
+    "away_team_color", "away_team_alt_color", "away_team_logo", "away_team_logo_local",
+    "away_team_runs", "away_team_hits", "away_team_errors", "away_team_colors", "away_team_ls_1",
+    "away_team_ls_2", "away_team_ls_3", "away_team_ls_4", "away_team_ls_5",
+    "away_team_ls_6", "away_team_ls_7", "away_team_ls_8", "away_team_ls_9",
+    "away_team_record", "tv_network", "last_play", "balls", "strikes", "outs",
+    "runner_on_1st", "runner_on_2nd", "runner_on_3rd", "current_batter",
+    "current_pitcher", "home_team_starting_pitcher", "away_team_starting_pitcher",
+    "odds", "overunder", "home_team_odds_win_pct", "away_team_odds_win_pct",
+    "headlines", "win_or_loss", "last_update",
+)
+
+
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Configuration from yaml"""
     if DOMAIN not in hass.data.keys():
@@ -56,12 +93,53 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     hass.data[DOMAIN][config.entry_id] = {
         COORDINATOR: coordinator,
     }
-    async_add_entities([MLBScoresSensor(hass, config)], True)
+    async_add_entities([MLBScoresSensor(hass, config)])
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Setup the sensor platform."""
-    async_add_entities([MLBScoresSensor(hass, entry)], True)
+    async_add_entities([MLBMetricsSensor(hass, entry)])
+    if is_league_mode(entry_config(entry)):
+        _async_setup_league(hass, entry, async_add_entities)
+        return
+    entities = [MLBScoresSensor(hass, entry)]
+    if entry_config(entry).get(CONF_ARCHIVE):
+        entities.append(MLBAnalyticsSensor(hass, entry))
+    # The coordinator has already done its first refresh
+    async_add_entities(entities)
+
+
+def _async_setup_league(hass, entry, async_add_entities) -> None:
+    """Keep one sensor per game on the scoreboard, adding and removing them as the slate changes."""
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    entities = {}
+
+    @callback
+    def _async_sync_games() -> None:
+        games = (coordinator.data or {}).get("games", {})
+
+        new_entities = [
+            MLBGameSensor(hass, entry, event_id)
+            for event_id in games
+            if event_id not in entities
+        ]
+        for entity in new_entities:
+            entities[entity.event_id] = entity
+        if new_entities:
+            _LOGGER.debug("Adding sensors for %s new games", len(new_entities))
+            async_add_entities(new_entities)
+
+        ent_reg = er.async_get(hass)
+        for event_id in [event_id for event_id in entities if event_id not in games]:
+            entity = entities.pop(event_id)
+            _LOGGER.debug("Removing sensor for game %s", event_id)
+            if entity.entity_id and ent_reg.async_get(entity.entity_id):
+                ent_reg.async_remove(entity.entity_id)
+            else:
+                hass.async_create_task(entity.async_remove())
+
+    _async_sync_games()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_games))
 
 
 class MLBScoresSensor(CoordinatorEntity):
@@ -71,7 +149,7 @@ class MLBScoresSensor(CoordinatorEntity):
         """Initialize the sensor."""
         super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
         self._config = entry
-        self._name = entry.data[CONF_NAME]
+        self._name = entry_config(entry)[CONF_NAME]
         self._icon = DEFAULT_ICON
         self._state = "PRE"
         self._date = None
@@ -163,9 +241,36 @@ class MLBScoresSensor(CoordinatorEntity):
         self._headlines = None
         self._win_or_loss = None
         self._last_update = None
-        self._team_id = entry.data[CONF_TEAM_ID]
+        self._team_id = entry_config(entry)[CONF_TEAM_ID]
+        self._countdown = None
         self.coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
-        
+
+    async def async_added_to_hass(self) -> None:
+        """Start the local countdown ticker."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_countdown_tick, timedelta(seconds=COUNTDOWN_INTERVAL)
+            )
+        )
+
+    @callback
+    def _async_countdown_tick(self, now) -> None:
+        """Rewrite the state when the countdown fields change, without fetching."""
+        if self.game_data is None:
+            return
+        if self._current_countdown() != self._countdown:
+            self.async_write_ha_state()
+
+    def _current_countdown(self) -> dict:
+        """Return the countdown fields derived from the cached start time."""
+        return countdown(self.game_data.get("date"), self.game_data.get("state"))
+
+    @property
+    def game_data(self) -> dict | None:
+        """Return the snapshot of the game this sensor reports on."""
+        return self.coordinator.data
+
     @property
     def unique_id(self):
         """
@@ -186,10 +291,10 @@ class MLBScoresSensor(CoordinatorEntity):
     @property
     def state(self):
         """Return the state of the sensor."""
-        if self.coordinator.data is None:
+        if self.game_data is None:
             return None
-        elif "state" in self.coordinator.data.keys():
-            return self.coordinator.data["state"]
+        elif "state" in self.game_data.keys():
+            return self.game_data["state"]
         else:
             return None
 
@@ -197,100 +302,22 @@ class MLBScoresSensor(CoordinatorEntity):
     def extra_state_attributes(self):
         """Return the state message."""
         attrs = {}
+        data = self.game_data
 
-        if self.coordinator.data is None:
+        if data is None:
             return attrs
 
         attrs[ATTR_ATTRIBUTION] = ATTRIBUTION
-        attrs["date"] = self.coordinator.data["date"]
-        attrs["attendance"] = self.coordinator.data["attendance"]
-        attrs["event_name"] = self.coordinator.data["event_name"]
-        attrs["event_short_name"] = self.coordinator.data["event_short_name"]
-        attrs["event_type"] = self.coordinator.data["event_type"]
-        attrs["game_notes"] = self.coordinator.data["game_notes"]
-        attrs["series_summary"] = self.coordinator.data["series_summary"]
-        attrs["venue_name"] = self.coordinator.data["venue_name"]
-        attrs["venue_city"] = self.coordinator.data["venue_city"]
-        attrs["venue_state"] = self.coordinator.data["venue_state"]
-        attrs["venue_capacity"] = self.coordinator.data["venue_capacity"]
-        attrs["venue_indoor"] = self.coordinator.data["venue_indoor"]
-        attrs["inning"] = self.coordinator.data["inning"]
-        attrs["inning_description"] = self.coordinator.data["inning_description"]
-        attrs["weather_conditions"] = self.coordinator.data["weather_conditions"]
-        attrs["weather_temp"] = self.coordinator.data["weather_temp"]
-        attrs["winning_pitcher"] = self.coordinator.data["winning_pitcher"]
-        attrs["winning_pitcher_wins"] = self.coordinator.data["winning_pitcher_wins"]
-        attrs["winning_pitcher_losses"] = self.coordinator.data["winning_pitcher_losses"]
-        attrs["winning_pitcher_era"] = self.coordinator.data["winning_pitcher_era"]
-        attrs["losing_pitcher"] = self.coordinator.data["losing_pitcher"]
-        attrs["losing_pitcher_wins"] = self.coordinator.data["losing_pitcher_wins"]
-        attrs["losing_pitcher_losses"] = self.coordinator.data["losing_pitcher_losses"]
-        attrs["losing_pitcher_era"] = self.coordinator.data["losing_pitcher_era"]
-        attrs["saving_pitcher"] = self.coordinator.data["saving_pitcher"]
-        attrs["saving_pitcher_saves"] = self.coordinator.data["saving_pitcher_saves"]
-        attrs["game_status"] = self.coordinator.data["game_status"]
-        attrs["home_team_abbr"] = self.coordinator.data["home_team_abbr"]
-        attrs["home_team_id"] = self.coordinator.data["home_team_id"]
-        attrs["home_team_city"] = self.coordinator.data["home_team_city"]
-        attrs["home_team_name"] = self.coordinator.data["home_team_name"]
-        attrs["home_team_color"] = self.coordinator.data["home_team_color"]
-        attrs["home_team_alt_color"] = self.coordinator.data["home_team_alt_color"]
-        attrs["home_team_logo"] = self.coordinator.data["home_team_logo"]
-        attrs["home_team_runs"] = self.coordinator.data["home_team_runs"]
-        attrs["home_team_hits"] = self.coordinator.data["home_team_hits"]
-        attrs["home_team_errors"] = self.coordinator.data["home_team_errors"]
-        attrs["home_team_colors"] = self.coordinator.data["home_team_colors"]
-        attrs["home_team_ls_1"] = self.coordinator.data["home_team_ls_1"]
-        attrs["home_team_ls_2"] = self.coordinator.data["home_team_ls_2"]
-        attrs["home_team_ls_3"] = self.coordinator.data["home_team_ls_3"]
-        attrs["home_team_ls_4"] = self.coordinator.data["home_team_ls_4"]
-        attrs["home_team_ls_5"] = self.coordinator.data["home_team_ls_5"]
-        attrs["home_team_ls_6"] = self.coordinator.data["home_team_ls_6"]
-        attrs["home_team_ls_7"] = self.coordinator.data["home_team_ls_7"]
-        attrs["home_team_ls_8"] = self.coordinator.data["home_team_ls_8"]
-        attrs["home_team_ls_9"] = self.coordinator.data["home_team_ls_9"]
-        attrs["home_team_record"] = self.coordinator.data["home_team_record"]
-        attrs["away_team_abbr"] = self.coordinator.data["away_team_abbr"]
-        attrs["away_team_id"] = self.coordinator.data["away_team_id"]
-        attrs["away_team_city"] = self.coordinator.data["away_team_city"]
-        attrs["away_team_name"] = self.coordinator.data["away_team_name"]
-        attrs["away_team_color"] = self.coordinator.data["away_team_color"]
-        attrs["away_team_alt_color"] = self.coordinator.data["away_team_alt_color"]
-        attrs["away_team_logo"] = self.coordinator.data["away_team_logo"]
-        attrs["away_team_runs"] = self.coordinator.data["away_team_runs"]
-        attrs["away_team_hits"] = self.coordinator.data["away_team_hits"]
-        attrs["away_team_errors"] = self.coordinator.data["away_team_errors"]
-        attrs["away_team_colors"] = self.coordinator.data["away_team_colors"]
-        attrs["away_team_ls_1"] = self.coordinator.data["away_team_ls_1"]
-        attrs["away_team_ls_2"] = self.coordinator.data["away_team_ls_2"]
-        attrs["away_team_ls_3"] = self.coordinator.data["away_team_ls_3"]
-        attrs["away_team_ls_4"] = self.coordinator.data["away_team_ls_4"]
-        attrs["away_team_ls_5"] = self.coordinator.data["away_team_ls_5"]
-        attrs["away_team_ls_6"] = self.coordinator.data["away_team_ls_6"]
-        attrs["away_team_ls_7"] = self.coordinator.data["away_team_ls_7"]
-        attrs["away_team_ls_8"] = self.coordinator.data["away_team_ls_8"]
-        attrs["away_team_ls_9"] = self.coordinator.data["away_team_ls_9"]
-        attrs["away_team_record"] = self.coordinator.data["away_team_record"]
-        attrs["first_pitch_in"] = self.coordinator.data["first_pitch_in"]
-        attrs["tv_network"] = self.coordinator.data["tv_network"]
-        attrs["last_play"] = self.coordinator.data["last_play"]
-        attrs["balls"] = self.coordinator.data["balls"]
-        attrs["strikes"] = self.coordinator.data["strikes"]
-        attrs["outs"] = self.coordinator.data["outs"]
-        attrs["runner_on_1st"] = self.coordinator.data["runner_on_1st"]
-        attrs["runner_on_2nd"] = self.coordinator.data["runner_on_2nd"]
-        attrs["runner_on_3rd"] = self.coordinator.data["runner_on_3rd"]
-        attrs["current_batter"] = self.coordinator.data["current_batter"]
-        attrs["current_pitcher"] = self.coordinator.data["current_pitcher"]
-        attrs["home_team_starting_pitcher"] = self.coordinator.data["home_team_starting_pitcher"]
-        attrs["away_team_starting_pitcher"] = self.coordinator.data["away_team_starting_pitcher"]
-        attrs["odds"] = self.coordinator.data["odds"]
-        attrs["overunder"] = self.coordinator.data["overunder"]
-        attrs["home_team_odds_win_pct"] = self.coordinator.data["home_team_odds_win_pct"]
-        attrs["away_team_odds_win_pct"] = self.coordinator.data["away_team_odds_win_pct"]
-        attrs["headlines"] = self.coordinator.data["headlines"]
-        attrs["win_or_loss"] = self.coordinator.data["win_or_loss"]
-        attrs["last_update"] = self.coordinator.data["last_update"]
+        # Groups that weren't selected are missing, or only extracted for events and the archive
+        hidden = hidden_attributes(self.coordinator.config)
+        for key in GAME_ATTRIBUTES:
+            if key in data and key not in hidden:
+                attrs[key] = data[key]
+        self._countdown = self._current_countdown()
+        attrs["first_pitch_in"] = self._countdown["first_pitch_in"]
+        attrs["game_clock"] = self._countdown["game_clock"]
+        if "recent_plays" in data:
+            attrs["recent_plays"] = data["recent_plays"]
       
         return attrs
 
@@ -298,3 +325,163 @@ class MLBScoresSensor(CoordinatorEntity):
     def available(self) -> bool:
         """Return if entity is available."""
         return self.coordinator.last_update_success
+
+
+class MLBGameSensor(MLBScoresSensor):
+    """Representation of one game's sensor in league mode."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, event_id: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(hass, entry)
+        self.event_id = event_id
+        game = self.game_data or {}
+        self._name = f"{entry_config(entry)[CONF_NAME]} {game.get('event_short_name') or event_id}"
+
+    @property
+    def game_data(self) -> dict | None:
+        """Return the snapshot of the game this sensor reports on."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data["games"].get(self.event_id)
+
+    @property
+    def unique_id(self):
+        """
+        Return a unique, Home Assistant friendly identifier for this entity.
+        """
+        return f"{slugify(entry_config(self._config)[CONF_NAME])}_{self._config.entry_id}_{self.event_id}"
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.last_update_success and self.game_data is not None
+
+
+class MLBAnalyticsSensor(CoordinatorEntity):
+    """Season analytics for a team, computed from the local results archive."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+        self._config = entry
+        self._name = entry_config(entry)[CONF_NAME]
+        self._analytics = None
+        self._key = None
+
+    @property
+    def unique_id(self):
+        """
+        Return a unique, Home Assistant friendly identifier for this entity.
+        """
+        return f"{slugify(self._name)}_{self._config.entry_id}_season"
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{self._name} Season"
+
+    @property
+    def icon(self):
+        """Return the icon to use in the frontend, if any."""
+        return "mdi:chart-line"
+
+    @property
+    def state(self):
+        """Return the season winning percentage."""
+        if self._analytics is None:
+            return None
+        return self._analytics["win_pct"]
+
+    @property
+    def extra_state_attributes(self):
+        """Return the season analytics."""
+        attrs = {ATTR_ATTRIBUTION: ATTRIBUTION}
+        if self._analytics is not None:
+            attrs.update(self._analytics)
+        return attrs
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the analytics once added, without asking the coordinator to refresh."""
+        await super().async_added_to_hass()
+        self.hass.async_create_task(self._async_handle_update())
+
+    async def async_update(self) -> None:
+        """Recompute the analytics, but only when the archive has changed."""
+        await self._async_refresh_analytics()
+
+    async def _async_refresh_analytics(self) -> bool:
+        """Return True if the analytics were recomputed."""
+        # Imported here as this sensor only exists for entries that archive games
+        from .analytics import async_get_analytics
+
+        analytics = async_get_analytics(self.hass)
+        # The team is read from the coordinator, since options can change it in place
+        team_id = self.coordinator.config[CONF_TEAM_ID].upper()
+        key = (dt_util.now().year, analytics.archive.version, team_id)
+        if key == self._key:
+            return False
+        self._key = key
+        self._analytics = await self.hass.async_add_executor_job(
+            analytics.get, key[0], team_id
+        )
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Check the archive after each poll, since a poll may have archived a final."""
+        self.hass.async_create_task(self._async_handle_update())
+
+    async def _async_handle_update(self) -> None:
+        if await self._async_refresh_analytics():
+            self.async_write_ha_state()
+
+
+class MLBMetricsSensor(CoordinatorEntity, SensorEntity):
+    """Request and update metrics for an entry, disabled by default."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+        self._config = entry
+        self._name = entry_config(entry)[CONF_NAME]
+
+    @property
+    def unique_id(self):
+        """
+        Return a unique, Home Assistant friendly identifier for this entity.
+        """
+        return f"{slugify(self._name)}_{self._config.entry_id}_fetch_latency"
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{self._name} Fetch Latency"
+
+    @property
+    def icon(self):
+        """Return the icon to use in the frontend, if any."""
+        return "mdi:timer-outline"
+
+    @property
+    def native_value(self):
+        """Return the median request latency in milliseconds."""
+        return self.coordinator.metrics.as_dict()["fetch_ms"]["p50"]
+
+    @property
+    def available(self) -> bool:
+        """Stay available when updates fail, since failures are what it reports."""
+        return True
+
+    @property
+    def extra_state_attributes(self):
+        """Return the runtime metrics."""
+        return {
+            ATTR_ATTRIBUTION: ATTRIBUTION,
+            **self.coordinator.runtime_metrics(),
+        }
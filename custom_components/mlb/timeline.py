@@ -0,0 +1,161 @@
+"""In-game time series of score, count and win probability for MLB."""
+from __future__ import annotations
+
+from array import array
+import logging
+import math
+import time
+
+from .const import TIMELINE_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Column name, array type code and the sensor value it is sampled from. The
+# win probability isn't a sensor value: it comes from the game summary.
+COLUMNS = (
+    ("inning", "b", "inning"),
+    ("home_runs", "h", "home_team_runs"),
+    ("away_runs", "h", "away_team_runs"),
+    ("home_win_pct", "f", None),
+    ("balls", "b", "balls"),
+    ("strikes", "b", "strikes"),
+    ("outs", "b", "outs"),
+)
+# Stored in integer columns for values ESPN didn't send
+MISSING = -1
+
+LIVE_STATES = {"STATUS_IN_PROGRESS", "STATUS_DELAYED", "STATUS_RAIN_DELAY"}
+
+
+def home_win_pct(summary: dict | None) -> float | None:
+    """Return the home team's latest win probability, in percent, from a game summary."""
+    try:
+        return float(summary["winprobability"][-1]["homeWinPercentage"]) * 100
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+
+def _sample(values: dict, win_pct: float | None) -> tuple:
+    """Return a game's sampled values, in column order."""
+    sample = []
+    for _, code, key in COLUMNS:
+        value = win_pct if key is None else values.get(key)
+        try:
+            value = float(value) if code == "f" else int(value)
+        except (TypeError, ValueError):
+            value = math.nan if code == "f" else MISSING
+        sample.append(value)
+    return tuple(sample)
+
+
+def empty_series() -> dict:
+    """Return the columns of a game with no samples."""
+    return {"timestamp": [], **{name: [] for name, _, _ in COLUMNS}}
+
+
+class GameTimeline:
+    """A fixed-size ring buffer of one game's samples, stored column by column.
+
+    Each column is a typed array allocated once, so a full buffer costs about
+    20 bytes a sample and appending never allocates. A sample is only added
+    when something other than the time changed; once the buffer is full the
+    oldest samples are overwritten.
+    """
+
+    def __init__(self, size: int = TIMELINE_SIZE) -> None:
+        """Initialize."""
+        self.size = size
+        self.timestamps = array("d", bytes(8 * size))
+        self.columns = {name: array(code, [0]) * size for name, code, _ in COLUMNS}
+        self.start = 0
+        self.count = 0
+        self._last = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, values: dict, timestamp: float | None = None, win_pct: float | None = None) -> bool:
+        """Sample a game's values, returning False if nothing changed since the last sample."""
+        sample = _sample(values, win_pct)
+        # The win probability is missing (NaN) on updates that didn't read the
+        # game summary, so a missing one doesn't count as a change
+        if self._last is not None and all(
+            a == b or a != a for a, b in zip(sample, self._last)
+        ):
+            return False
+        self._last = sample
+        index = (self.start + self.count) % self.size
+        if self.count == self.size:
+            self.start = (self.start + 1) % self.size
+        else:
+            self.count += 1
+        self.timestamps[index] = time.time() if timestamp is None else timestamp
+        for (name, _, _), value in zip(COLUMNS, sample):
+            self.columns[name][index] = value
+        return True
+
+    def _ordered(self, column) -> list:
+        end = self.start + self.count
+        if end <= self.size:
+            return column[self.start:end].tolist()
+        return column[self.start:].tolist() + column[:end - self.size].tolist()
+
+    def as_dict(self) -> dict:
+        """Return the samples, oldest first, as lists keyed by column with None for missing values."""
+        series = {"timestamp": [round(ts, 3) for ts in self._ordered(self.timestamps)]}
+        for name, code, _ in COLUMNS:
+            values = self._ordered(self.columns[name])
+            if code == "f":
+                series[name] = [None if math.isnan(value) else round(value, 4) for value in values]
+            else:
+                series[name] = [None if value == MISSING else value for value in values]
+        return series
+
+
+class TimelineStore:
+    """The timelines of the games a coordinator is following, keyed by event id.
+
+    Games are sampled while they are live, plus once more as they end. A
+    game's timeline is dropped when the game leaves the coordinator's data,
+    ie. when a team moves on to its next game or a game leaves the slate.
+    """
+
+    def __init__(self, size: int = TIMELINE_SIZE) -> None:
+        """Initialize."""
+        self.size = size
+        self._timelines = {}
+
+    def __contains__(self, event_id) -> bool:
+        return event_id in self._timelines
+
+    def update(self, games, win_pcts: dict | None = None) -> None:
+        """Sample each game, forgetting games that are no longer in ``games``.
+
+        ``win_pcts`` maps event ids to the home win probability read from the
+        game summary; games whose summary wasn't read get a missing value.
+        """
+        win_pcts = win_pcts or {}
+        now = time.time()
+        timelines = {}
+        for values in games:
+            event_id = values.get("event_id")
+            if event_id is None:
+                continue
+            timeline = self._timelines.get(event_id)
+            if values.get("state") in LIVE_STATES or (
+                timeline is not None and values.get("state") == "STATUS_FINAL"
+            ):
+                if timeline is None:
+                    timeline = GameTimeline(self.size)
+                timeline.append(values, now, win_pcts.get(event_id))
+            if timeline is not None:
+                timelines[event_id] = timeline
+        self._timelines = timelines
+
+    def get(self, event_id) -> GameTimeline | None:
+        """Return a game's timeline, if it has one."""
+        return self._timelines.get(event_id)
+
+    def as_dict(self) -> dict:
+        """Return the number of samples held per game for diagnostics."""
+        return {event_id: len(timeline) for event_id, timeline in self._timelines.items()}
@@ -0,0 +1,104 @@
+"""Lightweight time helpers for MLB."""
+from __future__ import annotations
+
+from datetime import datetime
+from functools import lru_cache
+
+from homeassistant.util import dt as dt_util
+
+
+@lru_cache(maxsize=512)
+def parse_date(value: str | None) -> datetime | None:
+    """Parse an ESPN date string (eg. "2023-05-01T23:05Z") into an aware datetime.
+
+    ESPN repeats the same handful of start times on every poll, so results are
+    memoized rather than re-parsed.
+    """
+    if not value:
+        return None
+    parsed = dt_util.parse_datetime(value)
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.UTC)
+    return parsed
+
+
+def seconds_until(value: str | None, now: datetime | None = None) -> float | None:
+    """Return the number of seconds from now until the given ESPN date."""
+    start = parse_date(value)
+    if start is None:
+        return None
+    if now is None:
+        now = dt_util.utcnow()
+    return (start - now).total_seconds()
+
+
+def _humanize_delta(seconds: int) -> str:
+    """Describe an absolute number of seconds in words."""
+    if seconds < 10:
+        return ""
+    if seconds < 45:
+        return f"{seconds} seconds"
+    if seconds < 90:
+        return "a minute"
+    if seconds < 2700:
+        return f"{max(seconds // 60, 2)} minutes"
+    if seconds < 5400:
+        return "an hour"
+    if seconds < 79200:
+        return f"{max(seconds // 3600, 2)} hours"
+    if seconds < 129600:
+        return "a day"
+    if seconds < 554400:
+        return f"{max(seconds // 86400, 2)} days"
+    if seconds < 907200:
+        return "a week"
+    if seconds < 2419200:
+        return f"{max(seconds // 604800, 2)} weeks"
+    if seconds < 3888000:
+        return "a month"
+    if seconds < 29808000:
+        return f"{max(seconds // 2592000, 2)} months"
+    if seconds < 47260800:
+        return "a year"
+    return f"{max(seconds // 31536000, 2)} years"
+
+
+def humanize(value: str | None, now: datetime | None = None) -> str | None:
+    """Return a relative description of an ESPN date (eg. "in 2 hours")."""
+    delta = seconds_until(value, now)
+    if delta is None:
+        return None
+    words = _humanize_delta(int(abs(delta)))
+    if not words:
+        return "just now"
+    return f"in {words}" if delta > 0 else f"{words} ago"
+
+
+def countdown(value: str | None, state: str | None, now: datetime | None = None) -> dict:
+    """Return the clock-derived fields for a game starting at the given ESPN date.
+
+    These only depend on the cached start time, so they can be refreshed
+    locally without fetching new data.
+    """
+    if now is None:
+        now = dt_util.utcnow()
+    game_clock = None
+    if state == "STATUS_IN_PROGRESS":
+        elapsed = seconds_until(value, now)
+        if elapsed is not None:
+            minutes = max(int(-elapsed), 0) // 60
+            game_clock = f"{minutes // 60}:{minutes % 60:02d}"
+    return {
+        "first_pitch_in": humanize(value, now),
+        "game_clock": game_clock,
+    }
+
+
+def now_w3c() -> str:
+    """Return the current local time formatted like "2023-05-01 19:05:00-04:00"."""
+    return dt_util.now().isoformat(sep=" ", timespec="seconds")
+
+
+def datetime_from_utc_to_local(utc_datetime: datetime) -> datetime:
+    """Convert a UTC datetime to the configured local time zone."""
+    return dt_util.as_local(utc_datetime)
@@ -0,0 +1,100 @@
+"""HTTP view serving the games MLB entries already have, with ETags."""
+from __future__ import annotations
+
+import hashlib
+import logging
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.helpers.json import json_dumps_sorted
+
+from .const import CONF_TEAM_ID, COORDINATOR, DOMAIN, GAMES_URL_PATH, LEAGUE_TEAM_ID
+from .websocket_api import games_of
+
+_LOGGER = logging.getLogger(__name__)
+
+# Changes every poll, so serving it would change the ETag every poll too
+VOLATILE_FIELDS = {"last_update"}
+
+
+def parse_etags(header: str | None) -> set[str]:
+    """Return the entity tags listed in an If-None-Match header."""
+    if not header:
+        return set()
+    return {tag.strip() for tag in header.split(",") if tag.strip()}
+
+
+def is_tracked(team_id: str, coordinators) -> bool:
+    """Return True if an entry follows the team, or a league entry has it on the slate."""
+    for coordinator in coordinators:
+        if coordinator.config[CONF_TEAM_ID] == team_id:
+            return True
+        if coordinator.config[CONF_TEAM_ID] == LEAGUE_TEAM_ID and coordinator.data and any(
+            team_id in (game.get("home_team_abbr"), game.get("away_team_abbr"))
+            for game in coordinator.data["games"].values()
+        ):
+            return True
+    return False
+
+
+class MLBGamesView(HomeAssistantView):
+    """Serve every loaded entry's parsed games as JSON, or one team's.
+
+    ``/api/mlb/games`` returns every game any entry follows and
+    ``/api/mlb/games/<team>`` only the games of one team. Requests need a
+    Home Assistant access token, like the rest of the REST API. Each body
+    is serialized once per coordinator update and carries a strong ETag, so
+    a client that sends it back in If-None-Match gets a 304 until a game
+    changes. Nothing is fetched from ESPN to answer.
+    """
+
+    url = GAMES_URL_PATH
+    extra_urls = [GAMES_URL_PATH + "/{team_id}"]
+    name = "api:mlb:games"
+
+    def __init__(self) -> None:
+        """Initialize."""
+        # Team (or "" for everything) to (coordinator data it was built from, body, ETag).
+        # Only tracked teams get an entry, so there are at most one per MLB team.
+        self._bodies = {}
+
+    async def get(self, request: web.Request, team_id: str | None = None) -> web.Response:
+        """Return the games, or 304 if the client's copy is current."""
+        hass = request.app[KEY_HASS]
+        coordinators = [
+            entry_data[COORDINATOR]
+            for entry_data in hass.data.get(DOMAIN, {}).values()
+            if isinstance(entry_data, dict) and COORDINATOR in entry_data
+        ]
+        key = (team_id or "").upper()
+        if key and not is_tracked(key, coordinators):
+            return self.json_message(f"{key} is not tracked by the {DOMAIN} integration", 404)
+
+        body, etag = self._body(key, coordinators)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in parse_etags(request.headers.get("If-None-Match")):
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    def _body(self, key: str, coordinators) -> tuple[bytes, str]:
+        """Return the serialized games and their ETag, reusing them until a coordinator updates."""
+        # Coordinators replace their data on every update rather than changing it
+        sources = [c.data for c in coordinators]
+        cached = self._bodies.get(key)
+        if cached is not None and len(cached[0]) == len(sources) and all(
+            old is new for old, new in zip(cached[0], sources)
+        ):
+            return cached[1], cached[2]
+        games = {}
+        for coordinator in coordinators:
+            for event_id, game in games_of(coordinator.data).items():
+                if key and key not in (game.get("home_team_abbr"), game.get("away_team_abbr")):
+                    continue
+                games[event_id] = {
+                    field: value for field, value in game.items() if field not in VOLATILE_FIELDS
+                }
+        # Sorted, since a game's fields aren't always built in the same order
+        body = json_dumps_sorted({"games": games}).encode()
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self._bodies[key] = (sources, body, etag)
+        return body, etag
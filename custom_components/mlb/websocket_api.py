@@ -0,0 +1,171 @@
+"""Websocket subscription to MLB games, sending only the fields that change."""
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+
+from .const import COORDINATOR, DELTAS, DOMAIN, WS_SUBSCRIBE
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def games_of(data) -> dict[str, dict]:
+    """Return a coordinator's data as games keyed by event id, without private fields."""
+    if not data:
+        return {}
+    if "games" in data:
+        games = data["games"]
+    elif data.get("event_id") is None:
+        return {}
+    else:
+        games = {str(data["event_id"]): data}
+    return {
+        event_id: {key: value for key, value in game.items() if not key.startswith("private_")}
+        for event_id, game in games.items()
+    }
+
+
+def game_changes(old: dict, new: dict) -> dict:
+    """Return the fields of a game that changed, with None for fields that are gone."""
+    changes = {key: value for key, value in new.items() if old.get(key, _MISSING) != value}
+    changes.update((key, None) for key in old if key not in new)
+    return changes
+
+
+def _event_message(msg_id: int, payload: bytes) -> bytes:
+    """Wrap an event payload that is already serialized in a message for one subscription."""
+    return b"".join((b'{"id":', str(msg_id).encode(), b',"type":"event","event":', payload, b"}"))
+
+
+class GameDeltas:
+    """Fan one entry's updates out to websocket subscribers as per-game changes.
+
+    Each update is diffed once against the games subscribers were last sent
+    and serialized once for all of them. The coordinator is only listened to
+    while someone is subscribed.
+    """
+
+    def __init__(self, coordinator, entry_id: str) -> None:
+        """Initialize."""
+        self.coordinator = coordinator
+        self.entry_id = entry_id
+        self._games = {}
+        self._subscribers = {}
+        self._unsub = None
+
+    @callback
+    def async_subscribe(self, connection, msg_id: int) -> CALLBACK_TYPE:
+        """Add a subscriber and return a callback that removes it."""
+        if self._unsub is None:
+            self._games = games_of(self.coordinator.data)
+            self._unsub = self.coordinator.async_add_listener(self._async_update)
+        key = (id(connection), msg_id)
+        self._subscribers[key] = (connection, msg_id)
+
+        @callback
+        def _async_unsubscribe() -> None:
+            self._subscribers.pop(key, None)
+            if not self._subscribers and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+                self._games = {}
+
+        return _async_unsubscribe
+
+    @callback
+    def async_send_snapshot(self, connection, msg_id: int) -> None:
+        """Send a subscriber every game, which later changes are relative to."""
+        connection.send_message(_event_message(msg_id, json_bytes({
+            "type": "snapshot",
+            "entry_id": self.entry_id,
+            "games": self._games,
+        })))
+
+    @callback
+    def _async_update(self) -> None:
+        """Send the fields that changed in this update, if any."""
+        games = games_of(self.coordinator.data)
+        changed = {
+            event_id: changes
+            for event_id, game in games.items()
+            if (changes := game_changes(self._games.get(event_id, {}), game))
+        }
+        removed = [event_id for event_id in self._games if event_id not in games]
+        self._games = games
+        if not changed and not removed:
+            return
+        self._async_send({
+            "type": "diff",
+            "entry_id": self.entry_id,
+            "games": changed,
+            "removed": removed,
+        })
+
+    @callback
+    def async_close(self) -> None:
+        """Tell subscribers the entry was unloaded and stop listening."""
+        self._async_send({"type": "unloaded", "entry_id": self.entry_id})
+        self._subscribers.clear()
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_send(self, payload: dict) -> None:
+        if not self._subscribers:
+            return
+        serialized = json_bytes(payload)
+        for connection, msg_id in self._subscribers.values():
+            connection.send_message(_event_message(msg_id, serialized))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_SUBSCRIBE,
+        vol.Optional("entry_id"): str,
+    }
+)
+@callback
+def websocket_subscribe(hass: HomeAssistant, connection, msg: dict) -> None:
+    """Send a snapshot of every game, then only the fields that change."""
+    entries = {
+        entry_id: entry_data
+        for entry_id, entry_data in hass.data.get(DOMAIN, {}).items()
+        if isinstance(entry_data, dict) and COORDINATOR in entry_data
+    }
+    if "entry_id" in msg:
+        if msg["entry_id"] not in entries:
+            connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "MLB entry not found")
+            return
+        entries = {msg["entry_id"]: entries[msg["entry_id"]]}
+
+    publishers = []
+    unsubs = []
+    for entry_id, entry_data in entries.items():
+        if DELTAS not in entry_data:
+            entry_data[DELTAS] = GameDeltas(entry_data[COORDINATOR], entry_id)
+        publishers.append(entry_data[DELTAS])
+        unsubs.append(entry_data[DELTAS].async_subscribe(connection, msg["id"]))
+
+    @callback
+    def _async_unsubscribe() -> None:
+        for unsub in unsubs:
+            unsub()
+
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
+    connection.send_result(msg["id"])
+    for publisher in publishers:
+        publisher.async_send_snapshot(connection, msg["id"])
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
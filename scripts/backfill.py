@@ -0,0 +1,80 @@
+"""Backfill the MLB results archive for a date range.
+
+Fetches ESPN's dated scoreboard pages with the integration's own extraction
+code and appends every final game to the SQLite archive. Run it from the
+repository root with Home Assistant installed in the active environment:
+
+    python scripts/backfill.py 2024-03-28 2024-09-29 --db config/mlb_archive.db
+    python scripts/backfill.py 2024-04-01 2024-04-07 --fixtures tests/fixtures
+
+Finished dates are recorded in the checkpoint file, so re-running the same
+command after an interruption resumes where it stopped. With ``--fixtures``
+the pages are read from recorded YYYYMMDD.json(.gz) files instead.
+"""
+import argparse
+import asyncio
+from datetime import date
+import json
+import logging
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.mlb.archive import GameArchive  # noqa: E402
+from custom_components.mlb.backfill import async_backfill  # noqa: E402
+from custom_components.mlb.const import (  # noqa: E402
+    ARCHIVE_FILENAME,
+    BACKFILL_CHECKPOINT_FILENAME,
+    BACKFILL_CONCURRENCY,
+    BACKFILL_RETRIES,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("start_date", type=date.fromisoformat)
+    parser.add_argument("end_date", type=date.fromisoformat)
+    parser.add_argument("--db", default=ARCHIVE_FILENAME)
+    parser.add_argument("--checkpoint", default=BACKFILL_CHECKPOINT_FILENAME)
+    parser.add_argument("--concurrency", type=int, default=BACKFILL_CONCURRENCY)
+    parser.add_argument("--retries", type=int, default=BACKFILL_RETRIES)
+    parser.add_argument("--fixtures")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint")
+    parser.add_argument("--time-zone", default="UTC", help="time zone of the archived game dates, eg. America/Los_Angeles")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    time_zone = dt_util.get_time_zone(args.time_zone)
+    if time_zone is None:
+        parser.error(f"unknown time zone {args.time_zone}")
+    # Game dates are archived in the local time zone, as they are in Home Assistant
+    dt_util.set_default_time_zone(time_zone)
+    if args.restart and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+    archive = GameArchive(args.db)
+    try:
+        result = asyncio.run(
+            async_backfill(
+                archive,
+                args.start_date,
+                args.end_date,
+                concurrency=args.concurrency,
+                retries=args.retries,
+                checkpoint=args.checkpoint,
+                fixtures=args.fixtures,
+            )
+        )
+    finally:
+        archive.close()
+    print(json.dumps(result, indent=2))
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Measure how long it takes to import the MLB integration.
+
+Runs ``python -X importtime -c "import custom_components.mlb"`` in a fresh
+interpreter and reports the cumulative import time of the integration's own
+modules along with the slowest dependencies they pull in.
+
+    python scripts/importtime.py                      # print a report
+    python scripts/importtime.py --save baseline.json # record a baseline
+    python scripts/importtime.py --compare baseline.json --tolerance 20
+
+With ``--compare`` the script exits non-zero when the integration's own
+import time has grown by more than ``--tolerance`` percent.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PACKAGE = "custom_components.mlb"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _measure(runs):
+    """Return the best-of-N timings as {module: (self_us, cumulative_us)}."""
+    best = {}
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {PACKAGE}"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            sys.exit(proc.stderr)
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            self_us, cumulative_us, module = line[len("import time:"):].split("|")
+            module = module.strip()
+            timing = (int(self_us), int(cumulative_us))
+            if module not in best or timing[1] < best[module][1]:
+                best[module] = timing
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--save")
+    parser.add_argument("--compare")
+    parser.add_argument("--tolerance", type=float, default=20.0)
+    args = parser.parse_args()
+
+    timings = _measure(args.runs)
+    own = {m: t for m, t in timings.items() if m == PACKAGE or m.startswith(PACKAGE + ".")}
+    total = timings.get(PACKAGE, (0, 0))[1]
+    own_self = sum(t[0] for t in own.values())
+
+    print(f"{PACKAGE}: {total / 1000:.1f} ms cumulative, {own_self / 1000:.1f} ms in own modules")
+    for module, (self_us, cumulative_us) in sorted(own.items(), key=lambda i: -i[1][0]):
+        print(f"  {module:<40} self {self_us / 1000:7.1f} ms")
+    print(f"Slowest imports overall (top {args.top}):")
+    for module, (self_us, cumulative_us) in sorted(timings.items(), key=lambda i: -i[1][0])[: args.top]:
+        print(f"  {module:<40} self {self_us / 1000:7.1f} ms")
+
+    result = {"cumulative_us": total, "own_self_us": own_self}
+    if args.save:
+        with open(args.save, "w") as fp:
+            json.dump(result, fp, indent=2)
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)
+        limit = baseline["own_self_us"] * (1 + args.tolerance / 100)
+        if own_self > limit:
+            print(f"Regression: {own_self} us > {limit:.0f} us allowed")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
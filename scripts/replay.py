@@ -0,0 +1,71 @@
+"""Replay recorded ESPN responses through the MLB parser.
+
+Reads the history written by the integration's "Record raw ESPN responses"
+option and runs every recorded scoreboard through the same extraction code
+as the sensors, to benchmark parsing and catch payloads it can't handle.
+Run it from the repository root with Home Assistant installed in the active
+environment:
+
+    python scripts/replay.py config/mlb_payloads
+    python scripts/replay.py config/mlb_payloads --repeat 20
+
+Exits non-zero if any event failed to parse.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from custom_components.mlb import MLB  # noqa: E402
+from custom_components.mlb.recorder import SCOREBOARD, iter_history, payload_kind  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory")
+    parser.add_argument("--repeat", type=int, default=1, help="parse each payload this many times")
+    args = parser.parse_args()
+
+    pages = []
+    for entry, body in iter_history(args.directory):
+        if payload_kind(entry["url"][len(MLB.base_url):]) == SCOREBOARD:
+            pages.append((entry, body))
+
+    events = 0
+    failures = []
+    decode_seconds = extract_seconds = 0.0
+    for entry, body in pages:
+        for repeat in range(args.repeat):
+            started = time.perf_counter()
+            data = json.loads(body)
+            decoded = time.perf_counter()
+            for event in data.get("events") or []:
+                try:
+                    home_team_id = event["competitions"][0]["competitors"][0]["team"]["abbreviation"]
+                    MLB.extract_event(event, home_team_id)
+                except Exception as error:  # noqa: BLE001
+                    if not repeat:
+                        failures.append({"file": entry["file"], "event": event.get("id"), "error": repr(error)})
+            extract_seconds += time.perf_counter() - decoded
+            decode_seconds += decoded - started
+        events += len(data.get("events") or [])
+
+    parses = len(pages) * args.repeat
+    result = {
+        "pages": len(pages),
+        "events": events,
+        "bytes": sum(len(body) for _, body in pages),
+        "decode_ms_per_page": round(decode_seconds * 1000 / parses, 3) if parses else None,
+        "extract_ms_per_event": round(extract_seconds * 1000 / (events * args.repeat), 3) if events else None,
+        "failures": failures,
+    }
+    print(json.dumps(result, indent=2))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""ESPN payloads and setup helpers shared by the MLB tests."""
+import re
+from datetime import timedelta
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.mlb.const import DOMAIN
+
+
+def competitor(abbreviation: str, home_away: str, runs: int) -> dict:
+    """Return one team of a scoreboard event."""
+    return {
+        "homeAway": home_away,
+        "score": str(runs),
+        "hits": 5,
+        "errors": 0,
+        "team": {
+            "abbreviation": abbreviation,
+            "id": abbreviation,
+            "location": abbreviation,
+            "name": abbreviation,
+            "displayName": abbreviation,
+            "shortDisplayName": abbreviation,
+            "color": "005c5c",
+            "alternateColor": "0c2c56",
+            "logo": "",
+        },
+        "records": [{"summary": "10-5"}],
+        "linescores": [{"value": runs}],
+    }
+
+
+def live_game(home_runs: int = 3, away_runs: int = 2) -> dict:
+    """Return an in-progress Mariners game that started an hour ago."""
+    start = dt_util.utcnow().replace(microsecond=0) - timedelta(hours=1)
+    status = {"type": {"name": "STATUS_IN_PROGRESS", "state": "in"}}
+    return {
+        "id": "401",
+        "date": start.strftime("%Y-%m-%dT%H:%MZ"),
+        "name": "Houston Astros at Seattle Mariners",
+        "shortName": "HOU @ SEA",
+        "season": {"year": start.year},
+        "status": status,
+        "competitions": [{
+            "type": {"abbreviation": "STD"},
+            "status": status,
+            "competitors": [competitor("SEA", "home", home_runs), competitor("HOU", "away", away_runs)],
+        }],
+    }
+
+
+def mock_espn(aioclient_mock, events=None) -> None:
+    """Answer every ESPN endpoint the integration polls with ``events``, by default one live game."""
+    events = [live_game()] if events is None else events
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(re.compile(r"/scoreboard\?dates=\d{8}$"), json={"events": events})
+    aioclient_mock.get(re.compile(r"/teams/\w+/schedule$"), json={"events": events})
+    aioclient_mock.get(re.compile(r"/teams/\w+$"), json={"team": {"nextEvent": events}})
+    aioclient_mock.get(re.compile(r"/summary\?event="), json={})
+
+
+async def async_setup_team(hass, aioclient_mock, **options) -> MockConfigEntry:
+    """Set up a Mariners entry against the mocked ESPN endpoints."""
+    mock_espn(aioclient_mock)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        title="Mariners",
+        data={"name": "Mariners", "team_id": "SEA", "timeout": 30, **options},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+    return entry
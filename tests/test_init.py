@@ -0,0 +1,92 @@
+"""Tests for setting up, reloading and unloading MLB entries."""
+from datetime import timedelta
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_capture_events, async_fire_time_changed
+
+from custom_components.mlb import attribute_groups
+from custom_components.mlb.const import (
+    ATTR_GROUP_ODDS,
+    ATTR_GROUP_TEAMS,
+    CONF_ATTRIBUTE_GROUPS,
+    CONF_FAST_REFRESH_INTERVAL,
+    COORDINATOR,
+    DOMAIN,
+)
+
+from .common import async_setup_team
+
+
+async def test_options_apply_in_place(hass, aioclient_mock) -> None:
+    """Options that don't change the entities update the running coordinator."""
+    entry = await async_setup_team(hass, aioclient_mock)
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    listeners = len(list(coordinator.async_contexts()))
+    assert "odds" in hass.states.get("sensor.mariners").attributes
+
+    hass.config_entries.async_update_entry(
+        entry,
+        options={
+            **entry.data,
+            CONF_FAST_REFRESH_INTERVAL: 7,
+            CONF_ATTRIBUTE_GROUPS: [ATTR_GROUP_TEAMS],
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert hass.data[DOMAIN][entry.entry_id][COORDINATOR] is coordinator
+    # The game is live, so the refresh the options triggered switched to the new fast interval
+    assert coordinator.update_interval == timedelta(seconds=7)
+    groups = attribute_groups(coordinator.config)
+    assert ATTR_GROUP_TEAMS in groups
+    assert ATTR_GROUP_ODDS not in groups
+    assert len(list(coordinator.async_contexts())) == listeners
+    attributes = hass.states.get("sensor.mariners").attributes
+    assert "home_team_color" in attributes
+    assert "odds" not in attributes
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_reloads_leave_one_poller(hass, aioclient_mock) -> None:
+    """Reloading replaces the coordinator, and unloading leaves nothing running.
+
+    Lingering timers, such as the countdown ticker, also fail the test through
+    the plugin's cleanup check.
+    """
+    entry = await async_setup_team(hass, aioclient_mock)
+    coordinators = [hass.data[DOMAIN][entry.entry_id][COORDINATOR]]
+    for _ in range(5):
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinators.append(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+    current = coordinators[-1]
+    old = coordinators[:-1]
+    assert len({id(coordinator) for coordinator in coordinators}) == 6
+    for coordinator in old:
+        assert list(coordinator.async_contexts()) == []
+
+    # Only the current coordinator polls
+    updates = [coordinator.metrics.updates for coordinator in coordinators]
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
+    await hass.async_block_till_done()
+    assert [coordinator.metrics.updates for coordinator in old] == updates[:-1]
+    assert current.metrics.updates > updates[-1]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.NOT_LOADED
+    assert list(current.async_contexts()) == []
+
+    # Nothing left polling or ticking the countdown
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+    updates = current.metrics.updates
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(hours=2))
+    await hass.async_block_till_done()
+    assert current.metrics.updates == updates
+    assert [
+        event for event in state_changes if event.data["entity_id"].split(".")[1].startswith("mariners")
+    ] == []
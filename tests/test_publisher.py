@@ -0,0 +1,60 @@
+"""Tests for publishing games to MQTT."""
+from datetime import timedelta
+import json
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from .common import async_setup_team, live_game, mock_espn
+
+PREFIX = "mlb/mariners"
+
+
+def _published(mqtt_mock) -> list[tuple]:
+    """Return what was published under the entry's prefix as (topic, payload, retain), then forget it."""
+    messages = [
+        (call.args[0], call.args[1], call.args[3])
+        for call in mqtt_mock.async_publish.call_args_list
+        if call.args[0].startswith(PREFIX)
+    ]
+    mqtt_mock.async_publish.reset_mock()
+    return messages
+
+
+async def _async_poll(hass, freezer) -> None:
+    """Run the next poll, past the engine's response cache."""
+    freezer.tick(timedelta(minutes=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_publishes_snapshots_diffs_and_status(hass, aioclient_mock, mqtt_mock, freezer) -> None:
+    """A game is published as a retained snapshot, then as diffs, and cleared when it leaves."""
+    entry = await async_setup_team(hass, aioclient_mock, mqtt_topic=PREFIX)
+    messages = _published(mqtt_mock)
+    assert messages[0] == (f"{PREFIX}/status", b"online", True)
+    [(topic, payload, retain)] = messages[1:]
+    assert (topic, retain) == (f"{PREFIX}/games/401", True)
+    snapshot = json.loads(payload)
+    assert snapshot["home_team_runs"] == "3"
+    assert None not in snapshot.values()
+
+    # Nothing but last_update changed
+    await _async_poll(hass, freezer)
+    assert _published(mqtt_mock) == []
+
+    mock_espn(aioclient_mock, [live_game(home_runs=4)])
+    await _async_poll(hass, freezer)
+    messages = dict(((topic, retain), payload) for topic, payload, retain in _published(mqtt_mock))
+    assert json.loads(messages[(f"{PREFIX}/games/401", True)])["home_team_runs"] == "4"
+    diff = json.loads(messages[(f"{PREFIX}/games/401/diff", False)])
+    assert diff["home_team_runs"] == "4"
+    assert "away_team_runs" not in diff
+
+    # The game leaving clears its retained snapshot
+    mock_espn(aioclient_mock, [])
+    await _async_poll(hass, freezer)
+    assert (f"{PREFIX}/games/401", b"", True) in _published(mqtt_mock)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert _published(mqtt_mock) == [(f"{PREFIX}/status", b"offline", True)]
@@ -0,0 +1,115 @@
+"""Tests for recording raw ESPN responses to disk and replaying them."""
+from datetime import datetime, timedelta, timezone
+import json
+import os
+import random
+import subprocess
+import sys
+
+from custom_components.mlb import MLB
+from custom_components.mlb.recorder import HISTORY, INDEX_FILENAME, PayloadRecorder, iter_history
+
+from .common import live_game
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAY_1 = datetime(2024, 5, 1, 19, 5, tzinfo=timezone.utc)
+DAY_2 = DAY_1 + timedelta(days=1)
+SCHEDULE_URL = MLB.schedule_url("SEA")
+
+
+def _body(seed: int, size: int = 200) -> bytes:
+    """Return a response body that doesn't compress, so sizes are predictable."""
+    return random.Random(seed).randbytes(size)
+
+
+def _files(directory, day: datetime) -> list[str]:
+    """Return the stored responses of one day of history."""
+    path = os.path.join(directory, HISTORY, f"{day:%Y%m%d}")
+    if not os.path.isdir(path):
+        return []
+    return sorted(name for name in os.listdir(path) if name != INDEX_FILENAME)
+
+
+def _history_bytes(directory, day: datetime) -> int:
+    """Return the bytes one day of history uses on disk, index included."""
+    path = os.path.join(directory, HISTORY, f"{day:%Y%m%d}")
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def test_duplicate_points_at_earlier_day(tmp_path) -> None:
+    """A response seen on an earlier day is indexed against that day's file."""
+    recorder = PayloadRecorder(None, str(tmp_path), MLB.base_url)
+    recorder._write([(DAY_1, SCHEDULE_URL, _body(1)), (DAY_2, SCHEDULE_URL, _body(1))])
+
+    assert len(_files(tmp_path, DAY_1)) == 1
+    assert _files(tmp_path, DAY_2) == []
+    entries = list(iter_history(str(tmp_path)))
+    assert [entry.get("day") for entry, _ in entries] == [None, f"{DAY_1:%Y%m%d}"]
+    assert [body for _, body in entries] == [_body(1), _body(1)]
+    assert (recorder.recorded, recorder.duplicates) == (1, 1)
+
+
+def test_duplicate_stored_again_after_rotation(tmp_path) -> None:
+    """A response whose file was rotated out with its day is stored again."""
+    PayloadRecorder(None, str(tmp_path), MLB.base_url)._write([(DAY_1, SCHEDULE_URL, _body(1))])
+
+    # Room for one day's history, so indexing the duplicate rotates out the day holding its file
+    max_bytes = _history_bytes(tmp_path, DAY_1) + 10
+    recorder = PayloadRecorder(None, str(tmp_path), MLB.base_url, max_bytes=max_bytes)
+    recorder._write([(DAY_2, SCHEDULE_URL, _body(1))])
+
+    assert not os.path.exists(os.path.join(tmp_path, HISTORY, f"{DAY_1:%Y%m%d}"))
+    assert len(_files(tmp_path, DAY_2)) == 1
+    [(entry, body)] = iter_history(str(tmp_path))
+    assert "day" not in entry
+    assert body == _body(1)
+    assert (recorder.recorded, recorder.duplicates, recorder.dropped) == (1, 0, 0)
+
+
+def test_pauses_when_today_is_full(tmp_path) -> None:
+    """Once today's responses fill the history, the rest of the day is dropped."""
+    recorder = PayloadRecorder(None, str(tmp_path), MLB.base_url, max_bytes=1000)
+    recorder._write([(DAY_1 + timedelta(seconds=seed), SCHEDULE_URL, _body(seed)) for seed in range(4)])
+
+    assert len(_files(tmp_path, DAY_1)) == 2
+    assert recorder.dropped == 2
+    assert _history_bytes(tmp_path, DAY_1) <= 1000
+
+    # The next day rotates the full day out to make room
+    recorder._write([(DAY_2, SCHEDULE_URL, _body(5))])
+    assert _files(tmp_path, DAY_1) == []
+    assert len(_files(tmp_path, DAY_2)) == 1
+
+
+async def test_drops_when_queue_is_full(hass, tmp_path) -> None:
+    """Responses past the queue size are dropped rather than held in memory."""
+    recorder = PayloadRecorder(hass, str(tmp_path), MLB.base_url, queue_size=2)
+    for seed in range(3):
+        recorder.record(SCHEDULE_URL, _body(seed))
+    # Not ours to record
+    recorder.record("https://example.com/other", _body(9))
+    assert recorder.dropped == 1
+
+    await hass.async_block_till_done()
+    assert recorder.recorded == 2
+    assert [body for _, body in iter_history(str(tmp_path))] == [_body(0), _body(1)]
+
+
+def test_replay_reads_history(tmp_path) -> None:
+    """scripts/replay.py parses every recorded scoreboard page."""
+    page = json.dumps({"events": [live_game()]}).encode()
+    recorder = PayloadRecorder(None, str(tmp_path), MLB.base_url)
+    recorder._write([
+        (DAY_1, MLB.scoreboard_date_url(f"{DAY_1:%Y%m%d}"), page),
+        (DAY_1 + timedelta(seconds=30), SCHEDULE_URL, _body(1)),
+        (DAY_2, MLB.scoreboard_date_url(f"{DAY_1:%Y%m%d}"), page),
+    ])
+
+    result = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "scripts", "replay.py"), str(tmp_path)],
+        capture_output=True,
+        check=True,
+        cwd=ROOT,
+    )
+    report = json.loads(result.stdout)
+    assert (report["pages"], report["events"], report["failures"]) == (2, 2, [])
@@ -0,0 +1,62 @@
+"""Tests for the HTTP API serving games."""
+from datetime import timedelta
+from http import HTTPStatus
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.mlb.const import COORDINATOR, DOMAIN, GAMES_URL_PATH
+
+from .common import async_setup_team, live_game, mock_espn
+
+
+async def _async_poll(hass, freezer) -> None:
+    """Run the next poll, past the engine's response cache."""
+    freezer.tick(timedelta(minutes=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_untracked_team_not_found(hass, aioclient_mock, hass_client) -> None:
+    """A team no entry follows returns 404."""
+    await async_setup_team(hass, aioclient_mock)
+    client = await hass_client()
+
+    response = await client.get(f"{GAMES_URL_PATH}/NYY")
+    assert response.status == HTTPStatus.NOT_FOUND
+
+
+async def test_etag(hass, aioclient_mock, hass_client, freezer) -> None:
+    """The ETag answers 304 until a game changes, ignoring last_update."""
+    entry = await async_setup_team(hass, aioclient_mock)
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    client = await hass_client()
+
+    response = await client.get(f"{GAMES_URL_PATH}/sea")
+    assert response.status == HTTPStatus.OK
+    games = (await response.json())["games"]
+    assert list(games) == ["401"]
+    assert "last_update" not in games["401"]
+    etag = response.headers["ETag"]
+
+    response = await client.get(f"{GAMES_URL_PATH}/SEA", headers={"If-None-Match": etag})
+    assert response.status == HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+
+    # A new update with only a new last_update keeps the ETag
+    data = coordinator.data
+    await _async_poll(hass, freezer)
+    assert coordinator.data is not data
+    assert coordinator.data["last_update"] != data["last_update"]
+    response = await client.get(f"{GAMES_URL_PATH}/SEA", headers={"If-None-Match": etag})
+    assert response.status == HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+
+    mock_espn(aioclient_mock, [live_game(home_runs=4)])
+    await _async_poll(hass, freezer)
+    response = await client.get(f"{GAMES_URL_PATH}/SEA", headers={"If-None-Match": etag})
+    assert response.status == HTTPStatus.OK
+    assert response.headers["ETag"] != etag
+    assert (await response.json())["games"]["401"]["home_team_runs"] == "4"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()